@@ -104,6 +104,10 @@ class Advertisement(data.Data):
 class Device(Entity):
     """Entity describing a discovered peripheral."""
 
+    # Scan deltas (Data.diff) match devices on their address and ignore per-instance bookkeeping
+    __diff_key__ = "address"
+    __diff_exclude__ = ("identifier", "born_time")
+
     name: str = data.Field(default="<unknown>")
     alias: str | None = data.Field(default=None)
     address: str = data.Field(default="")
@@ -125,7 +129,7 @@ class Device(Entity):
         manufacturer = adv.manufacturer_label
         signal = adv.rssi
         type_label = manufacturer or (services[0] if services else "BLE device")
-        instance = cls(
+        instance = cls.trusted(
             name=name,
             alias=alias,
             address=device.address,
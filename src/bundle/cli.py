@@ -52,6 +52,32 @@ async def version():
     log.info(f"Version: {version}")
 
 
+@main.group()
+@tracer.Sync.decorator.call_raise
+async def platform():
+    """The platform facts of this machine"""
+    pass
+
+
+@platform.command()
+@tracer.Sync.decorator.call_raise
+async def show():
+    """Show the platform facts, probing the uncached ones"""
+    from bundle.core import platform_info
+
+    log.info(log.pretty_repr(platform_info))
+
+
+@platform.command()
+@tracer.Sync.decorator.call_raise
+async def refresh():
+    """Probe the cached platform facts again"""
+    from bundle.core import platform_info
+
+    platform_info.refresh()
+    log.info(f"Platform facts cached at {platform_info.cache_path}")
+
+
 def add_cli_submodule(submodule_name: str) -> None:
     """Dynamically imports a subcommand and adds it to the CLI group.
 
@@ -23,11 +23,32 @@ from . import logger
 from . import tracer
 
 from . import utils
+from . import codec
 from . import data
 
 from .data import Data
 from .entity import Entity
 from .platform import Platform, platform_info
-from .process import Process, ProcessStream, ProcessResult, ProcessError
+from .process import (
+    CapturePolicy,
+    Process,
+    ProcessStream,
+    ProcessResult,
+    ProcessError,
+    ProcessTimeoutError,
+    ProcessPool,
+    ProcessPoolResult,
+    ResourceCollector,
+)
 from .downloader import Downloader, DownloaderTQDM
-from .sockets import Socket
+from .sockets import (
+    ProxyStatistics,
+    SendPolicy,
+    Socket,
+    SocketEvent,
+    SocketFullError,
+    SocketProxy,
+    SocketStatistics,
+)
+from .rpc import RpcClient, RpcError, RpcServer, RpcServerMetrics
+from .pipeline import Pipeline, PipelineError
@@ -0,0 +1,203 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Shared-memory arena for passing large payloads between processes of the same host.
+
+The writer copies a payload into a block of its arena and sends only a handle (arena name,
+offset, length) to the reader. Every block starts with a reference count set by the writer;
+the reader decrements it once the payload has been copied out, and the writer reuses the
+block when the count reaches zero. A block has a single reader, so the count is only written
+by one process at a time.
+
+Handle::
+
+    offset (u64) | length (u64) | arena name (utf-8)
+
+Readers only attach to segments named like the arenas of this module, and check that the block
+of a handle lies within its segment: a handle cannot make them read or write other memory.
+"""
+
+from __future__ import annotations
+
+import secrets
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+# Block header holding the reference count, sized to keep payloads cache-line (and SIMD) aligned.
+BLOCK_HEADER = 64
+BLOCK_ALIGN = 64
+
+# Prefix of the arena names, followed by random hex digits; readers reject any other segment.
+ARENA_PREFIX = "bundle_shm_"
+_NAME_DIGITS = 16
+
+_REFCOUNT = struct.Struct("<I")
+_HANDLE = struct.Struct("<QQ")
+
+# Arenas created by this process, by name: readers in the same process use them directly.
+_owned: dict[str, SharedMemory] = {}
+
+
+def _align(size: int) -> int:
+    return (size + BLOCK_ALIGN - 1) // BLOCK_ALIGN * BLOCK_ALIGN
+
+
+class SharedMemoryArena:
+    """
+    Writer side of a shared-memory arena: a first-fit allocator of reference-counted blocks.
+
+    Usage:
+        arena = SharedMemoryArena(64 << 20)
+        handle = arena.put(payload)  # None when the arena is full
+        ...
+        arena.close()
+    """
+
+    def __init__(self, size: int):
+        self._shm = SharedMemory(name=ARENA_PREFIX + secrets.token_hex(_NAME_DIGITS // 2), create=True, size=size)
+        self._blocks: dict[int, int] = {}
+        _owned[self._shm.name] = self._shm
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        return self._shm.size
+
+    @property
+    def in_use(self) -> int:
+        """Bytes held by blocks not yet released by their reader."""
+        self._reclaim()
+        return sum(self._blocks.values())
+
+    def _reclaim(self) -> None:
+        buf = self._shm.buf
+        for offset in [offset for offset in self._blocks if _REFCOUNT.unpack_from(buf, offset)[0] == 0]:
+            del self._blocks[offset]
+
+    def _allocate(self, size: int) -> int | None:
+        self._reclaim()
+        cursor = 0
+        for offset in sorted(self._blocks):
+            if offset - cursor >= size:
+                break
+            cursor = offset + self._blocks[offset]
+        if self._shm.size - cursor < size:
+            return None
+        self._blocks[cursor] = size
+        return cursor
+
+    def put(self, payload: bytes | bytearray | memoryview) -> bytes | None:
+        """
+        Copy a payload into a new block.
+
+        Returns:
+            bytes | None: The handle of the block, None if the arena has no room for the payload.
+        """
+        view = memoryview(payload).cast("B")
+        length = view.nbytes
+        offset = self._allocate(_align(BLOCK_HEADER + length))
+        if offset is None:
+            log.debug("Arena %s full, %d bytes not placed", self.name, length)
+            return None
+        buf = self._shm.buf
+        start = offset + BLOCK_HEADER
+        buf[start : start + length] = view
+        _REFCOUNT.pack_into(buf, offset, 1)
+        return _HANDLE.pack(offset, length) + self.name.encode()
+
+    def release(self, handle: bytes) -> None:
+        """Release the block of a handle that will not be read, e.g. a message dropped before sending."""
+        offset, _ = _HANDLE.unpack_from(handle)
+        _REFCOUNT.pack_into(self._shm.buf, offset, 0)
+
+    def close(self) -> None:
+        """Release and unlink the arena. Blocks not yet read are lost."""
+        if _owned.pop(self._shm.name, None) is None:
+            return
+        self._blocks.clear()
+        self._shm.close()
+        self._shm.unlink()
+
+
+class ArenaReader:
+    """Reader side: attaches to the arenas named in the handles it receives."""
+
+    def __init__(self) -> None:
+        self._attached: dict[str, SharedMemory] = {}
+
+    def _segment(self, name: str) -> SharedMemory:
+        shm = _owned.get(name) or self._attached.get(name)
+        if shm is None:
+            digits = name[len(ARENA_PREFIX) :]
+            if not name.startswith(ARENA_PREFIX) or len(digits) != _NAME_DIGITS or digits.strip("0123456789abcdef"):
+                raise ValueError(f"Invalid arena name {name!r}")
+            try:
+                shm = SharedMemory(name=name)
+            except OSError as e:
+                raise ValueError(f"Arena {name!r} not found: {e}") from e
+            self._attached[name] = shm
+            if sys.platform != "win32":
+                # The writer owns the segment: do not let this process' tracker unlink it at exit
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return shm
+
+    def take(self, handle: bytes, into: memoryview | None = None) -> bytes | None:
+        """
+        Copy a payload out of its block and release the block.
+
+        Args:
+            handle (bytes): A handle produced by `SharedMemoryArena.put`.
+            into (memoryview | None): Byte buffer receiving the payload instead of a new bytes object.
+
+        Returns:
+            bytes | None: The payload, or None when copied `into` a buffer.
+
+        Raises:
+            ValueError: If the handle is malformed, names an unknown arena or a block outside of it.
+        """
+        if len(handle) <= _HANDLE.size:
+            raise ValueError("Invalid arena handle")
+        offset, length = _HANDLE.unpack_from(handle)
+        buf = self._segment(bytes(handle[_HANDLE.size :]).decode(errors="replace")).buf
+        start = offset + BLOCK_HEADER
+        if offset % BLOCK_ALIGN or start + length > buf.nbytes:
+            raise ValueError(f"Arena block {offset}+{length} out of bounds")
+        if into is None:
+            payload: bytes | None = bytes(buf[start : start + length])
+        else:
+            into[:] = buf[start : start + length]
+            payload = None
+        count = _REFCOUNT.unpack_from(buf, offset)[0]
+        _REFCOUNT.pack_into(buf, offset, max(count - 1, 0))
+        return payload
+
+    def close(self) -> None:
+        for shm in self._attached.values():
+            shm.close()
+        self._attached.clear()
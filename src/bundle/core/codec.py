@@ -0,0 +1,401 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Compact, schema-driven binary codec for pydantic models, without extra dependencies.
+
+Wire format::
+
+    0xBD | version (varint) | model
+
+A model is its field count followed by its field values, in declaration order and without
+field names: the field table of each class is computed once. Values are tagged
+(msgpack-like) so that unknown trailing fields can be skipped:
+
+- None, booleans: one byte.
+- ints: zigzag varint (any size); floats: 8-byte IEEE 754.
+- str and bytes: varint length + payload.
+- list, tuple, set, frozenset: varint count + values; dict: varint count + key/value pairs.
+- nested models: positional when the field annotation names a single model class,
+  otherwise with field names. Like pydantic serialization, an instance of a subclass of the
+  annotated class is written with the fields of the annotated class.
+- anything else (datetime, Path, Enum, UUID, ...) in its pydantic JSON form.
+
+Decoding validates the values with the model class, so every representation pydantic
+accepts round-trips.
+
+Schema evolution: only append new fields (with defaults) and bump `__codec_version__`
+on the class. Readers decode payloads of their version or older, missing trailing fields
+get the defaults; payloads of a newer version are rejected.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+import typing
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+M = TypeVar("M", bound=BaseModel)
+
+MAGIC = 0xBD
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_BYTES = 0x06
+_LIST = 0x07
+_DICT = 0x08
+_MODEL = 0x09
+_NAMED_MODEL = 0x0A
+
+_DOUBLE = struct.Struct("<d")
+
+
+class CodecError(ValueError):
+    """Raised when a value cannot be encoded or a payload cannot be decoded."""
+
+
+def _model_classes(annotation: Any) -> set[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {annotation}
+    classes: set[type[BaseModel]] = set()
+    for argument in typing.get_args(annotation):
+        classes |= _model_classes(argument)
+    return classes
+
+
+@lru_cache(maxsize=1024)
+def field_table(cls: type[BaseModel]) -> tuple[tuple[str, type[BaseModel] | None], ...]:
+    """
+    Return the field table of a model class: (name, nested model class) per field, in wire order.
+    The nested class is set when the annotation refers to exactly one model class.
+    """
+    table = []
+    for name, field in cls.model_fields.items():
+        classes = _model_classes(field.annotation)
+        table.append((name, classes.pop() if len(classes) == 1 else None))
+    return tuple(table)
+
+
+@lru_cache(maxsize=1024)
+def _encode_table(cls: type[BaseModel]) -> tuple[tuple[str, type[BaseModel] | None, tuple[type[BaseModel], ...]], ...]:
+    """The field table of a class, with the model classes named by each annotation, most derived first."""
+    return tuple(
+        (name, nested, tuple(sorted(_model_classes(field.annotation), key=lambda model: -len(model.__mro__))))
+        for (name, nested), field in zip(field_table(cls), cls.model_fields.values(), strict=True)
+    )
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_model(out: bytearray, model: BaseModel, cls: type[BaseModel]) -> None:
+    table = _encode_table(cls)
+    values = model.__dict__
+    _write_uvarint(out, len(table))
+    for name, nested, classes in table:
+        _encode(out, values[name], nested, classes)
+
+
+def _encode_named_model(out: bytearray, model: BaseModel, cls: type[BaseModel]) -> None:
+    table = _encode_table(cls)
+    values = model.__dict__
+    _write_uvarint(out, len(table))
+    for name, nested, classes in table:
+        _encode(out, name, None)
+        _encode(out, values[name], nested, classes, named=True)
+
+
+def _encode(
+    out: bytearray,
+    value: Any,
+    nested: type[BaseModel] | None,
+    classes: tuple[type[BaseModel], ...] = (),
+    named: bool = False,
+) -> None:
+    """
+    Encode a value annotated with the model `classes` (`nested` when there is exactly one), `named`
+    inside a named model: its reader has no schema to decode positional models.
+    """
+    kind = type(value)
+    if value is None:
+        out.append(_NONE)
+    elif kind is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        zigzag = value << 1 if value >= 0 else ((-value) << 1) - 1
+        if zigzag < 0x80:
+            out.append(zigzag)
+        else:
+            _write_uvarint(out, zigzag)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out.append(_STR)
+        if len(raw) < 0x80:
+            out.append(len(raw))
+        else:
+            _write_uvarint(out, len(raw))
+        out += raw
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        out.append(_BYTES)
+        _write_uvarint(out, len(value))
+        out += value
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        out.append(_LIST)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _encode(out, item, nested, classes, named)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_uvarint(out, len(value))
+        for key, item in value.items():
+            _encode(out, key, None)
+            _encode(out, item, nested, classes, named)
+    elif isinstance(value, BaseModel):
+        # A subclass instance is written as its annotated class, its extra fields would not validate
+        cls = kind if kind is nested else next((model for model in classes if isinstance(value, model)), kind)
+        if cls is nested and not named:
+            out.append(_MODEL)
+            _encode_model(out, value, cls)
+        else:
+            # The reader cannot infer the class: keep the names, nested models included
+            out.append(_NAMED_MODEL)
+            _encode_named_model(out, value, cls)
+    else:
+        try:
+            jsonable = to_jsonable_python(value)
+        except Exception as e:
+            raise CodecError(f"Cannot encode {kind.__name__} value {value!r}") from e
+        _encode(out, jsonable, None, named=named)
+
+
+def _decode_model(data: bytes, pos: int, cls: type[BaseModel]) -> tuple[dict[str, Any], int]:
+    table = field_table(cls)
+    count, pos = _read_uvarint(data, pos)
+    values: dict[str, Any] = {}
+    for index in range(count):
+        if index < len(table):
+            name, nested = table[index]
+            values[name], pos = _decode(data, pos, nested)
+        else:
+            # Trailing field unknown to this class, e.g. appended to a nested model by a newer writer
+            _, pos = _decode(data, pos, None)
+    return values, pos
+
+
+def _decode(data: bytes, pos: int, nested: type[BaseModel] | None) -> tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _INT:
+        value = data[pos]
+        if value < 0x80:
+            pos += 1
+        else:
+            value, pos = _read_uvarint(data, pos)
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    if tag in (_STR, _BYTES):
+        size = data[pos]
+        if size < 0x80:
+            pos += 1
+        else:
+            size, pos = _read_uvarint(data, pos)
+        end = pos + size
+        if end > len(data):
+            raise IndexError("truncated payload")
+        return (data[pos:end].decode("utf-8") if tag == _STR else data[pos:end]), end
+    if tag == _LIST:
+        count, pos = _read_uvarint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _decode(data, pos, nested)
+            items.append(item)
+        return items, pos
+    if tag == _DICT:
+        count, pos = _read_uvarint(data, pos)
+        mapping = {}
+        for _ in range(count):
+            key, pos = _decode(data, pos, None)
+            mapping[key], pos = _decode(data, pos, nested)
+        return mapping, pos
+    if tag == _MODEL:
+        if nested is None:
+            raise CodecError("Positional model without a model class in the schema")
+        return _decode_model(data, pos, nested)
+    if tag == _NAMED_MODEL:
+        count, pos = _read_uvarint(data, pos)
+        fields = {}
+        for _ in range(count):
+            name, pos = _decode(data, pos, None)
+            fields[name], pos = _decode(data, pos, None)
+        return fields, pos
+    raise CodecError(f"Unknown tag 0x{tag:02x} at offset {pos - 1}")
+
+
+def version(cls: type[BaseModel]) -> int:
+    """Return the schema version written for `cls` (its `__codec_version__`, 1 by default)."""
+    return getattr(cls, "__codec_version__", 1)
+
+
+def encode(model: BaseModel) -> bytes:
+    """
+    Encode a model instance.
+
+    Raises:
+        CodecError: If a field value has no binary or JSON representation.
+    """
+    out = bytearray((MAGIC,))
+    _write_uvarint(out, version(type(model)))
+    _encode_model(out, model, type(model))
+    return bytes(out)
+
+
+def decode_header(data: bytes | bytearray | memoryview) -> int:
+    """
+    Return the schema version of an encoded payload.
+
+    Raises:
+        CodecError: If the payload is not produced by `encode`.
+    """
+    try:
+        if data[0] != MAGIC:
+            raise CodecError("Not a bundle codec payload")
+        return _read_uvarint(data, 1)[0]
+    except IndexError as e:
+        raise CodecError("Truncated payload") from e
+
+
+def decode(cls: type[M], data: bytes | bytearray | memoryview) -> M:
+    """
+    Decode a payload produced by `encode` into an instance of `cls`, validating its values.
+
+    Raises:
+        CodecError: If the payload is malformed or of a schema version newer than `cls`.
+        pydantic.ValidationError: If the decoded values are not valid for `cls`.
+    """
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    if data[:1] != bytes((MAGIC,)):
+        raise CodecError("Not a bundle codec payload")
+    try:
+        payload_version, pos = _read_uvarint(data, 1)
+        if not 1 <= payload_version <= version(cls):
+            raise CodecError(f"Unknown schema version {payload_version} for {cls.__name__} (version {version(cls)})")
+        values, pos = _decode_model(data, pos, cls)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise CodecError(f"Malformed payload: {e}") from e
+    if pos != len(data):
+        raise CodecError(f"{len(data) - pos} trailing bytes after the payload")
+    return cls.model_validate(values)
+
+
+def benchmark(model: BaseModel, rounds: int = 1000) -> dict[str, float]:
+    """
+    Compare the codec with compact pydantic JSON on one model instance.
+
+    Returns:
+        dict[str, float]: The payload sizes in bytes and the mean encode/decode times in ns.
+    """
+    cls = type(model)
+    json_payload = model.model_dump_json()
+    codec_payload = encode(model)
+
+    def mean_ns(func: typing.Callable[[], Any]) -> float:
+        start = time.perf_counter_ns()
+        for _ in range(rounds):
+            func()
+        return (time.perf_counter_ns() - start) / rounds
+
+    return {
+        "json_bytes": len(json_payload.encode("utf-8")),
+        "codec_bytes": len(codec_payload),
+        "json_encode_ns": mean_ns(model.model_dump_json),
+        "codec_encode_ns": mean_ns(lambda: encode(model)),
+        "json_decode_ns": mean_ns(lambda: cls.model_validate_json(json_payload)),
+        "codec_decode_ns": mean_ns(lambda: decode(cls, codec_payload)),
+    }
+
+
+# Try me: python -m bundle.core.codec
+if __name__ == "__main__":
+    from pydantic import ConfigDict
+
+    class Point(BaseModel):
+        x: float
+        y: float
+        label: str = ""
+
+    class Track(BaseModel):
+        # JSON needs base64 for binary payloads
+        model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+        identifier: int
+        title: str
+        duration_ms: int
+        thumbnail: bytes
+        tags: list[str]
+        points: list[Point]
+
+    sample = Track(
+        identifier=123_456_789,
+        title="Sample track",
+        duration_ms=215_000,
+        thumbnail=bytes(range(256)) * 4,
+        tags=["music", "live", "2026"],
+        points=[Point(x=index / 3, y=-index, label=f"p{index}") for index in range(32)],
+    )
+    results = benchmark(sample, rounds=2000)
+    print(f"{'':8}{'json':>12}{'codec':>12}")
+    for metric in ("bytes", "encode_ns", "decode_ns"):
+        print(f"{metric:<10}{results['json_' + metric]:>10.0f}{results['codec_' + metric]:>12.0f}")
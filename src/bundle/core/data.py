@@ -19,11 +19,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import gzip
+import itertools
 import json
+import mmap
+import os
 import warnings
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import Type, TypeVar
+from typing import Any, Literal, Type, TypeVar
 
 from pydantic import (
     BaseModel,
@@ -31,6 +38,9 @@ from pydantic import (
     Field,
     HttpUrl,
     PrivateAttr,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    computed_field,
     field_serializer,
     field_validator,
     json_schema,
@@ -38,7 +48,7 @@ from pydantic import (
 )
 from pydantic.warnings import PydanticDeprecatedSince20
 
-from . import logger, tracer
+from . import codec, logger, tracer
 
 warnings.filterwarnings("ignore", category=PydanticDeprecatedSince20)
 
@@ -118,6 +128,107 @@ def configuration(
     )
 
 
+# Debug aid: when > 0, one `Data.trusted` call out of N runs full validation instead, to catch misuse.
+TRUSTED_VALIDATE_EVERY = int(os.getenv("BUNDLE_DATA_TRUSTED_VALIDATE_EVERY", "0"))
+
+_trusted_calls = itertools.count(1)
+
+_object_setattr = object.__setattr__
+
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, complex, str, bytes, tuple, frozenset)
+
+
+class _ConstructionPlan:
+    """What `Data.trusted` needs to build instances of one class, computed once per class."""
+
+    __slots__ = ("defaults", "names", "post_init", "private")
+
+    def __init__(self, cls: type[BaseModel]) -> None:
+        self.names = frozenset(cls.model_fields)
+        # (name, default, default_factory, factory_takes_data, copy_default) of the optional fields;
+        # pydantic's `model_construct` re-inspects the default factories on every call
+        self.defaults = tuple(
+            (
+                name,
+                field.default,
+                field.default_factory,
+                field.default_factory is not None and field.default_factory_takes_validated_data,
+                not isinstance(field.default, _IMMUTABLE_DEFAULTS),
+            )
+            for name, field in cls.model_fields.items()
+            if not field.is_required()
+        )
+        self.private = tuple(
+            (
+                name,
+                attribute.default,
+                attribute.default_factory,
+                not isinstance(attribute.default, _IMMUTABLE_DEFAULTS),
+            )
+            for name, attribute in cls.__private_attributes__.items()
+        )
+        # A user-defined model_post_init must run; pydantic's own one only initializes the private attributes
+        post_init = cls.model_post_init if cls.__pydantic_post_init__ else None
+        self.post_init = post_init is not None and getattr(post_init, "__name__", "") != "init_private_attributes"
+
+
+@lru_cache(maxsize=1024)
+def _construction_plan(cls: type[BaseModel]) -> _ConstructionPlan:
+    return _ConstructionPlan(cls)
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(cls: type[D]) -> TypeAdapter[list[D]]:
+    """Return the cached `TypeAdapter(list[cls])` used by the bulk helpers of `cls`."""
+    return TypeAdapter(list[cls])
+
+
+def _open_jsonl(path: Path, mode: str):
+    """Open a JSON Lines file in binary `mode`, gzip-compressed when its suffix is `.gz`."""
+    return gzip.open(path, mode) if path.suffix == ".gz" else open(path, mode)
+
+
+def _jsonl_lines(path: Path, use_mmap: bool) -> Iterator[bytes]:
+    if use_mmap and path.suffix != ".gz":
+        with open(path, "rb") as stream:
+            if path.stat().st_size == 0:
+                return
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from iter(mapped.readline, b"")
+    else:
+        with _open_jsonl(path, "rb") as stream:
+            yield from stream
+
+
+def _jsonl_batches(cls: type[D], path: Path, batch_size: int, use_mmap: bool) -> Iterator[list[D]]:
+    """Yield the models of a JSON Lines file, `batch_size` lines validated per pydantic-core call."""
+    adapter = _list_adapter(cls)
+    batch: list[bytes] = []
+    for line in _jsonl_lines(path, use_mmap):
+        line = line.strip()
+        if not line:
+            continue
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield adapter.validate_json(b"[" + b",".join(batch) + b"]")
+            batch = []
+    if batch:
+        yield adapter.validate_json(b"[" + b",".join(batch) + b"]")
+
+
+def _jsonl_chunk(batch: list[Data]) -> bytes:
+    return b"".join(type(model).__pydantic_serializer__.to_json(model) + b"\n" for model in batch)
+
+
+async def _aiterate(items: Iterable[D] | AsyncIterable[D]) -> AsyncIterator[D]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class Data(BaseModel):
     """
     Base data model class, providing utilities for serialization and deserialization
@@ -165,6 +276,366 @@ class Data(BaseModel):
         """
         return self.model_dump()
 
+    @classmethod
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def from_dict_sync(cls: type[D], data: dict) -> D:
+        """
+        Synchronous counterpart of `from_dict`, without the coroutine round trip.
+
+        Args:
+            data (dict): The data dictionary from which to create the model instance.
+
+        Returns:
+            An instance of the model.
+        """
+        return cls(**data)
+
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def as_dict_sync(self) -> dict:
+        """
+        Synchronous counterpart of `as_dict`.
+
+        Returns:
+            A dictionary representation of the model instance.
+        """
+        return self.model_dump()
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def from_json_sync(cls: type[D], json_source: str | bytes | Path) -> D:
+        """
+        Synchronous counterpart of `from_json`.
+
+        Args:
+            json_source (str | bytes | Path): The JSON document or path to the JSON file.
+
+        Returns:
+            An instance of the model.
+
+        Raises:
+            RuntimeError: If the `json_source` is neither a string, bytes nor a Path instance.
+        """
+        if isinstance(json_source, Path):
+            json_source = json_source.read_bytes()
+        elif not isinstance(json_source, (str, bytes)):
+            raise RuntimeError(f"Unsupported json_source={json_source}")
+        return cls.model_validate_json(json_source)
+
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def as_json_sync(self) -> str:
+        """
+        Synchronous counterpart of `as_json`.
+
+        Returns:
+            A JSON string representation of the model instance.
+        """
+        return self.model_dump_json(indent=4)
+
+    @classmethod
+    def trusted(cls: type[D], **fields: Any) -> D:
+        """
+        Build an instance from values already known to be valid, e.g. produced by our own code.
+
+        Validation, coercion and model validators are skipped; defaults, default factories and
+        private attributes are still applied. Nested models must be passed as instances.
+        Set TRUSTED_VALIDATE_EVERY (or BUNDLE_DATA_TRUSTED_VALIDATE_EVERY) to N > 0 to fully
+        validate one call out of N in debug runs.
+
+        Args:
+            **fields: Field values, by field name.
+
+        Returns:
+            An instance of the model.
+
+        Raises:
+            TypeError: If a name is not a field of the model.
+        """
+        if TRUSTED_VALIDATE_EVERY and next(_trusted_calls) % TRUSTED_VALIDATE_EVERY == 0:
+            return cls(**fields)
+        plan = _construction_plan(cls)
+        if not fields.keys() <= plan.names:
+            raise TypeError(f"{cls.__name__}.trusted() got unknown fields {sorted(fields.keys() - plan.names)}")
+        fields_set = set(fields)
+        # The keyword dict is ours: reuse it as the instance __dict__
+        values = fields
+        for name, default, factory, takes_data, copy_default in plan.defaults:
+            if name not in values:
+                if factory is not None:
+                    values[name] = factory(values) if takes_data else factory()
+                else:
+                    values[name] = copy.deepcopy(default) if copy_default else default
+
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", None)
+        if plan.post_init:
+            instance.model_post_init(None)
+        else:
+            private = {
+                name: factory() if factory is not None else copy.deepcopy(default) if copy_default else default
+                for name, default, factory, copy_default in plan.private
+            }
+            _object_setattr(instance, "__pydantic_private__", private or None)
+        return instance
+
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def encode(self) -> bytes:
+        """
+        Encode the model instance with the compact binary codec (see `bundle.core.codec`).
+
+        Returns:
+            The binary payload, readable by `decode`.
+        """
+        return codec.encode(self)
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def decode(cls: type[D], payload: bytes | bytearray | memoryview) -> D:
+        """
+        Create an instance of the model from a payload produced by `encode`.
+
+        Args:
+            payload (bytes | bytearray | memoryview): The binary payload.
+
+        Returns:
+            An instance of the model.
+
+        Raises:
+            codec.CodecError: If the payload is malformed.
+        """
+        return codec.decode(cls, payload)
+
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def diff(self: D, other: D) -> Patch:
+        """
+        Compute the structural delta turning this instance into `other`.
+
+        Unchanged fields are skipped at every level: a field is only descended into when it is not
+        the same object and compares unequal (`==` stops at the first difference). Lists of models whose class defines
+        `__diff_key__` (e.g. "address") are diffed item by item, matched on that field;
+        fields listed in the class `__diff_exclude__` are ignored.
+
+        Args:
+            other (Data): The target instance, of the same class.
+
+        Returns:
+            The patch to pass to `apply`. Empty (falsy) when nothing changed.
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot diff {type(self).__name__} against {type(other).__name__}")
+        patch = Patch()
+        _diff_model(self, other, [], patch.ops)
+        return patch
+
+    @tracer.Sync.decorator.call_raise(log_level=logger.Level.VERBOSE)
+    def apply(self: D, patch: Patch) -> D:
+        """
+        Return a new instance with `patch` (from `diff`) applied, validated like `from_dict`.
+
+        Args:
+            patch (Patch): The delta to apply.
+
+        Returns:
+            A new instance of the model.
+        """
+        tree = self.model_dump()
+        for op in patch.ops:
+            _apply_op(tree, op)
+        return type(self).model_validate(tree)
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise
+    def from_dicts(cls: type[D], items: Iterable[dict]) -> list[D]:
+        """
+        Validate a batch of dictionaries in a single pydantic-core call.
+
+        Args:
+            items (Iterable[dict]): The data dictionaries.
+
+        Returns:
+            The model instances, in order.
+        """
+        return _list_adapter(cls).validate_python(items if isinstance(items, list) else list(items))
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise
+    def from_json_array(cls: type[D], json_array: str | bytes) -> list[D]:
+        """
+        Parse and validate a JSON array of objects in a single pydantic-core call.
+
+        Args:
+            json_array (str | bytes): The JSON array.
+
+        Returns:
+            The model instances, in order.
+        """
+        return _list_adapter(cls).validate_json(json_array)
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise
+    def dump_many(cls: type[D], models: Sequence[D]) -> list[dict]:
+        """
+        Serialize a batch of instances to dictionaries in a single pydantic-core call.
+
+        The list serializer only knows the fields of `cls`: a batch holding subclass instances is
+        serialized model by model, with the serializer of each instance.
+
+        Args:
+            models (Sequence[Data]): The instances, of this class or subclasses.
+
+        Returns:
+            One dictionary per instance, as `as_dict` would return.
+        """
+        models = list(models)
+        if all(type(model) is cls for model in models):
+            return _list_adapter(cls).dump_python(models)
+        return [type(model).__pydantic_serializer__.to_python(model) for model in models]
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise
+    def dump_json_array(cls: type[D], models: Sequence[D]) -> bytes:
+        """
+        Serialize a batch of instances to a compact JSON array in a single pydantic-core call.
+
+        Subclass instances are serialized with their own serializer, as in `dump_many`.
+
+        Args:
+            models (Sequence[Data]): The instances, of this class or subclasses.
+
+        Returns:
+            The UTF-8 encoded JSON array, readable by `from_json_array`.
+        """
+        models = list(models)
+        if all(type(model) is cls for model in models):
+            return _list_adapter(cls).dump_json(models)
+        return b"[" + b",".join(type(model).__pydantic_serializer__.to_json(model) for model in models) + b"]"
+
+    @classmethod
+    def iter_jsonl_sync(cls: type[D], path: Path, batch_size: int = 1024, use_mmap: bool = False) -> Iterator[D]:
+        """
+        Stream the models of a JSON Lines file with bounded memory.
+
+        Lines are validated `batch_size` at a time with the shared list validator of the class.
+        Files ending in `.gz` are decompressed on the fly.
+
+        Args:
+            path (Path): The JSON Lines file.
+            batch_size (int): Number of lines validated per call.
+            use_mmap (bool): Read an uncompressed file through a memory map.
+
+        Yields:
+            The model instances, in file order.
+        """
+        for batch in _jsonl_batches(cls, path, batch_size, use_mmap):
+            yield from batch
+
+    @classmethod
+    async def iter_jsonl(cls: type[D], path: Path, batch_size: int = 1024, use_mmap: bool = False) -> AsyncIterator[D]:
+        """
+        Asynchronous counterpart of `iter_jsonl_sync`: each batch is read and validated in the IO pool.
+
+        Args:
+            path (Path): The JSON Lines file.
+            batch_size (int): Number of lines validated per call.
+            use_mmap (bool): Read an uncompressed file through a memory map.
+
+        Yields:
+            The model instances, in file order.
+        """
+        batches = _jsonl_batches(cls, path, batch_size, use_mmap)
+        pending: asyncio.Future[list[D] | None] | None = None
+        try:
+            while True:
+                pending = asyncio.ensure_future(
+                    tracer.Async.call_raise(
+                        next, batches, None, log_level=logger.Level.VERBOSE, policy=tracer.ExecutionPolicy.IO_POOL
+                    )
+                )
+                # Shielded: a cancelled consumer must not abandon a `next` still running in the pool
+                batch = await asyncio.shield(pending)
+                if not batch:
+                    break
+                for model in batch:
+                    yield model
+        finally:
+            if pending is not None and not pending.done():
+                # Closing the generator while `next` runs raises "generator already executing"
+                await asyncio.wait({pending})
+                if not pending.cancelled():
+                    pending.exception()
+            batches.close()
+
+    @classmethod
+    @tracer.Sync.decorator.call_raise
+    def write_jsonl_sync(cls, path: Path, models: Iterable[Data], batch_size: int = 1024, append: bool = False) -> int:
+        """
+        Write models to a JSON Lines file, one JSON object per line, `batch_size` lines per write.
+        Files ending in `.gz` are gzip-compressed.
+
+        Args:
+            path (Path): The JSON Lines file.
+            models (Iterable[Data]): The models to write, consumed lazily.
+            batch_size (int): Number of lines per write.
+            append (bool): Append to an existing file instead of truncating it.
+
+        Returns:
+            The number of models written.
+        """
+        written = 0
+        batch: list[Data] = []
+        with _open_jsonl(path, "ab" if append else "wb") as stream:
+            for model in models:
+                batch.append(model)
+                if len(batch) >= batch_size:
+                    stream.write(_jsonl_chunk(batch))
+                    written += len(batch)
+                    batch = []
+            if batch:
+                stream.write(_jsonl_chunk(batch))
+                written += len(batch)
+        return written
+
+    @classmethod
+    @tracer.Async.decorator.call_raise
+    async def write_jsonl(
+        cls,
+        path: Path,
+        models: Iterable[Data] | AsyncIterable[Data],
+        batch_size: int = 1024,
+        append: bool = False,
+    ) -> int:
+        """
+        Asynchronous counterpart of `write_jsonl_sync`, also accepting async iterables.
+        Batches are serialized on the event loop and written in the IO pool.
+
+        Args:
+            path (Path): The JSON Lines file.
+            models (Iterable[Data] | AsyncIterable[Data]): The models to write, consumed lazily.
+            batch_size (int): Number of lines per write.
+            append (bool): Append to an existing file instead of truncating it.
+
+        Returns:
+            The number of models written.
+        """
+        io_pool = tracer.ExecutionPolicy.IO_POOL
+        stream = await tracer.Async.call_raise(_open_jsonl, path, "ab" if append else "wb", policy=io_pool)
+        written = 0
+        batch: list[Data] = []
+        try:
+            async for model in _aiterate(models):
+                batch.append(model)
+                if len(batch) >= batch_size:
+                    await tracer.Async.call_raise(stream.write, _jsonl_chunk(batch), policy=io_pool)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                await tracer.Async.call_raise(stream.write, _jsonl_chunk(batch), policy=io_pool)
+                written += len(batch)
+        finally:
+            await tracer.Async.call_raise(stream.close, policy=io_pool)
+        return written
+
     @classmethod
     @tracer.Async.decorator.call_raise
     async def _from_json_path(cls: type[D], json_path: Path) -> D:
@@ -186,7 +657,7 @@ class Data(BaseModel):
         Raises:
             Exception: If the model instantiation from the JSON string fails.
         """
-        return await tracer.Async.call_raise(cls.model_validate_json, json_str)
+        return await tracer.Async.call_raise(cls.model_validate_json, json_str, policy=tracer.ExecutionPolicy.INLINE)
 
     @classmethod
     @tracer.Async.decorator.call_raise
@@ -287,3 +758,144 @@ class Data(BaseModel):
         """
         schema_str = await self.as_jsonschema_str(mode)
         await tracer.Async.call_raise(path.write_text, schema_str, encoding="utf-8")
+
+
+PathSegment = str | int | dict[str, Any]
+
+
+class PatchOp(Data):
+    """
+    One operation of a `Patch`.
+
+    `path` lists field names and dict keys from the root; items of keyed lists are addressed
+    by a one-entry dict `{key_field: key}`, so patches can be applied to plain JSON without the schema.
+
+    - `set`: set `value` at `path` (adding the dict entry or keyed list item if missing).
+    - `del`: remove the dict entry or keyed list item at `path`.
+    - `order`: reorder the keyed list at `path`; `value` is `{key_field: [keys in order]}`.
+    """
+
+    op: Literal["set", "del", "order"]
+    path: list[PathSegment] = Field(default_factory=list)
+    value: Any = None
+
+
+class Patch(Data):
+    """Structural delta between two instances of a model, see `Data.diff` and `Data.apply`."""
+
+    ops: list[PatchOp] = Field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.ops)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+
+def _plain(value: Any) -> Any:
+    """Detach a patch value from the source instance."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def _diff_model(old: BaseModel, new: BaseModel, path: list[PathSegment], ops: list[PatchOp]) -> None:
+    excluded = getattr(type(old), "__diff_exclude__", ())
+    old_values = old.__dict__
+    new_values = new.__dict__
+    for name, nested in codec.field_table(type(old)):
+        if name in excluded:
+            continue
+        before = old_values[name]
+        after = new_values[name]
+        if before is not after and before != after:
+            _diff_value(before, after, nested, [*path, name], ops)
+
+
+def _diff_value(old: Any, new: Any, nested: type[BaseModel] | None, path: list[PathSegment], ops: list[PatchOp]) -> None:
+    if isinstance(old, BaseModel) and type(old) is type(new):
+        _diff_model(old, new, path, ops)
+    elif isinstance(old, list) and isinstance(new, list) and getattr(nested, "__diff_key__", None):
+        _diff_keyed_list(old, new, nested.__diff_key__, path, ops)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(PatchOp(op="del", path=[*path, key]))
+        for key, after in new.items():
+            if key not in old:
+                ops.append(PatchOp(op="set", path=[*path, key], value=_plain(after)))
+            elif old[key] is not after and old[key] != after:
+                _diff_value(old[key], after, nested, [*path, key], ops)
+    else:
+        ops.append(PatchOp(op="set", path=path, value=_plain(new)))
+
+
+def _diff_keyed_list(old: list, new: list, key: str, path: list[PathSegment], ops: list[PatchOp]) -> None:
+    old_items = {getattr(item, key): item for item in old}
+    new_keys = [getattr(item, key) for item in new]
+    if len(old_items) != len(old) or len(set(new_keys)) != len(new_keys):
+        # Duplicated identities: no stable matching
+        ops.append(PatchOp(op="set", path=path, value=_plain(new)))
+        return
+    kept = set(new_keys)
+    for identity in old_items:
+        if identity not in kept:
+            ops.append(PatchOp(op="del", path=[*path, {key: identity}]))
+    for identity, item in zip(new_keys, new, strict=True):
+        previous = old_items.get(identity)
+        if previous is None:
+            ops.append(PatchOp(op="set", path=[*path, {key: identity}], value=_plain(item)))
+        elif previous is not item and previous != item:
+            _diff_value(previous, item, type(item), [*path, {key: identity}], ops)
+    applied = [identity for identity in old_items if identity in kept]
+    applied += [identity for identity in new_keys if identity not in old_items]
+    if applied != new_keys:
+        ops.append(PatchOp(op="order", path=path, value={key: new_keys}))
+
+
+def _find_keyed(items: list, segment: dict[str, Any]) -> int | None:
+    ((key, identity),) = segment.items()
+    for index, item in enumerate(items):
+        if item.get(key) == identity:
+            return index
+    return None
+
+
+def _child(container: Any, segment: PathSegment) -> Any:
+    if isinstance(segment, dict):
+        index = _find_keyed(container, segment)
+        if index is None:
+            raise KeyError(f"No item matching {segment}")
+        return container[index]
+    return container[segment]
+
+
+def _apply_op(tree: dict[str, Any], op: PatchOp) -> None:
+    if not op.path:
+        raise ValueError("Patch operations need a non-empty path")
+    container: Any = tree
+    for segment in op.path[:-1]:
+        container = _child(container, segment)
+    last = op.path[-1]
+    if op.op == "order":
+        items = _child(container, last)
+        ((key, order),) = op.value.items()
+        position = {identity: index for index, identity in enumerate(order)}
+        items.sort(key=lambda item: position.get(item.get(key), len(position)))
+    elif isinstance(last, dict):
+        index = _find_keyed(container, last)
+        if op.op == "del":
+            if index is not None:
+                del container[index]
+        elif index is None:
+            container.append(op.value)
+        else:
+            container[index] = op.value
+    elif op.op == "del":
+        container.pop(last, None)
+    else:
+        container[last] = op.value
@@ -117,7 +117,10 @@ class Downloader(Entity):
         pass
 
     def update(self, byte_count: int):
-        """Updates the download progress. Placeholder for subclasses to implement."""
+        """
+        Updates the download progress. Placeholder for subclasses to implement.
+        Runs inline on the event loop for every chunk, so it must stay cheap and non-blocking.
+        """
         pass
 
     def end(self):
@@ -158,13 +161,14 @@ class Downloader(Entity):
                                     self.update,
                                     len(chunk),
                                     log_level=logger.Level.VERBOSE,
+                                    policy=tracer.ExecutionPolicy.INLINE,
                                 )
                                 await asyncio.sleep(0)
                     else:
                         async for chunk in response.content.iter_chunked(self.chunk_size):
                             self._buffer.extend(chunk)
                             downloaded_bytes += len(chunk)
-                            await tracer.Async.call_raise(self.update, len(chunk))
+                            await tracer.Async.call_raise(self.update, len(chunk), policy=tracer.ExecutionPolicy.INLINE)
                             await asyncio.sleep(0)
                     if downloaded_bytes <= 0:
                         content_type = response.headers.get("content-type", "")
@@ -19,8 +19,12 @@
 
 from __future__ import annotations
 
+import itertools
+import os
 import sys
+import threading
 import time
+from typing import Any
 from uuid import UUID, uuid5
 
 from .. import version
@@ -45,26 +49,88 @@ such as in simulation environments, complex data models, or systems where state
 """
 
 NAMESPACE = UUID("54681692-1234-5678-1234-567812345678")
-UNIQUE_GENERATOR_ACTIVE = True
 
+# Bits of the identifier index left to the per-process counter, and to the process id above it.
+# Together they fit in 53 bits, so that indices sent as JSON stay exact in JavaScript numbers;
+# 22 bits hold any Linux pid (pid_max is at most 2**22).
+INDEX_BITS = 31
+PID_BITS = 22
 
-def _identifier_generator(start=0, step=1):
-    index = start
-    while UNIQUE_GENERATOR_ACTIVE:
-        index += step
-        yield Identifier(index=index, uuid=str(uuid5(NAMESPACE, str(index))))
+
+class _IndexAllocator:
+    """
+    Thread-safe allocator of identifier indices unique across the processes of a host.
+
+    The index is `pid << INDEX_BITS | n` where `n` counts from 1 in each process, and the
+    allocator restarts with the new pid in forked children. Pids are truncated to `PID_BITS`.
+    """
+
+    __slots__ = ("_counter", "_lock", "prefix")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.prefix = (os.getpid() & ((1 << PID_BITS) - 1)) << INDEX_BITS
+        self._counter = itertools.count(1)
+
+    def next(self) -> int:
+        """
+        Raises:
+            OverflowError: If this process allocated all of its `2**INDEX_BITS - 1` indices.
+        """
+        with self._lock:
+            n = next(self._counter)
+        if n >> INDEX_BITS:
+            raise OverflowError(f"Entity identifier indices of process {os.getpid()} exhausted")
+        return self.prefix | n
+
+
+_ALLOCATOR = _IndexAllocator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ALLOCATOR.reset)
 
 
 class Identifier(data.Data):
+    """
+    Unique identifier of an `Entity`.
+
+    The `uuid` is derived from the `index` on first access and serialized with it;
+    a `uuid` given at validation is kept as is.
+    """
+
     index: int
-    uuid: str
+    _uuid: str | None = data.PrivateAttr(default=None)
+
+    @data.model_validator(mode="wrap")
+    @classmethod
+    def _accept_uuid(cls, value: Any, handler: data.ValidatorFunctionWrapHandler) -> Identifier:
+        uuid = None
+        if isinstance(value, dict) and "uuid" in value:
+            value = dict(value)
+            uuid = value.pop("uuid")
+        identifier = handler(value)
+        if uuid is not None:
+            identifier._uuid = str(uuid)
+        return identifier
+
+    @data.computed_field
+    @property
+    def uuid(self) -> str:
+        if self._uuid is None:
+            self._uuid = str(uuid5(NAMESPACE, str(self.index)))
+        return self._uuid
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Identifier):
+            return NotImplemented
+        return self.index == other.index and self.uuid == other.uuid
 
     @staticmethod
     def next() -> Identifier:
-        return next(ENTITY_ID_GENERATOR)
-
-
-ENTITY_ID_GENERATOR = _identifier_generator()
+        return Identifier.trusted(index=_ALLOCATOR.next())
 
 
 class Entity(Data):
@@ -95,7 +161,8 @@ class Entity(Data):
         Returns:
             The unchanged Entity instance, ensuring it passes through the validation process without modifications.
         """
-        LOGGER.debug("%s  %s[%s]", logger.Emoji.start, self.class_name, self.name)
+        if LOGGER.is_recorded(logger.Level.DEBUG):
+            LOGGER.debug("%s  %s[%s]", logger.Emoji.start, self.class_name, self.name)
         return self
 
     @property
@@ -112,9 +179,9 @@ class Entity(Data):
         """
         Destructor method for the Entity class logging the entity's deletion along with its age.
         """
-        if sys.meta_path is None or not LOGGER.hasHandlers():
-            # Avoid logging if no handlers are attached.
-            # This can happen on the last entity when the program is exiting.
+        if sys.meta_path is None or not LOGGER.is_recorded(logger.Level.DEBUG) or not LOGGER.hasHandlers():
+            # Avoid formatting the age when it is neither logged nor recorded, and logging without handlers:
+            # this can happen on the last entity when the program is exiting.
             return
         LOGGER.debug(
             "%s  %s[%s] age=%s",
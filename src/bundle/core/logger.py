@@ -17,16 +17,30 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import atexit
+import copy
+import gzip
+import itertools
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
+import threading
 import time
-from collections.abc import Callable, Mapping
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from enum import IntEnum
+from enum import Enum, IntEnum
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, cast
 
+from pydantic import BaseModel
 from rich.logging import RichHandler
 from rich.pretty import pretty_repr
 
@@ -79,6 +93,276 @@ logging.addLevelName(Level.VERBOSE, "VERBOSE")
 DEFAULT_LOGGING = logging.DEBUG
 
 
+@dataclass
+class RenderBudget:
+    """
+    Size limits applied when rendering traced call payloads (args, kwargs, results) in log records.
+
+    Attributes:
+        max_chars (int): Maximum length of the whole rendered payload.
+        max_items (int): Maximum number of items shown per list, tuple, set or dict.
+        max_depth (int): Maximum nesting depth rendered.
+        max_string (int): Maximum number of characters shown per string.
+        max_bytes (int): Maximum number of bytes previewed per bytes-like value.
+    """
+
+    max_chars: int = 8192
+    max_items: int = 32
+    max_depth: int = 4
+    max_string: int = 512
+    max_bytes: int = 32
+
+
+DEFAULT_RENDER_BUDGET = RenderBudget()
+
+_SUMMARIZERS: dict[type, Callable[[Any, RenderBudget], str]] = {}
+
+
+def register_summarizer(cls: type, summarizer: Callable[[Any, RenderBudget], str]) -> None:
+    """
+    Register a function rendering a short summary of `cls` instances (and subclasses) in log payloads.
+
+    Args:
+        cls: The type to summarize.
+        summarizer: Called with the value and the active RenderBudget, returns the summary text.
+    """
+    _SUMMARIZERS[cls] = summarizer
+    _find_summarizer.cache_clear()
+
+
+def _summarize_bytes(value: bytes | bytearray | memoryview, budget: RenderBudget) -> str:
+    raw = bytes(value[: budget.max_bytes])
+    suffix = "..." if len(value) > budget.max_bytes else ""
+    return f"<{type(value).__name__} len={len(value)} {raw!r}{suffix}>"
+
+
+@lru_cache(maxsize=1024)
+def _find_summarizer(cls: type) -> Callable[[Any, RenderBudget], str] | None:
+    for base in cls.__mro__:
+        if base in _SUMMARIZERS:
+            return _SUMMARIZERS[base]
+    if cls.__module__ == "numpy" and hasattr(cls, "shape") and hasattr(cls, "dtype"):
+        # numpy is optional: arrays are recognized without importing it
+        return lambda array, _: f"<{cls.__name__} shape={getattr(array, 'shape', ())} dtype={getattr(array, 'dtype', '?')}>"
+    return None
+
+
+register_summarizer(bytes, _summarize_bytes)
+register_summarizer(bytearray, _summarize_bytes)
+register_summarizer(memoryview, _summarize_bytes)
+
+
+class _Summary:
+    """Placeholder rendered verbatim by rich."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __repr__(self) -> str:
+        return self.text
+
+
+class _ModelView:
+    """Field view of a pydantic model, so its values get summarized too."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: list[tuple[str, Any]]) -> None:
+        self.fields = fields
+
+    def __rich_repr__(self):
+        yield from self.fields
+
+
+@lru_cache(maxsize=1024)
+def _model_view_class(cls: type) -> type[_ModelView]:
+    # rich names the node after the class, keep the model name
+    return type(cls.__name__, (_ModelView,), {"__slots__": ()})
+
+
+def _summarize(value: Any, budget: RenderBudget, depth: int = 0) -> Any:
+    """Replace bulky values by summaries before handing the payload to rich."""
+    summarizer = _find_summarizer(type(value))
+    if summarizer is not None:
+        return _Summary(summarizer(value, budget))
+    if depth >= budget.max_depth:
+        return value
+    if isinstance(value, BaseModel):
+        fields = [(name, _summarize(getattr(value, name), budget, depth + 1)) for name in type(value).model_fields]
+        return _model_view_class(type(value))(fields)
+    if type(value) is dict:
+        summary = {key: _summarize(item, budget, depth + 1) for key, item in islice(value.items(), budget.max_items)}
+        if len(value) > budget.max_items:
+            summary[_Summary("...")] = _Summary(f"+{len(value) - budget.max_items} more")
+        return summary
+    if type(value) in (list, tuple):
+        summary = [_summarize(item, budget, depth + 1) for item in islice(value, budget.max_items)]
+        if len(value) > budget.max_items:
+            summary.append(_Summary(f"... +{len(value) - budget.max_items} more"))
+        return type(value)(summary)
+    return value
+
+
+def bounded_repr(value: Any, budget: RenderBudget | None = None) -> str:
+    """
+    Pretty representation of `value` within the limits of `budget` (DEFAULT_RENDER_BUDGET if None).
+    Bytes-like values, numpy arrays and registered types are summarized instead of rendered in full.
+    """
+    budget = budget or DEFAULT_RENDER_BUDGET
+    text = pretty_repr(
+        _summarize(value, budget),
+        max_length=budget.max_items + 1,
+        max_string=budget.max_string,
+        max_depth=budget.max_depth,
+    )
+    return _truncate(text, budget)
+
+
+def _truncate(text: str, budget: RenderBudget) -> str:
+    if len(text) > budget.max_chars:
+        return f"{text[: budget.max_chars]}... (+{len(text) - budget.max_chars} chars)"
+    return text
+
+
+class LazyRepr:
+    """
+    Defer `bounded_repr` until a handler formats the record, and cache the result for the other handlers.
+    Records dropped by level or filters never pay the rendering cost.
+    """
+
+    __slots__ = ("_text", "budget", "value")
+
+    def __init__(self, value: Any, budget: RenderBudget | None = None) -> None:
+        self.value = value
+        self.budget = budget
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = bounded_repr(self.value, self.budget)
+        return self._text
+
+    __repr__ = __str__
+
+
+class LazyText(LazyRepr):
+    """Like LazyRepr, but bounds `str(value)`: used for exception messages."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = _truncate(str(self.value), self.budget or DEFAULT_RENDER_BUDGET)
+        return self._text
+
+    __repr__ = __str__
+
+
+class FlightRecorder:
+    """
+    In-memory ring buffers of the records a logger skips because of its level.
+
+    Captured entries hold only the timestamp, level, message and args (unformatted, by reference):
+    nothing is rendered until a record at `dump_level` or above is handled by a logger covered by
+    the recorder, at which point every buffered entry is formatted and emitted before it, oldest first.
+    Each logger name has its own ring of `capacity` entries, so a chatty logger cannot evict the
+    context of the others. Tracer successes bypass sampling and Entity lifecycle records bypass their
+    level guard while a recorder is installed, so both are captured.
+
+    Attributes:
+        capacity (int): Entries kept per logger name.
+        level (int): Minimum level captured.
+        dump_level (int): Records at this level or above flush the buffers.
+    """
+
+    def __init__(self, capacity: int = 1000, level: int = Level.VERBOSE, dump_level: int = Level.ERROR) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self.level = level
+        self.dump_level = dump_level
+        self._rings: dict[str, deque[tuple[int, float, int, Any, tuple[Any, ...]]]] = {}
+        self._lock = threading.Lock()
+        # Orders entries across rings, timestamps can tie
+        self._sequence = itertools.count()
+
+    def capture(self, name: str, level: int, msg: Any, args: tuple[Any, ...]) -> None:
+        """Buffer one skipped record of the logger `name`."""
+        if level < self.level:
+            return
+        ring = self._rings.get(name)
+        if ring is None:
+            with self._lock:
+                ring = self._rings.setdefault(name, deque(maxlen=self.capacity))
+        ring.append((next(self._sequence), time.time(), level, msg, args))
+
+    def __len__(self) -> int:
+        return sum(len(ring) for ring in list(self._rings.values()))
+
+    def drain(self) -> list[logging.LogRecord]:
+        """Empty the buffers and return their entries as log records, oldest first."""
+        with self._lock:
+            rings = list(self._rings.items())
+            self._rings = {}
+        entries = [(name, *entry) for name, ring in rings for entry in ring]
+        entries.sort(key=lambda entry: entry[1])
+        records = []
+        for name, _, created, level, msg, args in entries:
+            record = logging.LogRecord(name, level, "(flight recorder)", 0, msg, args, None)
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            record.flight_recorder = True
+            records.append(record)
+        return records
+
+    def dump(self, logger: logging.Logger) -> None:
+        """Format and emit the buffered entries through the handlers of `logger`."""
+        for record in self.drain():
+            logger.callHandlers(record)
+
+
+_flight_recorders_installed = False
+
+
+def install_flight_recorder(
+    logger: logging.Logger | str = "bundle",
+    capacity: int = 1000,
+    level: int = Level.VERBOSE,
+    dump_level: int = Level.ERROR,
+) -> FlightRecorder:
+    """
+    Attach a `FlightRecorder` to a logger and its descendants.
+
+    The logger level is left untouched: production can stay at INFO while the VERBOSE and DEBUG
+    context around failures is still emitted when an error is logged.
+
+    Args:
+        logger: The logger, or its name. Defaults to "bundle".
+        capacity: Entries kept per logger name.
+        level: Minimum level captured.
+        dump_level: Records at this level or above flush the buffers.
+
+    Returns:
+        FlightRecorder: The installed recorder.
+    """
+    global _flight_recorders_installed
+    if isinstance(logger, str):
+        logger = get_logger(logger)
+    recorder = FlightRecorder(capacity, level, dump_level)
+    logger.flight_recorder = recorder
+    _flight_recorders_installed = True
+    return recorder
+
+
+def uninstall_flight_recorder(logger: logging.Logger | str = "bundle") -> None:
+    """Detach the flight recorder of a logger, dropping its buffered entries."""
+    if isinstance(logger, str):
+        logger = get_logger(logger)
+    logger.flight_recorder = None
+
+
 class BundleLogger(logging.getLoggerClass()):
     Emoji = Emoji
 
@@ -103,13 +387,58 @@ class BundleLogger(logging.getLoggerClass()):
             return callable_obj.__call__.__qualname__
         return repr(callable_obj)
 
+    flight_recorder: FlightRecorder | None = None
+
+    def find_flight_recorder(self) -> FlightRecorder | None:
+        """Return the flight recorder of this logger or of its closest ancestor having one."""
+        logger: logging.Logger | None = self
+        while logger is not None:
+            recorder = getattr(logger, "flight_recorder", None)
+            if recorder is not None:
+                return recorder
+            logger = logger.parent
+        return None
+
+    def is_recorded(self, level: int) -> bool:
+        """True if a record at `level` is either logged or buffered by a flight recorder."""
+        if self.isEnabledFor(level):
+            return True
+        if not _flight_recorders_installed:
+            return False
+        recorder = self.find_flight_recorder()
+        return recorder is not None and level >= recorder.level
+
+    def _capture(self, level: int, msg: Any, args: tuple[Any, ...]) -> None:
+        """Buffer a record skipped because of the logger level in the flight recorder, if any."""
+        if _flight_recorders_installed:
+            recorder = self.find_flight_recorder()
+            if recorder is not None:
+                recorder.capture(self.name, level, msg, args)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        if _flight_recorders_installed and record.levelno >= Level.WARNING:
+            recorder = self.find_flight_recorder()
+            if recorder is not None and record.levelno >= recorder.dump_level and len(recorder):
+                recorder.dump(self)
+        super().handle(record)
+
     def verbose(self, msg: str, *args, stacklevel=BASE_STACKLEVEL, **kwargs) -> None:
         if self.isEnabledFor(Level.VERBOSE):
             self._log(Level.VERBOSE, msg, args, stacklevel=stacklevel, **kwargs)
+        else:
+            self._capture(Level.VERBOSE, msg, args)
 
     def testing(self, msg: str, *args, stacklevel=BASE_STACKLEVEL, **kwargs) -> None:
         if self.isEnabledFor(Level.TESTING):
             self._log(Level.TESTING, msg, args, stacklevel=stacklevel, **kwargs)
+        else:
+            self._capture(Level.TESTING, msg, args)
+
+    def debug(self, msg: str, *args, stacklevel=BASE_STACKLEVEL, **kwargs) -> None:
+        if self.isEnabledFor(Level.DEBUG):
+            self._log(Level.DEBUG, msg, args, stacklevel=stacklevel, **kwargs)
+        else:
+            self._capture(Level.DEBUG, msg, args)
 
     def pretty_repr(self, obj: Any) -> None:
         return pretty_repr(obj)
@@ -134,17 +463,57 @@ class BundleLogger(logging.getLoggerClass()):
             stacklevel: The stack level for the log record.
             level: The logging level to use (default: DEBUG).
         """
-        if not self.isEnabledFor(level):
+        enabled = self.isEnabledFor(level)
+        if not enabled and not _flight_recorders_installed:
             return
 
-        caller = f"{func.__module__}.{BundleLogger.get_callable_name(func)}"
         payload = {
             "args": args,
             "kwargs": kwargs,
             "result": result,
         }
-        message = f"{Emoji.success} {caller}({self.pretty_repr(payload)})"
-        self._log(level, message, (), stacklevel=stacklevel)
+        log_args = (
+            Emoji.success,
+            func.__module__,
+            BundleLogger.get_callable_name(func),
+            LazyRepr(payload),
+        )
+        if enabled:
+            self._log(level, "%s %s.%s(%s)", log_args, stacklevel=stacklevel)
+        else:
+            self._capture(level, "%s %s.%s(%s)", log_args)
+
+    def callable_suppressed(
+        self,
+        func: Callable[..., Any],
+        count: int,
+        seconds: float,
+        stacklevel: int = 2,
+        level: Level = Level.DEBUG,
+    ) -> None:
+        """
+        Log how many successful calls were skipped by tracer sampling.
+
+        Args:
+            func: The callable whose success records were suppressed.
+            count: The number of suppressed records.
+            seconds: The time window the records were suppressed in.
+            stacklevel: The stack level for the log record.
+            level: The logging level to use (default: DEBUG).
+        """
+        if self.isEnabledFor(level):
+            self._log(
+                level,
+                "%s %s.%s suppressed %s calls in the last %.0fs",
+                (
+                    Emoji.success,
+                    getattr(func, "__module__", None),
+                    BundleLogger.get_callable_name(func),
+                    f"{count:,}",
+                    seconds,
+                ),
+                stacklevel=stacklevel,
+            )
 
     def callable_exception(
         self,
@@ -165,22 +534,26 @@ class BundleLogger(logging.getLoggerClass()):
             exception: The exception that was raised.
             stacklevel: The stack level for the log record.
             level: The logging level to use (default: ERROR).
+                EXPECTED_EXCEPTION records are logged without traceback.
         """
+        log_args = (
+            Emoji.failed,
+            func.__module__,
+            BundleLogger.get_callable_name(func),
+            LazyRepr(args),
+            LazyRepr(kwargs),
+            LazyText(exception),
+        )
         if self.isEnabledFor(level):
             self._log(
                 level,
                 "%s  %s.%s(%s, %s). Exception: %s",
-                (
-                    Emoji.failed,
-                    func.__module__,
-                    BundleLogger.get_callable_name(func),
-                    args,
-                    kwargs,
-                    exception,
-                ),
-                exc_info=True,
+                log_args,
+                exc_info=level != Level.EXPECTED_EXCEPTION,
                 stacklevel=stacklevel,
             )
+        else:
+            self._capture(level, "%s  %s.%s(%s, %s). Exception: %s", log_args)
 
     def callable_cancel(
         self,
@@ -202,21 +575,24 @@ class BundleLogger(logging.getLoggerClass()):
             stacklevel: The stack level for the log record.
             level: The logging level to use (default: WARNING).
         """
+        log_args = (
+            Emoji.warning,
+            func.__module__,
+            BundleLogger.get_callable_name(func),
+            LazyRepr(args),
+            LazyRepr(kwargs),
+            LazyText(exception),
+        )
         if self.isEnabledFor(level):
             self._log(
                 level,
                 "%s  %s.%s(%s, %s) -> async cancel exception: %s",
-                (
-                    Emoji.warning,
-                    func.__module__,
-                    BundleLogger.get_callable_name(func),
-                    args,
-                    kwargs,
-                    exception,
-                ),
-                exc_info=True,
+                log_args,
+                exc_info=level != Level.EXPECTED_EXCEPTION,
                 stacklevel=stacklevel - 1,
             )
+        else:
+            self._capture(level, "%s  %s.%s(%s, %s) -> async cancel exception: %s", log_args)
 
 
 # Set BundleLogger as the default logger class
@@ -236,6 +612,7 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
             "time": datetime.fromtimestamp(record.created, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": record.created,
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -248,13 +625,250 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(log_record, ensure_ascii=False)
 
 
-def setup_file_handler(log_path: Path, to_json: bool) -> logging.FileHandler:
-    """Set up a file handler for logging."""
+NDJSON_SUFFIX = ".ndjson"
+INDEX_SUFFIX = ".index.ndjson"
+
+
+class _Segment:
+    """The NDJSON segment currently written by a `SegmentedJsonHandler`."""
+
+    __slots__ = ("bytes", "end", "path", "records", "start", "stream")
+
+    def __init__(self, path: Path, created: float) -> None:
+        self.path = path
+        self.stream = open(path, "ab")  # noqa: SIM115 - closed by the handler when the segment rotates
+        self.start = created
+        self.end = created
+        self.records = 0
+        self.bytes = 0
+
+
+class SegmentedJsonHandler(logging.Handler):
+    """
+    Structured log sink writing `JsonFormatter` records as NDJSON segments.
+
+    Records are buffered and written in batches, once `flush_bytes` are pending or every
+    `flush_interval` seconds. The active segment rotates when it exceeds `max_bytes` or
+    spans more than `max_age` seconds. Closed segments are gzip-compressed on a background
+    thread and appended to `<prefix>.index.ndjson` with the time range they cover, so
+    `read_log_window` only opens the segments overlapping the requested window.
+
+    Attributes:
+        directory (Path): Directory holding the segments and the index.
+        prefix (str): Prefix of the segment and index file names.
+        max_bytes (int): Rotate the active segment past this size (uncompressed).
+        max_age (float): Rotate the active segment after this many seconds.
+        flush_bytes (int): Write the buffer once it holds this many bytes.
+        flush_interval (float): Write the buffer at least this often, in seconds.
+        compress (bool): Gzip closed segments.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = "bundle",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age: float = 3600.0,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        compress: bool = True,
+    ) -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.index_path = self.directory / f"{prefix}{INDEX_SUFFIX}"
+        self.setFormatter(JsonFormatter())
+
+        self._segment: _Segment | None = None
+        self._sequence = 0
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._index_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._compress_queue: queue.SimpleQueue[tuple[Path, dict[str, Any]] | None] = queue.SimpleQueue()
+        self._compressor = threading.Thread(target=self._compress_loop, name="bundle-log-compress", daemon=True)
+        self._compressor.start()
+        self._flusher = threading.Thread(target=self._flush_loop, name="bundle-log-flush", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called under the handler lock by Handler.handle
+        try:
+            line = (self.format(record) + "\n").encode("utf-8")
+            segment = self._segment
+            if segment is not None and (segment.bytes >= self.max_bytes or record.created - segment.start >= self.max_age):
+                self._rotate()
+                segment = None
+            if segment is None:
+                segment = self._segment = self._open_segment(record.created)
+            segment.records += 1
+            segment.bytes += len(line)
+            segment.end = max(segment.end, record.created)
+            self._buffer.append(line)
+            self._buffered += len(line)
+            if self._buffered >= self.flush_bytes:
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write the pending records to the active segment."""
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def rotate(self) -> None:
+        """Close the active segment now; the next record opens a new one."""
+        self.acquire()
+        try:
+            self._rotate()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Close the active segment and wait for the pending compressions."""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._flusher.join()
+            self.rotate()
+            self._compress_queue.put(None)
+            self._compressor.join()
+        super().close()
+
+    def _open_segment(self, created: float) -> _Segment:
+        self._sequence += 1
+        stamp = time.strftime("%y.%m.%d.%H.%M.%S", time.localtime(created))
+        name = f"{self.prefix}-{stamp}-{os.getpid()}-{self._sequence:04d}{NDJSON_SUFFIX}"
+        return _Segment(self.directory / name, created)
+
+    def _write_buffer(self) -> None:
+        if self._buffer and self._segment is not None:
+            self._segment.stream.write(b"".join(self._buffer))
+            self._segment.stream.flush()
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _rotate(self) -> None:
+        segment = self._segment
+        if segment is None:
+            return
+        self._write_buffer()
+        segment.stream.close()
+        self._segment = None
+        entry = {
+            "segment": segment.path.name,
+            "start": segment.start,
+            "end": segment.end,
+            "records": segment.records,
+            "bytes": segment.bytes,
+        }
+        if self.compress:
+            self._compress_queue.put((segment.path, entry))
+        else:
+            self._append_index(entry)
+
+    def _append_index(self, entry: dict[str, Any]) -> None:
+        with self._index_lock, open(self.index_path, "a", encoding="utf-8") as index:
+            index.write(json.dumps(entry) + "\n")
+
+    def _compress_loop(self) -> None:
+        while (item := self._compress_queue.get()) is not None:
+            path, entry = item
+            target = path.with_name(path.name + ".gz")
+            try:
+                with open(path, "rb") as source, gzip.open(target, "wb") as compressed:
+                    shutil.copyfileobj(source, compressed)
+                path.unlink()
+                entry["segment"] = target.name
+            except OSError as e:
+                sys.stderr.write(f"bundle: cannot compress log segment {path}: {e}\n")
+                target.unlink(missing_ok=True)
+            self._append_index(entry)
+
+    def _flush_loop(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.acquire()
+            try:
+                self._write_buffer()
+                if self._segment is not None and time.time() - self._segment.start >= self.max_age:
+                    self._rotate()
+            finally:
+                self.release()
+
+
+def read_log_window(
+    directory: Path,
+    start: float | None = None,
+    end: float | None = None,
+    prefix: str = "bundle",
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the records written by a `SegmentedJsonHandler` between two epoch timestamps.
+
+    Closed segments are selected through the index, so only the ones overlapping the window are
+    decompressed; segments not indexed yet (the active ones) are always scanned.
+
+    Args:
+        directory (Path): The directory of the handler.
+        start (float | None): Lower bound of `record["timestamp"]`, inclusive. None for no bound.
+        end (float | None): Upper bound of `record["timestamp"]`, inclusive. None for no bound.
+        prefix (str): The prefix of the handler.
+    """
+    directory = Path(directory)
+    index_path = directory / f"{prefix}{INDEX_SUFFIX}"
+    indexed: set[str] = set()
+    segments: list[Path] = []
+    if index_path.exists():
+        for line in index_path.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            indexed.add(entry["segment"])
+            indexed.add(entry["segment"].removesuffix(".gz"))
+            if (start is None or entry["end"] >= start) and (end is None or entry["start"] <= end):
+                segments.append(directory / entry["segment"])
+    segments += [path for path in sorted(directory.glob(f"{prefix}-*{NDJSON_SUFFIX}")) if path.name not in indexed]
+
+    for path in segments:
+        opener = gzip.open if path.suffix == ".gz" else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as stream:
+                for line in stream:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partially written line of an active segment
+                        continue
+                    timestamp = record.get("timestamp", 0.0)
+                    if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                        yield record
+        except FileNotFoundError:
+            # Compressed and indexed after the directory was listed
+            continue
+
+
+def setup_file_handler(log_path: Path, to_json: bool, json_segments: bool = True) -> logging.Handler:
+    """
+    Set up a file handler for logging.
+
+    JSON logs go to a `SegmentedJsonHandler` (batched, rotated and compressed `.ndjson` segments),
+    or to a single timestamped `.json` file without `json_segments`. Plain-text logs go to a single
+    timestamped `.log` file.
+    """
     try:
         log_path.mkdir(parents=True, exist_ok=True)
     except OSError as e:
         raise ValueError(f"Invalid log path: {log_path}") from e
 
+    if to_json and json_segments:
+        return SegmentedJsonHandler(log_path)
+
     log_file = log_path / f"bundle-{time.strftime('%y.%m.%d.%H.%M.%S')}"
     log_file = log_file.with_suffix(".json" if to_json else ".log")
 
@@ -311,12 +925,123 @@ def setup_console_handler(colored_output: bool) -> logging.Handler:
         return handler
 
 
+class OverflowPolicy(str, Enum):
+    """What a queued logger does when its queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_BELOW_LEVEL = "drop_below_level"
+
+
+class _BundleQueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room instead of failing with queue.Full when stopping on a saturated queue
+        self.queue.put(self._sentinel)
+
+
+class BundleQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler feeding a background QueueListener that owns the real (Rich, file, JSON) handlers,
+    so emitting a record never renders or writes on the caller thread (typically the event loop).
+
+    The message is rendered on the caller thread, as the stdlib handler does: arguments (lazy payloads
+    included) may be mutated by the caller as soon as it returns. Formatting the rest of the record
+    (timestamps, Rich markup, JSON) and writing it run on the listener thread.
+
+    Attributes:
+        overflow (OverflowPolicy): Behaviour when the queue is full.
+        overflow_level (int): With DROP_BELOW_LEVEL, records below this level are dropped
+            when the queue is full, the others block.
+        dropped (int): Number of records dropped so far.
+    """
+
+    def __init__(
+        self,
+        handlers: list[logging.Handler],
+        queue_size: int = 10_000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        overflow_level: int = Level.WARNING,
+    ) -> None:
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.overflow = OverflowPolicy(overflow)
+        self.overflow_level = overflow_level
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self.listener = _BundleQueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+
+    @property
+    def handlers(self) -> tuple[logging.Handler, ...]:
+        """The handlers owned by the listener thread."""
+        return self.listener.handlers
+
+    def _count_drop(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Snapshot the message, the listener lives in this process: keep exc_info for the real handlers to format
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow is OverflowPolicy.BLOCK:
+            self.queue.put(record)
+        elif self.overflow is OverflowPolicy.DROP_OLDEST:
+            while True:
+                try:
+                    self.queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    try:
+                        self.queue.get_nowait()
+                        self._count_drop()
+                    except queue.Empty:
+                        pass
+        elif record.levelno < self.overflow_level:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._count_drop()
+        else:
+            self.queue.put(record)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of dropped and currently queued records."""
+        return {"dropped": self.dropped, "queued": self.queue.qsize()}
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close the owned handlers."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        super().close()
+
+
+_queued_loggers: set[str] = set()
+
+
+def _close_queue_handlers(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        if isinstance(handler, BundleQueueHandler):
+            handler.close()
+
+
 def setup_root_logger(
     name: str | None = None,
     level: int = DEFAULT_LOGGING,
     log_path: Path | None = None,
     colored_output: bool = True,
     to_json: bool = False,
+    json_segments: bool = True,
+    queued: bool = False,
+    queue_size: int = 10_000,
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    overflow_level: int = Level.WARNING,
+    flight_recorder: int | None = None,
 ) -> BundleLogger:
     """
     Configure logging with optional file and console handlers.
@@ -326,7 +1051,16 @@ def setup_root_logger(
         level (int): Logging level. Defaults to DEFAULT_LOGGING.
         log_path (Path | None): Path for log files. If None, skips file logging.
         colored_output (bool): Enable colored console output. Defaults to True.
-        to_json (bool): Format log files as JSON if True. Defaults to False.
+        to_json (bool): Write JSON records instead of a text file. Defaults to False.
+        json_segments (bool): With `to_json`, write rotated, compressed `.ndjson` segments; False keeps
+            the single `.json` file of earlier versions. Defaults to True.
+        queued (bool): Route records through a bounded queue to a background thread
+            owning the console and file handlers. Defaults to False.
+        queue_size (int): Capacity of the queue when `queued`. Defaults to 10000.
+        overflow (OverflowPolicy): Behaviour when the queue is full. Defaults to BLOCK.
+        overflow_level (int): Level below which records are dropped with DROP_BELOW_LEVEL.
+        flight_recorder (int | None): Keep the last N VERBOSE/DEBUG records skipped by `level`, per logger,
+            and emit them when an error is logged. None (default) disables the recorder.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -336,18 +1070,31 @@ def setup_root_logger(
     logger.setLevel(level)
 
     if logger.hasHandlers():
-        # Check if File and Console handlers are already set up
-        for handler in logger.handlers:
-            if isinstance(handler, (logging.FileHandler, RichHandler)):
+        # Check if File, Console and Queue handlers are already set up
+        for handler in list(logger.handlers):
+            if isinstance(handler, (logging.FileHandler, SegmentedJsonHandler, RichHandler, BundleQueueHandler)):
                 logger.removeHandler(handler)
                 handler.close()
 
+    handlers: list[logging.Handler] = []
     if log_path:
-        file_handler = setup_file_handler(log_path, to_json)
-        logger.addHandler(file_handler)
+        handlers.append(setup_file_handler(log_path, to_json, json_segments))
+    handlers.append(setup_console_handler(colored_output))
+
+    if queued:
+        logger.addHandler(BundleQueueHandler(handlers, queue_size, overflow, overflow_level))
+        if logger_name not in _queued_loggers:
+            # Flush pending records on interpreter exit
+            _queued_loggers.add(logger_name)
+            atexit.register(_close_queue_handlers, logger)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
-    console_handler = setup_console_handler(colored_output)
-    logger.addHandler(console_handler)
+    if flight_recorder:
+        install_flight_recorder(logger, capacity=flight_recorder)
+    else:
+        uninstall_flight_recorder(logger)
 
     logger.propagate = False  # Prevent log duplication in root handlers
     return logger
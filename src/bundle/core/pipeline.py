@@ -0,0 +1,364 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Ventilator / workers / sink pipeline over PUSH/PULL sockets, with worker processes.
+
+The ventilator owns one PUSH socket per worker, so it knows which tasks every worker holds:
+a worker gets a task only while it has credit (fewer than `prefetch` tasks in hand), and the
+tasks of a worker that dies are sent again to the others. All workers push their results to a
+single PULL socket, the sink. Tasks are read from their source only when credit is available,
+and results wait in the sink until the consumer asks for them: a fast producer or a slow
+consumer cannot make the pipeline hold more than `window` tasks.
+
+Frames::
+
+    task:   task id (u64) | payload          (a single empty frame stops the worker)
+    result: task id (u64) | status (u8) | payload or error message
+    ready:  slot (u32) | generation (u32)    (sent once by every worker process)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import multiprocessing
+import os
+import struct
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable
+
+import zmq
+
+from . import codec, data, entity, tracer
+from .logger import get_logger
+from .rpc import handler_models
+from .sockets import Socket
+
+log = get_logger(__name__)
+
+_TASK_ID = struct.Struct("<Q")
+_READY = struct.Struct("<II")
+
+# Result status
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# Seconds between two checks of the worker processes while waiting for results
+LIVENESS_INTERVAL = 0.1
+
+# Seconds between two checks of the parent process by an idle worker
+PARENT_CHECK_INTERVAL = 1.0
+
+
+class PipelineError(RuntimeError):
+    """Raised when a task failed in its worker, or killed its workers too many times."""
+
+    def __init__(self, message: str, index: int):
+        super().__init__(message)
+        self.index = index
+
+
+async def _serve(function: Callable, task_type: type[data.Data], task_endpoint: str, sink_endpoint: str, ready: bytes) -> None:
+    async with (
+        Socket.pull().connect(task_endpoint) as tasks,
+        Socket.push().connect(sink_endpoint) as results,
+    ):
+        await results.send(ready)
+        parent = multiprocessing.parent_process()
+        while True:
+            if not await tasks.socket.poll(PARENT_CHECK_INTERVAL * 1000):
+                if parent is not None and not parent.is_alive():
+                    return
+                continue
+            frames = await tasks.socket.recv_multipart()
+            if len(frames) != 2:
+                return
+            task_id, payload = frames
+            try:
+                result = function(codec.decode(task_type, payload))
+                if inspect.isawaitable(result):
+                    result = await result
+                reply = [task_id, bytes((STATUS_OK,)), codec.encode(result)]
+            except Exception as error:
+                reply = [task_id, bytes((STATUS_ERROR,)), f"{type(error).__name__}: {error}".encode()]
+            await results.socket.send_multipart(reply)
+
+
+def _worker_main(function: Callable, task_type: type[data.Data], task_endpoint: str, sink_endpoint: str, ready: bytes) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_serve(function, task_type, task_endpoint, sink_endpoint, ready))
+
+
+@dataclass
+class _Slot:
+    """A worker process and the PUSH socket feeding it."""
+
+    socket: Socket
+    process: Any
+    generation: int
+    ready: bool = False
+    tasks: set[int] = field(default_factory=set)
+
+
+@dataclass
+class _Task:
+    index: int
+    payload: bytes
+    attempts: int = 0
+
+
+class Pipeline(entity.Entity):
+    """
+    Runs a function on `Data` tasks in worker processes, yielding its `Data` results.
+
+    The function must be importable by the worker processes (defined at module level) and
+    annotated like an RPC handler: one `Data` parameter and a `Data` return. It may be a
+    coroutine function.
+
+    Usage:
+        async with Pipeline(function=make_thumbnail, workers=4) as pipeline:
+            async for thumbnail in pipeline.map(ThumbnailTask(path=path) for path in paths):
+                ...
+
+    Attributes:
+        function (Callable): The function run on every task.
+        workers (int): Number of worker processes, the number of CPUs by default.
+        prefetch (int): Tasks a worker holds at once: one running, the others queued.
+        ordered (bool): Yield the results in the order of their tasks, otherwise as they complete.
+        max_retries (int): Times a task is sent again after its worker died, before failing.
+        start_method (str): The multiprocessing start method; the default "spawn" is the only
+            one safe with the ZeroMQ context of this process.
+    """
+
+    function: Callable[[Any], Any]
+    workers: int = data.Field(default_factory=lambda: os.cpu_count() or 1, gt=0)
+    prefetch: int = data.Field(default=2, gt=0)
+    ordered: bool = True
+    max_retries: int = data.Field(default=2, ge=0)
+    start_method: str = "spawn"
+    _task_type: type[data.Data] | None = data.PrivateAttr(default=None)
+    _result_type: type[data.Data] | None = data.PrivateAttr(default=None)
+    _sink: Socket | None = data.PrivateAttr(default=None)
+    _slots: list[_Slot] = data.PrivateAttr(default_factory=list)
+    _next_id: int = data.PrivateAttr(default=0)
+    _restarts: int = data.PrivateAttr(default=0)
+
+    @data.model_validator(mode="after")
+    def _read_models(self) -> Pipeline:
+        self._task_type, self._result_type = handler_models(self.function, "Pipeline function")
+        return self
+
+    @property
+    def window(self) -> int:
+        """Maximum number of tasks read from the source and not yet yielded."""
+        return self.workers * self.prefetch
+
+    @property
+    def restarts(self) -> int:
+        """Worker processes started again after they died."""
+        return self._restarts
+
+    @property
+    def running(self) -> bool:
+        return self._sink is not None
+
+    def _spawn(self, slot_index: int, generation: int) -> _Slot:
+        assert self._sink is not None
+        socket = Socket.push().bind("tcp://127.0.0.1:*")
+        process = multiprocessing.get_context(self.start_method).Process(
+            target=_worker_main,
+            args=(
+                self.function,
+                self._task_type,
+                socket.socket.last_endpoint.decode(),
+                self._sink.socket.last_endpoint.decode(),
+                _READY.pack(slot_index, generation),
+            ),
+            name=f"Pipeline[{self.name}]-{slot_index}",
+            daemon=True,
+        )
+        process.start()
+        return _Slot(socket=socket, process=process, generation=generation)
+
+    @tracer.Sync.decorator.call_raise
+    def start(self) -> Pipeline:
+        """
+        Start the worker processes.
+
+        Raises:
+            RuntimeError: If the pipeline is already running.
+        """
+        if self.running:
+            raise RuntimeError("Pipeline already running")
+        self._sink = Socket.pull().bind("tcp://127.0.0.1:*")
+        self._slots = [self._spawn(index, 0) for index in range(self.workers)]
+        return self
+
+    async def _retire(self, slot: _Slot) -> None:
+        await slot.socket.close()
+        await asyncio.to_thread(slot.process.join, 1.0)
+        if slot.process.is_alive():
+            slot.process.kill()
+            await asyncio.to_thread(slot.process.join)
+
+    async def _replace_dead(self, tasks: dict[int, _Task], retry: deque[int], failed: dict[int, PipelineError]) -> None:
+        """Start a new process for every dead worker, sending its tasks again or failing them."""
+        for index, slot in enumerate(self._slots):
+            if slot.process.is_alive():
+                continue
+            log.warning("Pipeline worker %d exited with %s, restarting it", index, slot.process.exitcode)
+            for task_id in sorted(slot.tasks):
+                task = tasks[task_id]
+                task.attempts += 1
+                if task.attempts > self.max_retries:
+                    del tasks[task_id]
+                    failed[task_id] = PipelineError(f"Task {task.index} killed its worker {task.attempts} times", task.index)
+                else:
+                    retry.append(task_id)
+            await self._retire(slot)
+            self._slots[index] = self._spawn(index, slot.generation + 1)
+            self._restarts += 1
+
+    def _dispatch(self, slot: _Slot, task_id: int, task: _Task) -> bool:
+        try:
+            slot.socket.socket.send_multipart([_TASK_ID.pack(task_id), task.payload], flags=zmq.NOBLOCK)
+        except zmq.Again:
+            # The worker cannot take the task now: it is sent again on the next round, and the
+            # liveness check replaces the worker if it died
+            return False
+        slot.tasks.add(task_id)
+        return True
+
+    def _on_message(self, frames: list[bytes], tasks: dict[int, _Task], done: dict[int, Any]) -> None:
+        if len(frames) == 1 and len(frames[0]) == _READY.size:
+            index, generation = _READY.unpack(frames[0])
+            if index < len(self._slots) and self._slots[index].generation == generation:
+                self._slots[index].ready = True
+            return
+        if len(frames) != 3 or len(frames[0]) != _TASK_ID.size or len(frames[1]) != 1:
+            log.warning("Dropping malformed pipeline result of %d frames", len(frames))
+            return
+        task_id = _TASK_ID.unpack(frames[0])[0]
+        # None for results of an abandoned map, or from a worker declared dead too early
+        task = tasks.pop(task_id, None)
+        if task is None:
+            return
+        for slot in self._slots:
+            slot.tasks.discard(task_id)
+        if frames[1][0] == STATUS_OK:
+            assert self._result_type is not None
+            done[task_id] = codec.decode(self._result_type, frames[2])
+        else:
+            done[task_id] = PipelineError(f"Task {task.index} failed: {frames[2].decode(errors='replace')}", task.index)
+
+    async def map(self, source: Iterable[data.Data] | AsyncIterable[data.Data]) -> AsyncIterator[Any]:
+        """
+        Run the function on every task of `source`, read lazily.
+
+        Yields:
+            The results, in task order when `ordered`, otherwise as they complete.
+
+        Raises:
+            PipelineError: When the result of a failed task is due; the pipeline stays usable.
+            RuntimeError: If the pipeline is not running.
+        """
+        if self._sink is None:
+            raise RuntimeError("Pipeline not running")
+        is_async = isinstance(source, AsyncIterable)
+        iterator: Any = source.__aiter__() if is_async else iter(source)
+        exhausted = False
+        first_id = self._next_id
+        tasks: dict[int, _Task] = {}
+        done: dict[int, Any] = {}
+        retry: deque[int] = deque()
+        next_due = first_id
+        last_check = time.monotonic()
+        sink = self._sink.socket
+        try:
+            while True:
+                # Deliver what is due
+                while done:
+                    if self.ordered:
+                        if next_due not in done:
+                            break
+                        outcome = done.pop(next_due)
+                        next_due += 1
+                    else:
+                        outcome = done.pop(next(iter(done)))
+                    if isinstance(outcome, PipelineError):
+                        raise outcome
+                    yield outcome
+
+                # Spend the credit
+                for slot in self._slots:
+                    while slot.ready and len(slot.tasks) < self.prefetch:
+                        # Tasks sent again are already in the window, new ones need room
+                        if retry:
+                            task_id = retry.popleft()
+                        elif exhausted or len(tasks) + len(done) >= self.window:
+                            break
+                        else:
+                            try:
+                                item = await iterator.__anext__() if is_async else next(iterator)
+                            except (StopIteration, StopAsyncIteration):
+                                exhausted = True
+                                break
+                            task_id = self._next_id
+                            self._next_id += 1
+                            tasks[task_id] = _Task(task_id - first_id, codec.encode(item))
+                        if not self._dispatch(slot, task_id, tasks[task_id]):
+                            retry.appendleft(task_id)
+                            break
+
+                if exhausted and not tasks and not done:
+                    return
+
+                if await sink.poll(LIVENESS_INTERVAL * 1000, zmq.POLLIN):
+                    self._on_message(await sink.recv_multipart(), tasks, done)
+                if time.monotonic() - last_check >= LIVENESS_INTERVAL:
+                    last_check = time.monotonic()
+                    await self._replace_dead(tasks, retry, done)
+        finally:
+            # Results of tasks still in flight are ignored by the next map
+            for slot in self._slots:
+                slot.tasks.difference_update(tasks)
+
+    @tracer.Async.decorator.call_raise
+    async def close(self) -> None:
+        """Stop the workers and close the sockets."""
+        if self._sink is None:
+            return
+        for slot in self._slots:
+            try:
+                slot.socket.socket.send(b"", flags=zmq.NOBLOCK)
+            except zmq.Again:
+                pass
+        await asyncio.gather(*(self._retire(slot) for slot in self._slots))
+        self._slots = []
+        await self._sink.close()
+        self._sink = None
+
+    async def __aenter__(self) -> Pipeline:
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
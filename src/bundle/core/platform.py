@@ -20,15 +20,50 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import os
 import platform
 import sys
 import sysconfig
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, TypeVar
 
-from . import data, tracer
+from . import data, logger, tracer
 from .entity import Entity
-from .process import Process, ProcessError
+from .process import ProcessPool
+
+log = logger.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Seconds before a platform probing command is killed.
+COMMAND_TIMEOUT = 30.0
+
+
+def _default_cache_dir() -> Path:
+    if sys.platform == "win32":
+        return Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "bundle"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "bundle"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "bundle"
+
+
+# Directory of the probed platform facts, one JSON file per machine, OS release and Python build.
+CACHE_DIR = Path(os.environ.get("BUNDLE_PLATFORM_CACHE") or _default_cache_dir())
+
+
+def _outside_loop(func: Callable[[], T]) -> T:
+    """Call `func`, in a worker thread when an event loop is running (probes start their own loop)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return func()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func).result()
 
 
 class ProcessCommand(data.Data):
@@ -45,24 +80,6 @@ class ProcessCommand(data.Data):
     command: str
     result: str = data.Field(default_factory=str)
 
-    @tracer.Async.decorator.call_raise
-    async def run(self):
-        """
-        Execute the shell command asynchronously and store its output in `result`.
-
-        Returns:
-            None
-
-        Raises:
-            ProcessError: If the command execution fails.
-        """
-        proc = Process(name=f"ProcessCommand.{self.name}")
-        try:
-            result = await proc(self.command)
-            self.result = result.stdout.strip().strip('"')
-        except ProcessError:
-            pass
-
 
 class ProcessCommands(data.Data):
     """
@@ -81,11 +98,16 @@ class ProcessCommands(data.Data):
 
         Returns:
             ProcessCommands: The instance with updated results for each command.
+            Commands run with bounded concurrency and are killed after `COMMAND_TIMEOUT` seconds.
         """
         if not self.commands:
             return {}
-        tasks = [cmd.run() for cmd in self.commands]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        pool = ProcessPool(name="ProcessCommands", timeout=COMMAND_TIMEOUT)
+        outcomes = await pool.run([cmd.command for cmd in self.commands])
+        for cmd, outcome in zip(self.commands, outcomes, strict=True):
+            if outcome.ok:
+                assert outcome.result is not None
+                cmd.result = outcome.result.stdout.strip().strip('"')
         return self
 
 
@@ -185,6 +207,10 @@ class Platform(Entity):
     """
     Represents the current platform's system and Python environment information.
 
+    Facts requiring subprocesses (`processor`, `darwin`) are probed on first access and cached
+    on disk in `CACHE_DIR`, keyed by hostname, OS release and Python build. Call `refresh()`
+    (or `bundle platform refresh`) to probe them again.
+
     Attributes:
         system (str): The operating system name (lowercase).
         node (str): The network name (hostname) of the machine.
@@ -211,10 +237,6 @@ class Platform(Entity):
     release: str = data.Field(default=platform.release(), frozen=True)
     version: str = data.Field(default=platform.version(), frozen=True)
     arch: str = data.Field(default=platform.machine(), frozen=True)
-    processor: str = data.Field(
-        default=platform.processor() or os.environ.get("PROCESSOR_IDENTIFIER", ""),
-        frozen=True,
-    )
     python_version: str = data.Field(default=platform.python_version(), frozen=True)
     python_implementation: str = data.Field(default=platform.python_implementation(), frozen=True)
     python_executable: str = data.Field(default=sys.executable, frozen=True)
@@ -224,11 +246,83 @@ class Platform(Entity):
     env: dict = data.Field(default_factory=lambda: dict(os.environ), frozen=True)
     is_64bits: bool = data.Field(default=sys.maxsize > 2**32, frozen=True)
     pid: int = data.Field(default=os.getpid(), frozen=True)
-    uid: None | int = data.Field(default=(os.getuid() if hasattr(os, "getuid") else None), frozen=True)
-    gid: None | int = data.Field(default=(os.getgid() if hasattr(os, "getgid") else None), frozen=True)
+    uid: int | None = data.Field(default=(os.getuid() if hasattr(os, "getuid") else None), frozen=True)
+    gid: int | None = data.Field(default=(os.getgid() if hasattr(os, "getgid") else None), frozen=True)
+
+    _facts: dict[str, Any] | None = data.PrivateAttr(default=None)
+    _darwin: Darwin | None = data.PrivateAttr(default=None)
+
+    @property
+    def cache_path(self) -> Path:
+        """The facts cache file of this machine, keyed by hostname, OS release and Python build."""
+        key = json.dumps(
+            [
+                self.node,
+                self.system,
+                self.release,
+                self.version,
+                self.arch,
+                self.python_executable,
+                self.python_version,
+                self.python_compiler,
+                platform.python_build(),
+            ]
+        )
+        return CACHE_DIR / f"platform-{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
 
-    # Platform-specific attributes
-    darwin: None | Darwin = data.Field(default_factory=Darwin.resolve, frozen=True)
+    def _load_facts(self) -> dict[str, Any]:
+        try:
+            facts = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return facts if isinstance(facts, dict) else {}
+
+    def _store_facts(self, facts: dict[str, Any]) -> None:
+        path = self.cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename: concurrent invocations never read a partial file
+            with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8") as f:
+                json.dump(facts, f)
+            os.replace(f.name, path)
+        except OSError as e:
+            log.debug("Cannot write the platform cache %s: %s", path, e)
+
+    def _fact(self, name: str, probe: Callable[[], Any]) -> Any:
+        """Return a cached fact, probing and storing it on first use."""
+        if self._facts is None:
+            self._facts = self._load_facts()
+        if name not in self._facts:
+            self._facts[name] = _outside_loop(probe)
+            self._store_facts(self._facts)
+        return self._facts[name]
+
+    @data.computed_field
+    @property
+    def processor(self) -> str:
+        """The processor identifier, probed on first use (`uname -p` on POSIX)."""
+        return self._fact("processor", lambda: platform.processor() or os.environ.get("PROCESSOR_IDENTIFIER", ""))
+
+    @data.computed_field
+    @property
+    def darwin(self) -> Darwin:
+        """Darwin-specific information, probed on first use on macOS (empty elsewhere)."""
+        if self._darwin is None:
+            self._darwin = Darwin.model_validate(self._fact("darwin", lambda: Darwin.resolve().model_dump()))
+        return self._darwin
+
+    def refresh(self) -> Platform:
+        """
+        Probe every cached fact again and rewrite the cache file, e.g. after installing Xcode.
+
+        Returns:
+            Platform: The instance, with the new facts.
+        """
+        self._facts = {}
+        self._darwin = None
+        # Probe through the properties: they store the new facts
+        _ = self.processor, self.darwin
+        return self
 
     @property
     def platform_string(self) -> str:
@@ -20,23 +20,249 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import contextlib
+import contextvars
+import os
+import shlex
+import shutil
+import signal
+import subprocess
 import sys
-from typing import Optional
+import tempfile
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
+from functools import wraps
+from pathlib import Path
+from typing import Any, Optional, TextIO, TypeVar
 
 from . import logger, tracer
-from .data import Data, PrivateAttr
+from .data import Data, Field, PrivateAttr
 from .entity import Entity
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
 log = logger.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Seconds a process tree gets to exit after SIGTERM before being killed.
+KILL_GRACE = 2.0
+
+DEFAULT_GROUP = "default"
+
+# Bytes read from a stream of ProcessStream at a time.
+READ_CHUNK_SIZE = 64 * 1024
+
+# A shell command line, or an argv list executed without a shell.
+Command = str | Sequence[str]
+
+# Fill the resource usage fields of every ProcessResult. Always on within a `ResourceCollector`.
+ACCOUNTING = False
+
+
+def command_line(command: Command) -> str:
+    """Return the display form of a command: the shell string itself, or the shell-quoted argv."""
+    return command if isinstance(command, str) else shlex.join(os.fspath(arg) for arg in command)
+
+
+# Executables resolved by `resolve_executable`, by (name, PATH). Misses are not cached: a tool
+# installed later (e.g. by an earlier build step) is found on the next lookup.
+_resolved: dict[tuple[str, str | None], str] = {}
+_RESOLVED_MAX = 256
+
+
+def _which(name: str, path: str | None) -> str | None:
+    key = (name, path)
+    resolved = _resolved.get(key)
+    if resolved is None:
+        resolved = shutil.which(name, path=path)
+        if resolved is not None:
+            if len(_resolved) >= _RESOLVED_MAX:
+                _resolved.clear()
+            _resolved[key] = resolved
+    return resolved
+
+
+def resolve_executable(name: str, path: str | None = None) -> str:
+    """
+    Resolve an executable name on `path` (defaults to the current PATH), caching the lookups that
+    succeed. Names containing a directory are returned unchanged.
+
+    Raises:
+        FileNotFoundError: If the executable cannot be found.
+    """
+    if os.path.dirname(name):
+        return name
+    resolved = _which(name, os.environ.get("PATH") if path is None else path)
+    if resolved is None:
+        raise FileNotFoundError(f"Executable not found on PATH: {name}")
+    return resolved
+
+
+def overlay_environ(overlay: Mapping[str, str]) -> dict[str, str] | None:
+    """
+    Return a copy of the current `os.environ` updated with `overlay`, or None when the overlay
+    changes nothing: the child then inherits the environment without any copy. The check only
+    looks up the overlay keys; a real overlay needs the full copy, the child getting a whole
+    environment block.
+    """
+    environ = os.environ
+    if all(environ.get(key) == value for key, value in overlay.items()):
+        return None
+    return {**environ, **overlay}
+
+
+def _spawn(command: Command, env_overlay: Mapping[str, str] | None, kwargs: dict[str, Any]) -> tuple[Any, tuple[str, ...]]:
+    """Select the spawn function and its positional arguments: a shell for strings, exec for argv lists."""
+    if env_overlay:
+        env = kwargs.get("env")
+        if env is not None:
+            kwargs["env"] = {**env, **env_overlay}
+        elif (merged := overlay_environ(env_overlay)) is not None:
+            kwargs["env"] = merged
+    if isinstance(command, str):
+        return asyncio.create_subprocess_shell, (command,)
+    argv = [os.fspath(arg) for arg in command]
+    if not argv:
+        raise ValueError("Empty argv")
+    env = kwargs.get("env")
+    argv[0] = resolve_executable(argv[0], env.get("PATH") if env is not None else None)
+    return asyncio.create_subprocess_exec, tuple(argv)
+
+
+def _isolate(kwargs: dict[str, Any]) -> None:
+    """Start the child in its own process group so that its whole tree can be signalled."""
+    if sys.platform == "win32":
+        kwargs.setdefault("creationflags", subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        kwargs.setdefault("start_new_session", True)
+
+
+def _signal_tree(process: asyncio.subprocess.Process, force: bool) -> None:
+    """Terminate (or kill with `force`) a child and, when it leads its own process group, its descendants."""
+    if process.returncode is not None:
+        return
+    try:
+        if sys.platform == "win32":
+            flags = ["/T", "/F"] if force else ["/T"]
+            subprocess.run(["taskkill", *flags, "/PID", str(process.pid)], capture_output=True, check=False)
+        elif os.getpgid(process.pid) == process.pid:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            process.kill()
+        else:
+            process.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+# Accounted commands running, each with the RUSAGE_CHILDREN totals at its start.
+_accounted: set[_Accounted] = set()
+_children_lock = threading.Lock()
+_collectors: contextvars.ContextVar[tuple[ResourceCollector, ...]] = contextvars.ContextVar("process_collectors", default=())
+
+
+class _Accounted:
+    """An accounted command: its start time, the children totals at its start and whether it overlapped another."""
+
+    __slots__ = ("baseline", "overlapped", "started_ns")
+
+    def __init__(self, baseline: tuple[float, float, int] | None) -> None:
+        self.baseline = baseline
+        self.overlapped = False
+        self.started_ns = time.perf_counter_ns()
+
+
+def _children_rusage() -> tuple[float, float, int]:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kilobytes on Linux, in bytes on macOS
+    max_rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return usage.ru_utime, usage.ru_stime, max_rss
+
+
+def _accounting_start() -> _Accounted | None:
+    """Register an accounted command about to start, None when accounting is off."""
+    if not ACCOUNTING and not _collectors.get():
+        return None
+    if resource is None:
+        return _Accounted(None)
+    with _children_lock:
+        accounted = _Accounted(_children_rusage())
+        if _accounted:
+            # Children reaped while commands overlap cannot be told apart
+            accounted.overlapped = True
+            for other in _accounted:
+                other.overlapped = True
+        _accounted.add(accounted)
+    return accounted
+
+
+def _accounting_stop(accounted: _Accounted | None) -> None:
+    """Unregister an accounted command, whether it completed or not."""
+    if accounted is not None:
+        with _children_lock:
+            _accounted.discard(accounted)
+
+
+def _accounting_fields(accounted: _Accounted | None, returncode: int) -> dict[str, Any]:
+    """
+    Resource usage of a command that just exited, as ProcessResult fields.
+
+    The children of this process are reaped by asyncio, so their own rusage is not available: CPU
+    times are the RUSAGE_CHILDREN delta over the command, only set when no other accounted command
+    ran meanwhile. RUSAGE_CHILDREN only keeps the largest RSS of all children, so `max_rss_kb` is
+    only set when this command raised it. Unset fields are None.
+    """
+    if accounted is None:
+        return {}
+    fields: dict[str, Any] = {
+        "wall_time_ns": time.perf_counter_ns() - accounted.started_ns,
+        "exit_signal": -returncode if returncode < 0 else None,
+    }
+    if accounted.baseline is not None:
+        with _children_lock:
+            user, system, max_rss = _children_rusage()
+            overlapped = accounted.overlapped
+        if not overlapped:
+            fields["user_time"] = max(user - accounted.baseline[0], 0.0)
+            fields["system_time"] = max(system - accounted.baseline[1], 0.0)
+            if max_rss > accounted.baseline[2]:
+                fields["max_rss_kb"] = max_rss
+    return fields
+
+
+def _collect(name: str, result: ProcessResult) -> None:
+    for collector in _collectors.get():
+        collector.add(name, result)
+
 
 class ProcessResult(Data):
-    """Data class to store the result of a process execution."""
+    """
+    Data class to store the result of a process execution.
+
+    The resource usage fields are only set with accounting on (`ACCOUNTING` or a `ResourceCollector`):
+    wall time in nanoseconds, user/system CPU time of the children in seconds, their max RSS in
+    kilobytes, and the signal that terminated the process (for a shell command, the shell's). CPU
+    times and max RSS stay None when they cannot be attributed to this command alone, e.g. when
+    accounted commands run concurrently.
+    """
 
     command: str
     returncode: int
     stdout: str
     stderr: str
+    stdout_path: str | None = None
+    stderr_path: str | None = None
+    wall_time_ns: int | None = None
+    user_time: float | None = None
+    system_time: float | None = None
+    max_rss_kb: int | None = None
+    exit_signal: int | None = None
 
 
 class ProcessError(Exception):
@@ -56,18 +282,117 @@ class ProcessError(Exception):
         super().__init__("\n".join(parts))
 
 
+class ProcessTimeoutError(ProcessError):
+    """Raised when a process exceeds its timeout; its process tree has been killed."""
+
+    def __init__(self, process: Process | ProcessStream, result: ProcessResult, timeout: float):
+        self.timeout = timeout
+        super().__init__(process, result)
+        self.args = (f"Timed out after {timeout}s{self.args[0]}",)
+
+
+class ResourceCollector(Entity):
+    """
+    Collects the results of the commands run within its context, with their resource usage.
+
+    The context is inherited by the tasks created inside it, so commands run by a `ProcessPool`
+    or gathered coroutines are collected too. Failed and timed out commands are included.
+
+    Usage:
+        with ResourceCollector(name="pybind.build") as collector:
+            await Pybind.build(path)
+        for name, totals in collector.summary().items():
+            print(name, totals["wall_time"], totals["user_time"])
+    """
+
+    _records: list[tuple[str, ProcessResult]] = PrivateAttr(default_factory=list)
+    _tokens: list[contextvars.Token] = PrivateAttr(default_factory=list)
+
+    @property
+    def records(self) -> list[tuple[str, ProcessResult]]:
+        """The (process name, result) pairs in completion order."""
+        return list(self._records)
+
+    def add(self, name: str, result: ProcessResult) -> None:
+        self._records.append((name, result))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregate the records per process name, slowest first.
+
+        Returns:
+            dict[str, dict[str, float]]: Per name: commands, failures, wall_time, user_time and
+            system_time in seconds (of the commands whose usage is known), and the largest max_rss_kb.
+        """
+        totals: dict[str, dict[str, float]] = {}
+        for name, result in self._records:
+            entry = totals.setdefault(
+                name, {"commands": 0, "failures": 0, "wall_time": 0.0, "user_time": 0.0, "system_time": 0.0, "max_rss_kb": 0}
+            )
+            entry["commands"] += 1
+            entry["failures"] += result.returncode != 0
+            entry["wall_time"] += (result.wall_time_ns or 0) / 1e9
+            entry["user_time"] += result.user_time or 0.0
+            entry["system_time"] += result.system_time or 0.0
+            entry["max_rss_kb"] = max(entry["max_rss_kb"], result.max_rss_kb or 0)
+        return dict(sorted(totals.items(), key=lambda item: item[1]["wall_time"], reverse=True))
+
+    def __enter__(self) -> ResourceCollector:
+        self._tokens.append(_collectors.set((*_collectors.get(), self)))
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        _collectors.reset(self._tokens.pop())
+
+
+def usage_h5_option(session: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Add a `--usage-h5` option to an async click command, applied below `tracer.Sync.decorator.call_raise`.
+
+    With the option, the commands run by the command are collected as `session` and saved to that
+    perf_report HDF5 file, also when the command fails. perf_report is only imported then, so that
+    the command does not depend on h5py otherwise.
+    """
+    import rich_click as click
+
+    def decorate(command: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(command)
+        async def run(*args, usage_h5: str | None = None, **kwargs) -> T:
+            if not usage_h5:
+                return await command(*args, **kwargs)
+            from bundle.perf_report.storage import record_process_usage
+
+            with record_process_usage(usage_h5, session):
+                return await command(*args, **kwargs)
+
+        return click.option(
+            "--usage-h5",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help="Save the resource usage of the build commands to this perf_report HDF5 file.",
+        )(run)
+
+    return decorate
+
+
 class Process(Entity):
-    """Asynchronously executes shell commands and captures their output."""
+    """Asynchronously executes shell commands or argv lists and captures their output."""
 
     _process: asyncio.subprocess.Process | None = PrivateAttr(default=None)
 
     @tracer.Async.decorator.call_raise
-    async def __call__(self, command: str, **kwargs) -> ProcessResult:
+    async def __call__(
+        self, command: Command, timeout: float | None = None, env_overlay: Mapping[str, str] | None = None, **kwargs
+    ) -> ProcessResult:
         """
-        Executes a shell command asynchronously and captures the output.
+        Executes a command asynchronously and captures the output.
 
         Args:
-            command (str): The shell command to execute.
+            command (Command): The shell command to execute, or an argv list executed without a shell
+                (the executable is resolved on PATH once and cached).
+            timeout (float | None): Seconds before the process tree is killed. The child is started
+                in its own process group when set. Cancelling the call kills the tree as well.
+            env_overlay (Mapping[str, str] | None): Variables set on top of the inherited environment.
             **kwargs: Additional keyword arguments for subprocess.
 
         Returns:
@@ -75,123 +400,337 @@ class Process(Entity):
 
         Raises:
             ProcessError: If the command execution fails.
+            ProcessTimeoutError: If the command exceeds `timeout`.
         """
-        return await self._internal_call_(command, **kwargs)
+        return await self._internal_call_(command, timeout=timeout, env_overlay=env_overlay, **kwargs)
 
-    async def _internal_call_(self, command: str, **kwargs) -> ProcessResult:
+    async def kill_tree(self, grace: float = KILL_GRACE) -> None:
+        """
+        Terminate the running process tree, killing it if it is still alive after `grace` seconds.
+        """
+        process = self._process
+        if process is None or process.returncode is not None:
+            return
+        _signal_tree(process, force=grace <= 0)
+        try:
+            await asyncio.wait_for(process.wait(), grace or None)
+        except asyncio.TimeoutError:
+            _signal_tree(process, force=True)
+            await process.wait()
 
-        self._process = await tracer.Async.call_raise(
-            asyncio.create_subprocess_shell,
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            **kwargs,
-        )
+    async def _wait(self, awaitable: Awaitable[T], timeout: float | None) -> tuple[T | None, bool]:
+        """
+        Await the output of the running process for at most `timeout` seconds.
 
-        stdout, stderr = await self._process.communicate()
+        Returns:
+            tuple[T | None, bool]: The awaited value (None if the killed tree still holds the pipes open)
+            and whether the timeout expired.
+        """
+        task = asyncio.ensure_future(awaitable)
+        try:
+            done, _ = await asyncio.wait((task,), timeout=timeout)
+        except asyncio.CancelledError:
+            if self._process is not None:
+                _signal_tree(self._process, force=True)
+            task.cancel()
+            raise
+        if done:
+            return task.result(), False
+        await self.kill_tree()
+        try:
+            return await asyncio.wait_for(task, KILL_GRACE), True
+        except asyncio.TimeoutError:
+            return None, True
+
+    async def _internal_call_(
+        self, command: Command, timeout: float | None = None, env_overlay: Mapping[str, str] | None = None, **kwargs
+    ) -> ProcessResult:
+        if timeout is not None:
+            _isolate(kwargs)
+        spawn, args = _spawn(command, env_overlay, kwargs)
+        accounted = _accounting_start()
+        try:
+            self._process = await tracer.Async.call_raise(
+                spawn,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **kwargs,
+            )
+
+            output, timed_out = await self._wait(self._process.communicate(), timeout)
+            stdout, stderr = output or (b"", b"")
+
+            returncode = -1 if self._process.returncode is None else self._process.returncode
+
+            stdout_decoded = stdout.decode("utf-8", errors="replace") if stdout else ""
+            stderr_decoded = stderr.decode("utf-8", errors="replace") if stderr else ""
+
+            # Create the ProcessResult before checking the return code
+            result = ProcessResult.trusted(
+                command=command_line(command),
+                returncode=returncode,
+                stdout=stdout_decoded,
+                stderr=stderr_decoded,
+                **_accounting_fields(accounted, returncode),
+            )
+        finally:
+            _accounting_stop(accounted)
+        if accounted is not None:
+            _collect(self.name, result)
+
+        if timed_out:
+            raise ProcessTimeoutError(self, result, timeout)  # type: ignore[arg-type]
+        if returncode != 0:
+            raise ProcessError(self, result)
 
-        returncode = -1 if self._process.returncode is None else self._process.returncode
+        return result
 
-        stdout_decoded = stdout.decode("utf-8", errors="replace") if stdout else ""
-        stderr_decoded = stderr.decode("utf-8", errors="replace") if stderr else ""
 
-        # Create the ProcessResult before checking the return code
-        result = ProcessResult(
-            command=command,
-            returncode=returncode,
-            stdout=stdout_decoded,
-            stderr=stderr_decoded,
+class CapturePolicy(Data):
+    """
+    How much output `ProcessStream` keeps in memory.
+
+    The first `head_bytes` and the last `tail_bytes` of each stream are kept, the middle is replaced
+    by an omission marker. With `tail_bytes=None` (the default) the whole output is kept.
+    With `spill` the full output is also written to a temporary file, reported in the result
+    when part of the output was omitted (and deleted otherwise). Spill files reported in a result
+    belong to the caller: without `keep_on_success` they are only kept for failed commands.
+
+    Attributes:
+        head_bytes (int): Bytes kept from the start of the output.
+        tail_bytes (int | None): Bytes kept from the end of the output, None for unbounded capture.
+        spill (bool): Whether to write the full output to a file.
+        spill_dir (Path | None): Directory of the spill files, defaults to the system temp directory.
+        keep_on_success (bool): Keep the spill files of a command exiting with code 0.
+    """
+
+    head_bytes: int = Field(default=0, ge=0)
+    tail_bytes: int | None = Field(default=None, ge=0)
+    spill: bool = False
+    spill_dir: Path | None = None
+    keep_on_success: bool = True
+
+    @classmethod
+    def bounded(
+        cls,
+        head_bytes: int = 64 * 1024,
+        tail_bytes: int = 256 * 1024,
+        spill: bool = True,
+        spill_dir: Path | None = None,
+        keep_on_success: bool = True,
+    ) -> CapturePolicy:
+        """Policy for long-running commands: keep the head and tail in memory, spill the rest to disk."""
+        return cls(
+            head_bytes=head_bytes, tail_bytes=tail_bytes, spill=spill, spill_dir=spill_dir, keep_on_success=keep_on_success
         )
 
-        if returncode != 0:
-            raise ProcessError(self, result)
 
-        return result
+class _Capture:
+    """Head buffer, tail ring buffer and optional spill file of one output stream."""
+
+    __slots__ = ("_policy", "head", "omitted", "spill", "tail")
+
+    def __init__(self, policy: CapturePolicy, name: str, suffix: str) -> None:
+        self._policy = policy
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.omitted = 0
+        self.spill = None
+        if policy.spill:
+            # Closed by `close`, which also decides whether the file outlives the command
+            self.spill = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                prefix=f"bundle-{name}-", suffix=suffix, dir=policy.spill_dir, delete=False
+            )
+
+    def write(self, chunk: bytes) -> None:
+        if self.spill is not None:
+            self.spill.write(chunk)
+        policy = self._policy
+        if policy.tail_bytes is None:
+            self.tail += chunk
+            return
+        room = policy.head_bytes - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        self.tail += chunk
+        excess = len(self.tail) - policy.tail_bytes
+        if excess > 0:
+            del self.tail[:excess]
+            self.omitted += excess
+
+    def close(self, keep: bool = True) -> str | None:
+        """Close the spill file and return its path, or None (dropping the file) when nothing was omitted."""
+        if self.spill is None:
+            return None
+        self.spill.close()
+        if not self.omitted or not keep:
+            os.unlink(self.spill.name)
+            return None
+        return self.spill.name
+
+    def text(self, path: str | None) -> str:
+        head = self.head.decode("utf-8", errors="replace")
+        tail = self.tail.decode("utf-8", errors="replace")
+        if not self.omitted:
+            return head + tail
+        where = f", full output in {path}" if path else ""
+        return f"{head}\n... [{self.omitted} bytes omitted{where}] ...\n{tail}"
+
+
+def _write_lines(stream: TextIO, lines: list[str]) -> None:
+    stream.write("".join(lines))
+    stream.flush()
 
 
 class ProcessStream(Process):
-    """Executes a command asynchronously and streams output line by line."""
+    """
+    Executes a command asynchronously and streams its output.
+
+    Output is read in chunks of `READ_CHUNK_SIZE` bytes, decoded incrementally and handed to
+    `callback_stdout_lines`/`callback_stderr_lines` one batch of lines per chunk. The captured
+    output follows the `capture` policy.
+    """
+
+    capture: CapturePolicy = Field(default_factory=CapturePolicy)
 
     @tracer.Async.decorator.call_raise
-    async def __call__(self, command: str, **kwargs) -> ProcessResult:
+    async def __call__(
+        self, command: Command, timeout: float | None = None, env_overlay: Mapping[str, str] | None = None, **kwargs
+    ) -> ProcessResult:
         """
         Executes the command and streams output line by line.
 
         Args:
-            command (str): The shell command to execute.
+            command (Command): The shell command or argv list to execute, see `Process.__call__`.
+            timeout (float | None): Seconds before the process tree is killed, see `Process.__call__`.
+            env_overlay (Mapping[str, str] | None): Variables set on top of the inherited environment.
             **kwargs: Additional keyword arguments for subprocess.
 
         Returns:
-            ProcessResult: Contains return code, accumulated stdout, and stderr.
+            ProcessResult: Contains return code, captured stdout and stderr, and the spill files if any.
 
         Raises:
             ProcessError: If the command execution fails.
+            ProcessTimeoutError: If the command exceeds `timeout`.
         """
-        stdout_lines = []
-        stderr_lines = []
-
         return await self._internal_call_(
             command,
-            stdout_lines,
-            stderr_lines,
+            timeout=timeout,
+            env_overlay=env_overlay,
             **kwargs,
             log_level=logger.Level.VERBOSE,
         )
 
-    async def _internal_call_(self, command: str, stdout_lines: list, stderr_lines: list, **kwargs) -> ProcessResult:  # type: ignore
-        self._process = await tracer.Async.call_raise(
-            asyncio.create_subprocess_shell,
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            **kwargs,
-        )
-
-        assert self._process
-        assert self._process.stdout
-        assert self._process.stderr
-
-        # Create tasks for reading stdout and stderr streams
-        tasks = [
-            self._read_stream(self._process.stdout, self.callback_stdout, stdout_lines),
-            self._read_stream(self._process.stderr, self.callback_stderr, stderr_lines),
-        ]
-
-        # Wait for the process to complete and streams to be read
-        await asyncio.gather(*tasks)
-        await self._process.wait()
-
-        assert self._process.returncode is not None
-
-        returncode = self._process.returncode
-
-        stdout = "".join(stdout_lines)
-        stderr = "".join(stderr_lines)
-
-        result = ProcessResult(command=command, returncode=returncode, stdout=stdout, stderr=stderr)
-
+    async def _internal_call_(
+        self, command: Command, timeout: float | None = None, env_overlay: Mapping[str, str] | None = None, **kwargs
+    ) -> ProcessResult:
+        if timeout is not None:
+            _isolate(kwargs)
+        spawn, args = _spawn(command, env_overlay, kwargs)
+        accounted = _accounting_start()
+        try:
+            self._process = await tracer.Async.call_raise(
+                spawn,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **kwargs,
+            )
+
+            assert self._process
+            assert self._process.stdout
+            assert self._process.stderr
+
+            stdout_capture = _Capture(self.capture, self.name, ".stdout.log")
+            stderr_capture = _Capture(self.capture, self.name, ".stderr.log")
+            keep = self.capture.keep_on_success
+            try:
+                # Wait for the process to complete and streams to be read
+                _, timed_out = await self._wait(self._stream_until_exit(stdout_capture, stderr_capture), timeout)
+                keep = self.capture.keep_on_success or timed_out or self._process.returncode != 0
+            finally:
+                stdout_path = stdout_capture.close(keep)
+                stderr_path = stderr_capture.close(keep)
+
+            assert self._process.returncode is not None
+
+            returncode = self._process.returncode
+
+            result = ProcessResult.trusted(
+                command=command_line(command),
+                returncode=returncode,
+                stdout=stdout_capture.text(stdout_path),
+                stderr=stderr_capture.text(stderr_path),
+                stdout_path=stdout_path,
+                stderr_path=stderr_path,
+                **_accounting_fields(accounted, returncode),
+            )
+        finally:
+            _accounting_stop(accounted)
+        if accounted is not None:
+            _collect(self.name, result)
+
+        if timed_out:
+            raise ProcessTimeoutError(self, result, timeout)  # type: ignore[arg-type]
         if returncode != 0:
             raise ProcessError(self, result)
 
         return result
 
-    async def _read_stream(self, stream: asyncio.StreamReader, handler, accumulator):
+    async def _stream_until_exit(self, stdout_capture: _Capture, stderr_capture: _Capture) -> None:
+        assert self._process and self._process.stdout and self._process.stderr
+        await asyncio.gather(
+            self._read_stream(self._process.stdout, self.callback_stdout_lines, stdout_capture),
+            self._read_stream(self._process.stderr, self.callback_stderr_lines, stderr_capture),
+        )
+        await self._process.wait()
+
+    async def _read_stream(self, stream: asyncio.StreamReader, handler, capture: _Capture):
         """
-        Reads a stream line by line and passes each line to the handler.
+        Reads a stream in chunks and passes the complete lines of each chunk to the handler.
 
         Args:
             stream (asyncio.StreamReader): The stream to read from.
-            handler (callable): The handler function to process each line.
-            accumulator (list): The accumulator list to collect output lines.
+            handler (callable): The handler receiving each batch of lines.
+            capture (_Capture): The capture buffers of the stream.
         """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
         try:
-            async for line in stream:
-                str_line = line.decode("utf-8", errors="replace")
-                accumulator.append(str_line)
-                await handler(str_line)
+            while chunk := await stream.read(READ_CHUNK_SIZE):
+                capture.write(chunk)
+                *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+                lines = [line + "\n" for line in lines]
+                if len(pending) > READ_CHUNK_SIZE:
+                    # Never hold an endless line (progress bars, ...) back
+                    lines.append(pending)
+                    pending = ""
+                if lines:
+                    await handler(lines)
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                await handler([pending])
         except Exception as e:
             log.error(f"Exception while reading stream: {e}")
 
+    async def callback_stdout_lines(self, lines: list[str]):
+        """Default stdout batch handler: forwards `callback_stdout` overrides, else one write to sys.stdout."""
+        if type(self).callback_stdout is not ProcessStream.callback_stdout:
+            for line in lines:
+                await self.callback_stdout(line)
+        else:
+            _write_lines(sys.stdout, lines)
+
+    async def callback_stderr_lines(self, lines: list[str]):
+        """Default stderr batch handler: forwards `callback_stderr` overrides, else one write to sys.stderr."""
+        if type(self).callback_stderr is not ProcessStream.callback_stderr:
+            for line in lines:
+                await self.callback_stderr(line)
+        else:
+            _write_lines(sys.stderr, lines)
+
     async def callback_stdout(self, line: str):
         """Default stdout handler: writes directly to sys.stdout."""
         sys.stdout.write(line)
@@ -201,3 +740,195 @@ class ProcessStream(Process):
         """Default stderr handler: writes directly to sys.stderr."""
         sys.stderr.write(line)
         sys.stderr.flush()
+
+
+class ProcessPoolResult(Data):
+    """
+    Outcome of one command run by a `ProcessPool`.
+
+    Attributes:
+        command (str): The command line, see `command_line`.
+        group (str): The concurrency group of the command.
+        result (ProcessResult | None): The process result, also set on failure and timeout.
+        error (str | None): A short description of the failure, None on success.
+        timed_out (bool): Whether the command was killed on timeout.
+        queue_time_ns (int): Time spent waiting for a free slot, in nanoseconds.
+        wall_time_ns (int): Wall time of the command, in nanoseconds.
+    """
+
+    command: str
+    group: str = DEFAULT_GROUP
+    result: ProcessResult | None = None
+    error: str | None = None
+    timed_out: bool = False
+    queue_time_ns: int = 0
+    wall_time_ns: int = 0
+    _exception: BaseException | None = PrivateAttr(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def raise_for_error(self) -> ProcessResult:
+        """Return the process result, or raise the exception of the failed command."""
+        if self._exception is not None:
+            raise self._exception
+        assert self.result is not None
+        return self.result
+
+
+class ProcessPool(Entity):
+    """
+    Runs commands with bounded concurrency, per-command timeouts and process-tree kill.
+
+    Every command takes a slot of the pool (`max_concurrency`) and, when its group has a limit in
+    `group_limits`, a slot of its group. Commands start in their own process group: on timeout or
+    cancellation the whole tree is terminated.
+
+    Usage:
+        pool = ProcessPool(max_concurrency=8, group_limits={"probe": 2}, timeout=30)
+        result = await pool("uname -a")  # like Process, raises on failure
+        for command in commands:
+            pool.submit(command, group="probe")
+        async for outcome in pool.as_completed():
+            print(outcome.command, outcome.wall_time_ns, outcome.error)
+
+    Attributes:
+        max_concurrency (int): Commands running at the same time, defaults to the CPU count.
+        group_limits (dict[str, int]): Commands of one group running at the same time.
+        timeout (float | None): Default per-command timeout in seconds.
+    """
+
+    max_concurrency: int = Field(default_factory=lambda: os.cpu_count() or 4, ge=1)
+    group_limits: dict[str, int] = Field(default_factory=dict)
+    timeout: float | None = None
+    _loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _slots: asyncio.Semaphore | None = PrivateAttr(default=None)
+    _group_slots: dict[str, asyncio.Semaphore] = PrivateAttr(default_factory=dict)
+    _pending: set[asyncio.Task[ProcessPoolResult]] = PrivateAttr(default_factory=set)
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, group: str) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores belong to one event loop
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._group_slots = {}
+        group_slots = self._group_slots.get(group)
+        if group_slots is None and group in self.group_limits:
+            group_slots = self._group_slots[group] = asyncio.Semaphore(self.group_limits[group])
+        assert self._slots is not None
+        if group_slots is None:
+            async with self._slots:
+                yield
+        else:
+            async with group_slots, self._slots:
+                yield
+
+    async def _run(self, command: Command, group: str, timeout: float | None, kwargs: dict[str, Any]) -> ProcessResult:
+        _isolate(kwargs)
+        process = Process(name=f"{self.name}.{group}")
+        return await process(command, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+    async def __call__(
+        self, command: Command, group: str = DEFAULT_GROUP, timeout: float | None = None, **kwargs
+    ) -> ProcessResult:
+        """
+        Run one command in a slot of the pool.
+
+        Args:
+            command (Command): The shell command or argv list to execute.
+            group (str): The concurrency group of the command.
+            timeout (float | None): Seconds before the process tree is killed, defaults to the pool timeout.
+            **kwargs: Additional keyword arguments for subprocess.
+
+        Raises:
+            ProcessError: If the command execution fails.
+            ProcessTimeoutError: If the command exceeds its timeout.
+        """
+        async with self._slot(group):
+            return await self._run(command, group, timeout, kwargs)
+
+    async def _outcome(self, command: Command, group: str, timeout: float | None, kwargs: dict[str, Any]) -> ProcessPoolResult:
+        submitted = time.perf_counter_ns()
+        async with self._slot(group):
+            started = time.perf_counter_ns()
+            result: ProcessResult | None = None
+            error: str | None = None
+            exception: BaseException | None = None
+            try:
+                result = await self._run(command, group, timeout, kwargs)
+            except ProcessTimeoutError as e:
+                result, error, exception = e.result, f"timed out after {e.timeout}s", e
+            except ProcessError as e:
+                result, error, exception = e.result, f"exit code {e.result.returncode}", e
+            except Exception as e:
+                error, exception = f"{type(e).__name__}: {e}", e
+            finished = time.perf_counter_ns()
+        outcome = ProcessPoolResult.trusted(
+            command=command_line(command),
+            group=group,
+            result=result,
+            error=error,
+            timed_out=isinstance(exception, ProcessTimeoutError),
+            queue_time_ns=started - submitted,
+            wall_time_ns=finished - started,
+        )
+        outcome._exception = exception
+        return outcome
+
+    def submit(
+        self, command: Command, group: str = DEFAULT_GROUP, timeout: float | None = None, **kwargs
+    ) -> asyncio.Task[ProcessPoolResult]:
+        """
+        Schedule a command and return its task. Failures are reported in the `ProcessPoolResult`,
+        cancelling the task kills the process tree.
+        """
+        task = asyncio.ensure_future(self._outcome(command, group, timeout, kwargs))
+        self._pending.add(task)
+        return task
+
+    async def as_completed(self) -> AsyncIterator[ProcessPoolResult]:
+        """Yield the results of the submitted commands as they complete, until none is pending."""
+        while self._pending:
+            done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._pending.discard(task)
+                yield task.result()
+
+    async def map(
+        self, commands: Iterable[Command], group: str = DEFAULT_GROUP, timeout: float | None = None, **kwargs
+    ) -> AsyncIterator[ProcessPoolResult]:
+        """Run `commands` and yield their results as they complete. Leaving the loop early cancels the rest."""
+        tasks = [self.submit(command, group, timeout, **kwargs) for command in commands]
+        self._pending.difference_update(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(
+        self, commands: Iterable[Command], group: str = DEFAULT_GROUP, timeout: float | None = None, **kwargs
+    ) -> list[ProcessPoolResult]:
+        """Run `commands` and return their results in submission order."""
+        tasks = [self.submit(command, group, timeout, **kwargs) for command in commands]
+        self._pending.difference_update(tasks)
+        return list(await asyncio.gather(*tasks))
+
+    async def close(self) -> None:
+        """Cancel the pending commands, killing their process trees."""
+        pending, self._pending = self._pending, set()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __aenter__(self) -> ProcessPool:
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.close()
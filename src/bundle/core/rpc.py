@@ -0,0 +1,416 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Pipelined request/response over DEALER/ROUTER sockets.
+
+Unlike REQ/REP, a client keeps any number of requests in flight: every request carries a
+correlation id, and replies are matched to their call whatever their order. Requests and
+responses are `Data` models encoded with the binary codec (untraced, unlike `Data.encode`).
+
+Frames::
+
+    request: request id (u64) | deadline ms (u32, 0 for none) | method (utf-8) | payload
+    reply:   request id (u64) | status (u8) | payload or error message
+
+The server keeps the routing envelope (every frame before the request) as is, so it can also
+connect to the DEALER backend of a `SocketProxy` whose ROUTER frontend the clients connect to:
+several server processes then share the load of one endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import struct
+import typing
+from typing import Any, Callable, TypeVar
+
+from . import codec, data, entity, tracer
+from .logger import get_logger
+from .sockets import Socket
+
+log = get_logger(__name__)
+
+D = TypeVar("D", bound=data.Data)
+
+_REQUEST_ID = struct.Struct("<Q")
+_DEADLINE = struct.Struct("<I")
+
+# Reply status
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_EXPIRED = 2
+
+
+class RpcError(RuntimeError):
+    """Raised on the client when the server could not handle a request."""
+
+
+class RpcServerMetrics(data.Data):
+    """
+    Load of an `RpcServer`.
+
+    Attributes:
+        queued (int): Requests received and waiting for a worker.
+        max_queued (int): Highest `queued` seen.
+        active (int): Handlers running.
+        completed (int): Requests answered with a response.
+        failed (int): Requests answered with an error.
+        expired (int): Requests whose deadline passed before or while they were handled.
+    """
+
+    queued: int = 0
+    max_queued: int = 0
+    active: int = 0
+    completed: int = 0
+    failed: int = 0
+    expired: int = 0
+
+
+class _Handler(typing.NamedTuple):
+    function: Callable[[Any], Any]
+    request_type: type[data.Data]
+    is_async: bool
+
+
+class _Request(typing.NamedTuple):
+    envelope: list[bytes]
+    request_id: bytes
+    method: str
+    payload: bytes
+    expires: float | None
+
+
+def handler_models(function: Callable, kind: str = "Handler") -> tuple[type[data.Data], type[data.Data]]:
+    """
+    Read the request and response models from the annotations of a handler.
+
+    Args:
+        function (Callable): A function with one parameter annotated with a `Data` subclass and a
+            `Data` subclass as return annotation.
+        kind (str): What the function is, for the error message.
+
+    Returns:
+        tuple[type[Data], type[Data]]: The request model and the response model.
+
+    Raises:
+        TypeError: If the function is not annotated with `Data` models.
+    """
+    hints = typing.get_type_hints(function)
+    parameters = [hints.get(parameter) for parameter in inspect.signature(function).parameters]
+    models = [*parameters, hints.get("return")]
+    if len(parameters) != 1 or not all(isinstance(model, type) and issubclass(model, data.Data) for model in models):
+        raise TypeError(f"{kind} {function.__name__} must take and return Data models")
+    return parameters[0], models[-1]  # type: ignore[return-value]
+
+
+class RpcServer(entity.Entity):
+    """
+    Serves typed handlers on a ROUTER socket, with at most `concurrency` requests handled at once.
+
+    Received requests wait in a queue of `queue_size` entries; when it is full, the server stops
+    reading and requests wait in the socket. A slow handler only holds its own worker. Coroutine
+    handlers run on the event loop, plain functions in worker threads.
+
+    A coroutine handler still running at the request deadline is cancelled. A plain function cannot
+    be: it runs to completion and holds its worker until it returns, after which the request is
+    answered as expired. `concurrency` therefore also bounds the threads in use.
+
+    Usage:
+        server = RpcServer(concurrency=16).bind("tcp://*:5600")
+
+        @server.handler
+        async def add(request: AddRequest) -> AddResponse:
+            return AddResponse(total=request.a + request.b)
+
+        async with server:
+            ...
+
+    Attributes:
+        concurrency (int): Maximum number of requests handled concurrently.
+        queue_size (int): Maximum number of received requests waiting for a worker.
+        socket (Socket): The ROUTER socket.
+    """
+
+    concurrency: int = data.Field(default=64, gt=0)
+    queue_size: int = data.Field(default=1024, gt=0)
+    socket: Socket = data.Field(default_factory=Socket.router)
+    _handlers: dict[str, _Handler] = data.PrivateAttr(default_factory=dict)
+    _queue: asyncio.Queue | None = data.PrivateAttr(default=None)
+    _tasks: list[asyncio.Task] = data.PrivateAttr(default_factory=list)
+    _metrics: RpcServerMetrics = data.PrivateAttr(default_factory=RpcServerMetrics)
+
+    @tracer.Sync.decorator.call_raise
+    def bind(self, endpoint: str) -> RpcServer:
+        """Bind the server socket; returns the instance for method chaining."""
+        self.socket.bind(endpoint)
+        return self
+
+    @tracer.Sync.decorator.call_raise
+    def connect(self, endpoint: str) -> RpcServer:
+        """Connect the server socket, e.g. to the backend of a `SocketProxy`; returns the instance."""
+        self.socket.connect(endpoint)
+        return self
+
+    def handler(self, function: Callable[[D], Any] | None = None, *, name: str | None = None) -> Any:
+        """
+        Register a handler, as a decorator with or without arguments.
+
+        The request and response models are read from the annotations of the handler by
+        `handler_models`.
+
+        Args:
+            function (Callable | None): The handler, a coroutine function or a plain function.
+            name (str | None): The method name, the name of the function by default.
+
+        Raises:
+            TypeError: If the handler is not annotated with `Data` models.
+        """
+
+        def register(function: Callable[[D], Any]) -> Callable[[D], Any]:
+            request_type, _ = handler_models(function)
+            method = name or function.__name__
+            self._handlers[method] = _Handler(function, request_type, inspect.iscoroutinefunction(function))
+            return function
+
+        return register if function is None else register(function)
+
+    @property
+    def metrics(self) -> RpcServerMetrics:
+        """A snapshot of the server load."""
+        metrics = self._metrics.model_copy()
+        metrics.queued = 0 if self._queue is None else self._queue.qsize()
+        return metrics
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def _receive(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        socket = self.socket.socket
+        while True:
+            frames = await socket.recv_multipart()
+            if len(frames) < 5 or len(frames[-3]) != _DEADLINE.size:
+                log.warning("Dropping malformed request of %d frames", len(frames))
+                continue
+            *envelope, request_id, deadline, method, payload = frames
+            deadline_ms = _DEADLINE.unpack(deadline)[0]
+            expires = loop.time() + deadline_ms / 1000 if deadline_ms else None
+            await self._queue.put(_Request(envelope, request_id, method.decode(errors="replace"), payload, expires))
+            self._metrics.max_queued = max(self._metrics.max_queued, self._queue.qsize())
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        socket = self.socket.socket
+        while True:
+            request = await self._queue.get()
+            self._metrics.active += 1
+            try:
+                status, payload = await self._handle(request, loop)
+            finally:
+                self._metrics.active -= 1
+            if status == STATUS_OK:
+                self._metrics.completed += 1
+            elif status == STATUS_EXPIRED:
+                self._metrics.expired += 1
+            else:
+                self._metrics.failed += 1
+            await socket.send_multipart([*request.envelope, request.request_id, bytes((status,)), payload])
+
+    async def _handle(self, request: _Request, loop: asyncio.AbstractEventLoop) -> tuple[int, bytes]:
+        handler = self._handlers.get(request.method)
+        if handler is None:
+            return STATUS_ERROR, f"Unknown method {request.method!r}".encode()
+        remaining = None if request.expires is None else request.expires - loop.time()
+        if remaining is not None and remaining <= 0:
+            return STATUS_EXPIRED, b"Deadline exceeded before handling"
+        try:
+            argument = codec.decode(handler.request_type, request.payload)
+            if handler.is_async:
+                response = await asyncio.wait_for(handler.function(argument), remaining)
+            else:
+                response = await self._call_thread(handler.function, argument, remaining)
+            return STATUS_OK, codec.encode(response)
+        except asyncio.TimeoutError:
+            return STATUS_EXPIRED, b"Deadline exceeded while handling"
+        except Exception as error:
+            log.debug("Handler %s failed: %r", request.method, error)
+            return STATUS_ERROR, f"{type(error).__name__}: {error}".encode()
+
+    @staticmethod
+    async def _call_thread(function: Callable[[Any], Any], argument: data.Data, timeout: float | None) -> Any:
+        """
+        Run a plain handler in a worker thread, waiting at most `timeout` seconds for its result.
+
+        A thread cannot be cancelled: past the timeout the call keeps running, so this waits for it
+        to return before raising `asyncio.TimeoutError`, and the worker slot stays held meanwhile.
+        """
+        call = asyncio.ensure_future(asyncio.to_thread(function, argument))
+        done, _ = await asyncio.wait({call}, timeout=timeout)
+        if done:
+            return call.result()
+        await asyncio.wait({call})
+        # The late result or error is dropped: the request has expired
+        if not call.cancelled():
+            call.exception()
+        raise asyncio.TimeoutError
+
+    @tracer.Sync.decorator.call_raise
+    def start(self) -> RpcServer:
+        """
+        Start receiving and handling requests on the running event loop.
+
+        Raises:
+            RuntimeError: If the server is already running.
+        """
+        if self.running:
+            raise RuntimeError("Server already running")
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.create_task(self._receive())]
+        self._tasks += [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        return self
+
+    @tracer.Async.decorator.call_raise
+    async def stop(self) -> None:
+        """Stop handling requests; queued requests are dropped."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @tracer.Async.decorator.call_raise
+    async def close(self) -> None:
+        await self.stop()
+        await self.socket.close()
+
+    async def __aenter__(self) -> RpcServer:
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+class RpcClient(entity.Entity):
+    """
+    Calls `RpcServer` methods over a DEALER socket, any number of calls being in flight at once.
+
+    Usage:
+        async with RpcClient().connect("tcp://127.0.0.1:5600") as client:
+            responses = await asyncio.gather(
+                *(client.call("add", AddRequest(a=i, b=i), AddResponse, timeout=1.0) for i in range(100))
+            )
+
+    Attributes:
+        socket (Socket): The DEALER socket.
+    """
+
+    socket: Socket = data.Field(default_factory=Socket.dealer)
+    _pending: dict[bytes, asyncio.Future] = data.PrivateAttr(default_factory=dict)
+    _ids: Any = data.PrivateAttr(default_factory=lambda: itertools.count(1))
+    _reader: asyncio.Task | None = data.PrivateAttr(default=None)
+
+    @tracer.Sync.decorator.call_raise
+    def connect(self, endpoint: str) -> RpcClient:
+        """Connect the client socket; returns the instance for method chaining."""
+        self.socket.connect(endpoint)
+        return self
+
+    @property
+    def in_flight(self) -> int:
+        """Calls waiting for their reply."""
+        return len(self._pending)
+
+    def _fail_pending(self, message: str) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RpcError(message))
+        self._pending.clear()
+
+    async def _read(self) -> None:
+        socket = self.socket.socket
+        try:
+            while True:
+                frames = await socket.recv_multipart()
+                if len(frames) != 3 or len(frames[1]) != 1:
+                    log.warning("Dropping malformed reply of %d frames", len(frames))
+                    continue
+                future = self._pending.pop(frames[0], None)
+                # None when the call has already timed out
+                if future is not None and not future.done():
+                    future.set_result((frames[1][0], frames[2]))
+        finally:
+            # Calls without a timeout would otherwise wait for a reader that is gone
+            self._fail_pending("Reply reader stopped")
+
+    async def call(self, method: str, request: data.Data, response_type: type[D], timeout: float | None = None) -> D:
+        """
+        Call a server method. Untraced, so that high call rates are not bound by logging.
+
+        Args:
+            method (str): The method name.
+            request (Data): The request model.
+            response_type (type[D]): The response model of the method.
+            timeout (float | None): Deadline in seconds, also enforced by the server.
+
+        Returns:
+            D: The response.
+
+        Raises:
+            asyncio.TimeoutError: If the deadline passed.
+            RpcError: If the server could not handle the request.
+        """
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+        request_id = _REQUEST_ID.pack(next(self._ids))
+        deadline_ms = 0 if timeout is None else max(1, round(timeout * 1000))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self.socket.socket.send_multipart(
+                [request_id, _DEADLINE.pack(deadline_ms), method.encode(), codec.encode(request)]
+            )
+            status, payload = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        if status == STATUS_OK:
+            return codec.decode(response_type, payload)
+        if status == STATUS_EXPIRED:
+            raise asyncio.TimeoutError(payload.decode())
+        raise RpcError(payload.decode())
+
+    @tracer.Async.decorator.call_raise
+    async def close(self) -> None:
+        """Close the client; calls in flight fail with `RpcError`."""
+        self._fail_pending("Client closed")
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        await self.socket.close()
+
+    async def __aenter__(self) -> RpcClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -21,17 +21,42 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import json
+import math
+import struct
+import tempfile
+import threading
+import time
 from enum import IntEnum
-from typing import ClassVar, Generic, Type, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, ClassVar, Generic, Iterable, Type, TypeVar
 
 import zmq
 import zmq.asyncio
 
 from . import data, entity, tracer
+from .arena import ArenaReader, SharedMemoryArena
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Default payload size from which the shared-memory transport is used, and default arena size.
+SHM_THRESHOLD = 1 << 20
+SHM_ARENA_SIZE = 256 << 20
+
+# Seconds `close` waits for the receivers to release the arena blocks still in use.
+SHM_LINGER = 5.0
+
+# First frame of the messages carrying an arena handle instead of the payload.
+SHM_MAGIC = b"\x00bundle.shm"
+
+# Socket types delivering a message to several peers: a block has a single reader.
+SHM_FANOUT_TYPES = {zmq.SocketType.PUB, zmq.SocketType.XPUB, zmq.SocketType.RADIO}
+
+# Arrays of at least this many bytes are sent tracked: `send_array` awaits until zmq releases their buffer.
+TRACK_THRESHOLD = 1 << 20
 
 DRAFT_SOCKET_TYPES = {
     zmq.SocketType.SERVER,
@@ -51,6 +76,49 @@ class SocketMode(IntEnum):
     CONNECT = 1
 
 
+class SendPolicy(IntEnum):
+    """What a send does when the socket is at its high-water mark."""
+
+    # Wait for room, without limit
+    BLOCK = 0
+    # Wait up to the send timeout, then drop the message
+    DROP = 1
+    # Wait up to the send timeout, then raise `SocketFullError`
+    RAISE = 2
+
+
+class SocketFullError(RuntimeError):
+    """Raised by a send with the RAISE policy when the socket stays at its high-water mark."""
+
+
+class SocketStatistics(data.Data):
+    """
+    Traffic and backpressure counters of a `Socket`.
+
+    Attributes:
+        sent (int): Messages sent.
+        received (int): Messages received.
+        dropped (int): Messages not sent because the socket stayed at its high-water mark.
+        blocked (int): Sends that found the socket at its high-water mark (or without peer).
+        blocked_ns (int): Time spent by those sends waiting for room, in nanoseconds.
+    """
+
+    sent: int = 0
+    received: int = 0
+    dropped: int = 0
+    blocked: int = 0
+    blocked_ns: int = 0
+
+
+class SocketEvent(data.Data):
+    """A connection event of a monitored socket, e.g. CONNECTED, DISCONNECTED or CONNECT_RETRIED."""
+
+    event: str
+    value: int
+    endpoint: str
+    time_ns: int
+
+
 # Define a type variable for the Socket class
 T_Socket = TypeVar("T_Socket", bound="Socket")
 
@@ -68,7 +136,17 @@ class Socket(entity.Entity, Generic[T_Socket]):
     mode: SocketMode = data.Field(default=SocketMode.CONNECT)
     endpoint: str = data.Field(default_factory=str)
     is_closed: bool = False
+    shm_threshold: int | None = None
+    shm_size: int = SHM_ARENA_SIZE
+    shm_local: bool | None = None
+    shm_linger: float = SHM_LINGER
+    send_policy: SendPolicy = SendPolicy.BLOCK
+    send_timeout: float = 0.0
     _socket: zmq.asyncio.Socket | None = data.PrivateAttr(default=None)
+    _arena: SharedMemoryArena | None = data.PrivateAttr(default=None)
+    _arena_reader: ArenaReader | None = data.PrivateAttr(default=None)
+    _raw: zmq.Socket | None = data.PrivateAttr(default=None)
+    _statistics: SocketStatistics = data.PrivateAttr(default_factory=SocketStatistics)
 
     @data.field_validator("type")
     def check_positive(cls, socket_type):
@@ -78,7 +156,9 @@ class Socket(entity.Entity, Generic[T_Socket]):
 
     @data.model_validator(mode="after")
     def instantiate_internal_socket(self) -> Socket:
-        self._socket = self._context.socket(self.type.value)
+        # After-validators also run when an instance is validated as a field of another model
+        if self._socket is None:
+            self._socket = self._context.socket(self.type.value)
         return self
 
     @property
@@ -152,6 +232,124 @@ class Socket(entity.Entity, Generic[T_Socket]):
         self.socket.setsockopt(zmq.SUBSCRIBE, topic)
         return self
 
+    @tracer.Sync.decorator.call_raise
+    def high_water_marks(self: T_Socket, send: int | None = None, receive: int | None = None) -> T_Socket:
+        """
+        Set the high-water marks: the messages queued per peer before sends block or drop.
+
+        They apply to the connections made afterwards: call before `bind` or `connect`.
+
+        Args:
+            send (int | None): SNDHWM, 0 for no limit, None to keep the current value.
+            receive (int | None): RCVHWM, 0 for no limit, None to keep the current value.
+
+        Returns:
+            T_Socket: The current instance for method chaining.
+        """
+        if send is not None:
+            self.socket.sndhwm = send
+        if receive is not None:
+            self.socket.rcvhwm = receive
+        return self
+
+    @tracer.Sync.decorator.call_raise
+    def backpressure(self: T_Socket, policy: SendPolicy, timeout: float = 0.0) -> T_Socket:
+        """
+        Choose what sends do at the high-water mark, see `SendPolicy`.
+
+        PUB and XPUB sockets drop messages at the high-water mark without telling: with the DROP and
+        RAISE policies they refuse them instead, so that drops are counted in `statistics`.
+
+        Args:
+            policy (SendPolicy): Block, drop or raise.
+            timeout (float): Seconds the DROP and RAISE policies wait for room.
+
+        Returns:
+            T_Socket: The current instance for method chaining.
+        """
+        self.send_policy = policy
+        self.send_timeout = timeout
+        if self.type in (zmq.SocketType.PUB, zmq.SocketType.XPUB):
+            self.socket.setsockopt(zmq.XPUB_NODROP, int(policy != SendPolicy.BLOCK))
+        return self
+
+    @property
+    def statistics(self) -> SocketStatistics:
+        """A snapshot of the traffic and backpressure counters."""
+        return self._statistics.model_copy()
+
+    @tracer.Sync.decorator.call_raise
+    def shared_memory(
+        self: T_Socket,
+        threshold: int = SHM_THRESHOLD,
+        size: int = SHM_ARENA_SIZE,
+        local: bool | None = None,
+        linger: float = SHM_LINGER,
+    ) -> T_Socket:
+        """
+        Enable the shared-memory transport on this socket; both peers must enable it.
+
+        Payloads (`send`, `send_array`) of at least `threshold` bytes are copied into a shared-memory
+        arena of `size` bytes and only their handle travels over the socket; the receiver copies them
+        out and releases the block. Other payloads, payloads not fitting in the arena, fan-out socket
+        types (PUB, XPUB, RADIO) and remote peers use the regular transport. `close` waits up to
+        `linger` seconds for the blocks still unread before unlinking the arena.
+
+        A socket resolves the handles it receives only once `shared_memory` is enabled and its peers
+        are local; otherwise handle messages are returned as received.
+
+        Args:
+            threshold (int): Minimum payload size in bytes.
+            size (int): Size of the arena, allocated on the first shared-memory send.
+            local (bool | None): Whether the peers run on this host. None decides from the endpoint:
+                only inproc and ipc endpoints are local, a tcp endpoint needs `local=True`.
+            linger (float): Seconds `close` waits for the receivers.
+
+        Returns:
+            T_Socket: The current instance for method chaining.
+        """
+        self.shm_threshold = threshold
+        self.shm_size = size
+        self.shm_local = local
+        self.shm_linger = linger
+        return self
+
+    def _shm_accepted(self) -> bool:
+        """Whether the shared-memory transport is enabled with local peers, on either side."""
+        if self.shm_threshold is None:
+            return False
+        if self.shm_local is not None:
+            return self.shm_local
+        return self.endpoint.startswith(("inproc://", "ipc://"))
+
+    def _shm_enabled(self) -> bool:
+        return self.type not in SHM_FANOUT_TYPES and self._shm_accepted()
+
+    def _shm_put(self, payload) -> bytes | None:
+        """Place a payload in the arena when the shared-memory transport applies, returning its handle."""
+        if not self._shm_enabled() or memoryview(payload).nbytes < self.shm_threshold:  # type: ignore[operator]
+            return None
+        if self._arena is None:
+            self._arena = SharedMemoryArena(self.shm_size)
+        return self._arena.put(payload)
+
+    def _shm_reader(self) -> ArenaReader:
+        if self._arena_reader is None:
+            self._arena_reader = ArenaReader()
+        return self._arena_reader
+
+    async def _close_arena(self, arena: SharedMemoryArena) -> None:
+        """Unlink the arena once its blocks are read, or after `shm_linger` seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.shm_linger
+        delay = 0.0001
+        while arena.in_use and loop.time() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.01)
+        if arena.in_use:
+            logger.warning("Closing the shared-memory arena %s with %d bytes not read", arena.name, arena.in_use)
+        arena.close()
+
     @tracer.Async.decorator.call_raise
     async def close(self) -> None:
         """
@@ -161,6 +359,13 @@ class Socket(entity.Entity, Generic[T_Socket]):
             return
         await tracer.Async.call_raise(self.socket.close)
         self.is_closed = True
+        self._raw = None
+        if self._arena_reader is not None:
+            self._arena_reader.close()
+        if self._arena is not None:
+            # Queued messages are still delivered after the socket is closed: let their readers finish
+            await self._close_arena(self._arena)
+            self._arena = None
 
     @tracer.Async.decorator.call_raise
     async def send(self, data: bytes) -> None:
@@ -172,8 +377,12 @@ class Socket(entity.Entity, Generic[T_Socket]):
 
         Raises:
             RuntimeError: If the socket is closed.
+            SocketFullError: With the RAISE policy, if the socket stays at its high-water mark.
         """
-        await self.socket.send(data)
+        if self.shm_threshold is not None and (handle := self._shm_put(data)) is not None:
+            await self._send_frames([SHM_MAGIC, handle], handle=handle)
+            return
+        await self._send_frames([data])
 
     @tracer.Async.decorator.call_raise
     async def recv(self) -> bytes:
@@ -185,8 +394,14 @@ class Socket(entity.Entity, Generic[T_Socket]):
 
         Raises:
             RuntimeError: If the socket is closed.
+            ValueError: If a shared-memory handle is invalid.
         """
-        return await self.socket.recv()
+        message = await self.socket.recv()
+        self._statistics.received += 1
+        if message == SHM_MAGIC and self.socket.rcvmore and self._shm_accepted():
+            # Sent through the shared-memory transport: the next frame is the arena handle
+            return self._shm_reader().take(await self.socket.recv())  # type: ignore[return-value]
+        return message
 
     @tracer.Async.decorator.call_raise
     async def send_multipart(self, data: list[bytes]) -> None:
@@ -198,11 +413,12 @@ class Socket(entity.Entity, Generic[T_Socket]):
 
         Raises:
             RuntimeError: If the socket is closed.
+            SocketFullError: With the RAISE policy, if the socket stays at its high-water mark.
         """
         if self.is_closed:
             raise RuntimeError("Cannot send data: Socket is closed.")
 
-        await self.socket.send_multipart(data)
+        await self._send_frames(data)
 
     @tracer.Async.decorator.call_raise
     async def recv_multipart(self) -> list[bytes]:
@@ -214,20 +430,289 @@ class Socket(entity.Entity, Generic[T_Socket]):
 
         Raises:
             RuntimeError: If the socket is closed.
+            ValueError: If a shared-memory handle is invalid.
         """
         if self.is_closed:
             raise RuntimeError("Cannot receive data: Socket is closed.")
 
-        return await self.socket.recv_multipart()
+        frames = await self.socket.recv_multipart()
+        self._statistics.received += 1
+        if len(frames) == 2 and frames[0] == SHM_MAGIC and self._shm_accepted():
+            return [self._shm_reader().take(frames[1])]  # type: ignore[list-item]
+        return frames
+
+    def _raw_socket(self) -> zmq.Socket:
+        """Synchronous shadow of the socket: non-blocking calls without a future per message."""
+        socket = self.socket
+        if self._raw is None:
+            self._raw = zmq.Socket.shadow(socket.underlying)
+        return self._raw
+
+    async def send_many(self, messages: Iterable[bytes], traced: bool = False) -> int:
+        """
+        Send single-frame messages in a batch, in raw mode: no tracing per message, each message
+        is sent with `zmq.NOBLOCK`, and the batch only waits on the event loop while the socket is
+        at its high-water mark, as the send policy allows. Payloads go to zmq as is (no shared-memory
+        transport).
+
+        Args:
+            messages (Iterable[bytes]): The messages to send, consumed lazily.
+            traced (bool): Trace the batch as a single call.
+
+        Returns:
+            int: The number of messages sent, dropped ones excluded.
+
+        Raises:
+            RuntimeError: If the socket is closed.
+            SocketFullError: With the RAISE policy, if the socket stays at its high-water mark.
+        """
+        if traced:
+            return await tracer.Async.call_raise(self._send_many, messages)
+        return await self._send_many(messages)
+
+    async def _send_many(self, messages: Iterable[bytes]) -> int:
+        raw = self._raw_socket()
+        sent = waited = 0
+        try:
+            for message in messages:
+                try:
+                    raw.send(message, zmq.NOBLOCK)
+                    sent += 1
+                except zmq.Again:
+                    # The slow path counts its own messages
+                    if (await self._send_blocked([message], True, False, None))[0]:
+                        waited += 1
+        finally:
+            self._statistics.sent += sent
+        return sent + waited
+
+    async def recv_many(self, max_n: int = 1000, timeout: float | None = None, traced: bool = False) -> list[bytes]:
+        """
+        Receive the messages available, in raw mode: waits for the first one, then drains the socket
+        with `zmq.NOBLOCK` up to `max_n` messages. Each frame is returned as a message: multipart
+        messages are not reassembled, only shared-memory handles are resolved as in `recv`.
+
+        Args:
+            max_n (int): Maximum number of messages returned.
+            timeout (float | None): Seconds to wait for the first message, None to wait forever.
+            traced (bool): Trace the batch as a single call.
+
+        Returns:
+            list[bytes]: The received messages, empty if none arrived within `timeout`.
+
+        Raises:
+            RuntimeError: If the socket is closed.
+            ValueError: If a shared-memory handle is invalid.
+        """
+        if traced:
+            return await tracer.Async.call_raise(self._recv_many, max_n, timeout)
+        return await self._recv_many(max_n, timeout)
+
+    async def _recv_many(self, max_n: int, timeout: float | None) -> list[bytes]:
+        raw = self._raw_socket()
+        poll_timeout = None if timeout is None else int(timeout * 1000)
+        accepted = self._shm_accepted()
+        messages: list[bytes] = []
+        while len(messages) < max_n:
+            try:
+                message = raw.recv(zmq.NOBLOCK)
+                if message == SHM_MAGIC and accepted and raw.rcvmore:
+                    # The handle frame is already queued with the marker
+                    message = self._shm_reader().take(raw.recv(zmq.NOBLOCK))  # type: ignore[assignment]
+                messages.append(message)
+            except zmq.Again:
+                if messages or not await self.socket.poll(poll_timeout, zmq.POLLIN):
+                    break
+        self._statistics.received += len(messages)
+        return messages
+
+    async def _send_frames(
+        self, frames: list, copy: bool = True, track: bool = False, handle: bytes | None = None
+    ) -> zmq.MessageTracker | None:
+        """Send a message under the send policy, updating the counters. Returns its tracker when `track`."""
+        try:
+            tracker = self._raw_socket().send_multipart(frames, zmq.NOBLOCK, copy=copy, track=track)
+        except zmq.Again:
+            return (await self._send_blocked(frames, copy, track, handle))[1]
+        self._statistics.sent += 1
+        return tracker
+
+    async def _send_blocked(
+        self, frames: list, copy: bool, track: bool, handle: bytes | None
+    ) -> tuple[bool, zmq.MessageTracker | None]:
+        """Send a message refused at the high-water mark, waiting for room as the send policy allows."""
+        statistics = self._statistics
+        loop = asyncio.get_running_loop()
+        raw = self._raw_socket()
+        deadline = None if self.send_policy == SendPolicy.BLOCK else loop.time() + self.send_timeout
+        delay = 0.0001
+        start = time.perf_counter_ns()
+        statistics.blocked += 1
+        try:
+            while deadline is None or (remaining := deadline - loop.time()) > 0:
+                if not await self.socket.poll(None if deadline is None else remaining * 1000, zmq.POLLOUT):
+                    continue
+                try:
+                    tracker = raw.send_multipart(frames, zmq.NOBLOCK, copy=copy, track=track)
+                except zmq.Again:
+                    # PUB and XPUB without drops still report POLLOUT at their high-water mark
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 0.01)
+                    continue
+                statistics.sent += 1
+                return True, tracker
+        finally:
+            statistics.blocked_ns += time.perf_counter_ns() - start
+        statistics.dropped += 1
+        if handle is not None and self._arena is not None:
+            self._arena.release(handle)
+        if self.send_policy == SendPolicy.RAISE:
+            raise SocketFullError(f"Socket still at its high-water mark after {self.send_timeout}s")
+        return False, None
+
+    @tracer.Async.decorator.call_raise
+    async def send_array(self, array: np.ndarray, wait: bool | None = None) -> zmq.MessageTracker | None:
+        """
+        Send a numpy array as a header frame (dtype, shape, memory order) and its raw buffer, without copying it.
+
+        C and Fortran contiguous arrays are sent in place, other layouts are made contiguous first.
+        Arrays of at least `TRACK_THRESHOLD` bytes are tracked: the array must not be modified until zmq
+        has released its buffer.
+
+        Args:
+            array (np.ndarray): The array to send. Object arrays are not supported.
+            wait (bool | None): Await the release of a tracked buffer before returning. None waits except
+                on inproc endpoints, where the buffer is only released once the receiver drops its array.
+
+        Returns:
+            zmq.MessageTracker | None: The tracker of a tracked buffer not awaited, see `wait_sent`.
+
+        Raises:
+            ValueError: If the array holds Python objects.
+        """
+        import numpy as np
+
+        if array.dtype.hasobject:
+            raise ValueError("Cannot send arrays of Python objects")
+        order = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+        if order == "C" and not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+        header = json.dumps({"descr": np.lib.format.dtype_to_descr(array.dtype), "shape": array.shape, "order": order}).encode()
+        # The transpose of a Fortran array is C contiguous and exposes the same buffer
+        buffer = array.T if order == "F" else array
+        if self.shm_threshold is not None and (handle := self._shm_put(memoryview(buffer).cast("B"))) is not None:
+            await self._send_frames([SHM_MAGIC, handle, header], handle=handle)
+            return None
+        frames = [header, buffer]
+        if array.nbytes < TRACK_THRESHOLD:
+            await self._send_frames(frames, copy=False)
+            return None
+        tracker = await self._send_frames(frames, copy=False, track=True)
+        if tracker is None:
+            return None
+        if wait is None:
+            wait = not self.endpoint.startswith("inproc://")
+        if not wait:
+            return tracker
+        await self.wait_sent(tracker)
+        return None
+
+    async def monitor(self, events: int = zmq.EVENT_ALL) -> AsyncIterator[SocketEvent]:
+        """
+        Stream the connection events of the socket (connected, disconnected, connect retried, ...).
+
+        The socket is monitored from the first iteration until the loop stops or the socket is closed.
+
+        Args:
+            events (int): Mask of the `zmq.EVENT_*` flags to report.
+
+        Yields:
+            SocketEvent: The events, as they happen.
+        """
+        from zmq.utils.monitor import parse_monitor_message
+
+        monitor = self.socket.get_monitor_socket(events)
+        try:
+            while True:
+                message = parse_monitor_message(await monitor.recv_multipart())
+                event = zmq.Event(message["event"])
+                yield SocketEvent.trusted(
+                    event=event.name or str(event.value),
+                    value=message["value"],
+                    endpoint=message["endpoint"].decode(errors="replace"),
+                    time_ns=time.time_ns(),
+                )
+                if event == zmq.Event.MONITOR_STOPPED:
+                    return
+        finally:
+            if not self.is_closed:
+                self.socket.disable_monitor()
+            monitor.close(linger=0)
+
+    @staticmethod
+    async def wait_sent(tracker: zmq.MessageTracker | None, timeout: float | None = None) -> None:
+        """
+        Wait, without blocking the event loop, until zmq has released a tracked buffer.
+
+        Raises:
+            asyncio.TimeoutError: If the buffer is still in use after `timeout` seconds.
+        """
+        if tracker is None:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        delay = 0.0001
+        while not tracker.done:
+            if deadline is not None and loop.time() >= deadline:
+                raise asyncio.TimeoutError("Tracked buffer still in use")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.01)
+
+    @tracer.Async.decorator.call_raise
+    async def recv_array(self) -> np.ndarray:
+        """
+        Receive an array sent by `send_array`. The array is a view on the received zmq frame, not a copy.
+
+        Returns:
+            np.ndarray: The received array.
+
+        Raises:
+            ValueError: If the message is not an array message, or its shared-memory handle is invalid.
+        """
+        import numpy as np
+
+        frames = await self.socket.recv_multipart(copy=False)
+        self._statistics.received += 1
+        handle = None
+        if len(frames) == 3 and frames[0].bytes == SHM_MAGIC and self._shm_accepted():
+            handle, frames = frames[1].bytes, frames[2:]
+        elif len(frames) != 2:
+            raise ValueError(f"Expected an array message of 2 frames, got {len(frames)}")
+        try:
+            header = json.loads(frames[0].bytes)
+            dtype = np.lib.format.descr_to_dtype(header["descr"])
+            shape, order = tuple(header["shape"]), header["order"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid array header: {e}") from e
+        if handle is not None:
+            # Copy out of the arena so that the block can be reused
+            array = np.empty(shape, dtype=dtype, order=order)
+            buffer = array.T if order == "F" else array
+            self._shm_reader().take(handle, into=memoryview(buffer).cast("B"))
+            return array
+        return np.frombuffer(frames[1].buffer, dtype=dtype).reshape(shape, order=order)
 
     @staticmethod
-    async def proxy(frontend: Socket, backend: Socket) -> None:
+    async def proxy(frontend: Socket, backend: Socket, capture: Socket | None = None, native: bool = False) -> None:
         """
         Asynchronous implementation of a ZeroMQ proxy.
 
         Args:
             frontend (Socket): The frontend socket.
             backend (Socket): The backend socket.
+            capture (Socket | None): Socket receiving a copy of every forwarded message.
+            native (bool): Forward in libzmq from a dedicated thread (`SocketProxy`) instead of a
+                Python poll loop on the event loop. Cancelling the call terminates the proxy.
 
         Raises:
             ValueError: If either socket is closed.
@@ -235,6 +720,10 @@ class Socket(entity.Entity, Generic[T_Socket]):
         if frontend.is_closed or backend.is_closed:
             raise ValueError("Both frontend and backend sockets must be open for proxying.")
 
+        if native:
+            await SocketProxy(frontend=frontend, backend=backend, capture=capture).run()
+            return
+
         poller = zmq.asyncio.Poller()
         poller.register(frontend.socket, zmq.POLLIN)
         poller.register(backend.socket, zmq.POLLIN)
@@ -247,11 +736,15 @@ class Socket(entity.Entity, Generic[T_Socket]):
                 if frontend.socket in events and events[frontend.socket] == zmq.POLLIN:
                     message = await frontend.socket.recv_multipart()
                     await backend.socket.send_multipart(message)
+                    if capture is not None:
+                        await capture.socket.send_multipart(message)
 
                 # Forward messages from backend to frontend
                 if backend.socket in events and events[backend.socket] == zmq.POLLIN:
                     message = await backend.socket.recv_multipart()
                     await frontend.socket.send_multipart(message)
+                    if capture is not None:
+                        await capture.socket.send_multipart(message)
         except asyncio.CancelledError:
             logger.debug("Proxy task was cancelled.")
             raise
@@ -882,3 +1375,365 @@ class Socket(entity.Entity, Generic[T_Socket]):
             +----------------+                +---------------+
         """
         return cls(type=zmq.SocketType.CHANNEL)
+
+
+class ProxyStatistics(data.Data):
+    """
+    Frames and bytes received (in) and sent (out) by each socket of a `SocketProxy`.
+
+    As in libzmq, every frame of a multipart message counts as one message.
+    """
+
+    frontend_messages_in: int = 0
+    frontend_bytes_in: int = 0
+    frontend_messages_out: int = 0
+    frontend_bytes_out: int = 0
+    backend_messages_in: int = 0
+    backend_bytes_in: int = 0
+    backend_messages_out: int = 0
+    backend_bytes_out: int = 0
+
+
+# libzmq sends each proxy counter as a native-endian u64 frame
+_STATISTICS = struct.Struct("=Q")
+
+
+class SocketProxy(entity.Entity):
+    """
+    Forwards messages between two sockets with libzmq's steerable proxy, in a dedicated thread.
+
+    Messages never reach Python: throughput is libzmq's, and the event loop stays free. The
+    sockets belong to the proxy until it is terminated and must not be used meanwhile. The proxy
+    is steered through an inproc REQ/REP control socket, every command being acknowledged: pause,
+    resume, terminate, and query the traffic counters while it runs.
+
+    Pausing stops the proxy thread (libzmq's own PAUSE keeps forwarding up to 4.3.5): messages
+    queue up in the sockets, up to their high-water marks, until `resume` starts a new one.
+
+    Usage:
+        async with SocketProxy(frontend=xsub, backend=xpub, capture=monitor) as proxy:
+            ...
+            stats = await proxy.statistics()
+            print(stats.frontend_messages_in, stats.backend_bytes_out)
+
+    Attributes:
+        frontend (Socket): The frontend socket, e.g. the XSUB of a broker.
+        backend (Socket): The backend socket, e.g. the XPUB of a broker.
+        capture (Socket | None): Socket receiving a copy of every forwarded message (PUB, PUSH, PAIR, ...).
+    """
+
+    frontend: Socket
+    backend: Socket
+    capture: Socket | None = None
+    _thread: threading.Thread | None = data.PrivateAttr(default=None)
+    _control: zmq.asyncio.Socket | None = data.PrivateAttr(default=None)
+    _stopped: asyncio.Future | None = data.PrivateAttr(default=None)
+    _done: asyncio.Future | None = data.PrivateAttr(default=None)
+    _paused: bool = data.PrivateAttr(default=False)
+    _counted: ProxyStatistics = data.PrivateAttr(default_factory=ProxyStatistics)
+    _commands: asyncio.Lock = data.PrivateAttr(default_factory=asyncio.Lock)
+
+    @property
+    def control_endpoint(self) -> str:
+        return f"inproc://bundle.proxy.{self.identifier.index}"
+
+    @property
+    def running(self) -> bool:
+        """True from `start` until the proxy is terminated or fails, pauses included."""
+        return self._done is not None and not self._done.done()
+
+    @property
+    def paused(self) -> bool:
+        return self.running and self._paused
+
+    def _serve(self, loop: asyncio.AbstractEventLoop, ready: threading.Event, stopped: asyncio.Future) -> None:
+        context = zmq.Context.shadow(Socket._context.underlying)
+        # A REP control socket makes libzmq acknowledge every command
+        control = context.socket(zmq.REP)
+        error: BaseException | None = None
+        try:
+            control.bind(self.control_endpoint)
+            ready.set()
+            zmq.proxy_steerable(
+                self.frontend.socket,
+                self.backend.socket,
+                self.capture.socket if self.capture is not None else None,
+                control,
+            )
+        except zmq.ContextTerminated:
+            pass
+        except BaseException as e:
+            # Reported to the awaiting side
+            error = e
+        finally:
+            ready.set()
+            control.close(linger=0)
+            loop.call_soon_threadsafe(self._on_stopped, stopped, error)
+
+    def _on_stopped(self, stopped: asyncio.Future, error: BaseException | None) -> None:
+        if not stopped.done():
+            stopped.set_result(None)
+        if error is not None and self._done is not None and not self._done.done():
+            self._done.set_exception(error)
+
+    def _launch(self) -> None:
+        loop = asyncio.get_running_loop()
+        ready = threading.Event()
+        self._stopped = loop.create_future()
+        self._thread = threading.Thread(
+            target=self._serve, args=(loop, ready, self._stopped), name=f"SocketProxy[{self.name}]", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        self._control = Socket._context.socket(zmq.REQ)
+        self._control.connect(self.control_endpoint)
+
+    async def _halt(self) -> None:
+        """Terminate the proxy thread, if any, and release its control socket."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive() and self._control is not None:
+            await self._command(b"TERMINATE")
+        if self._stopped is not None:
+            await self._stopped
+        self._thread.join()
+        self._thread = None
+        if self._control is not None:
+            self._control.close(linger=0)
+            self._control = None
+
+    @tracer.Sync.decorator.call_raise
+    def start(self) -> SocketProxy:
+        """
+        Start the proxy thread. Must be called from the event loop that awaits the proxy.
+
+        Returns:
+            SocketProxy: The current instance for method chaining.
+
+        Raises:
+            RuntimeError: If the proxy is already running or a socket is closed.
+        """
+        if self.running:
+            raise RuntimeError("Proxy already running")
+        for socket in (self.frontend, self.backend, self.capture):
+            if socket is not None and socket.is_closed:
+                raise RuntimeError("Cannot proxy a closed socket")
+        self._done = asyncio.get_running_loop().create_future()
+        self._paused = False
+        self._counted = ProxyStatistics()
+        self._launch()
+        return self
+
+    async def _command(self, command: bytes) -> list[bytes]:
+        if self._control is None:
+            raise RuntimeError("Proxy not running")
+        # REQ/REP: one command in flight at a time
+        async with self._commands:
+            await self._control.send(command)
+            return await self._control.recv_multipart()
+
+    def _check_running(self) -> None:
+        if not self.running:
+            raise RuntimeError("Proxy not running")
+
+    @tracer.Async.decorator.call_raise
+    async def pause(self) -> None:
+        """Stop forwarding; messages queue up in the sockets until `resume`."""
+        self._check_running()
+        if self._paused:
+            return
+        counted = await self.statistics()
+        await self._halt()
+        self._counted = counted
+        self._paused = True
+
+    @tracer.Async.decorator.call_raise
+    async def resume(self) -> None:
+        """Resume forwarding after `pause`."""
+        self._check_running()
+        if self._paused:
+            self._launch()
+            self._paused = False
+
+    @tracer.Async.decorator.call_raise
+    async def statistics(self) -> ProxyStatistics:
+        """
+        Query the traffic counters of the proxy.
+
+        Returns:
+            ProxyStatistics: Counters since the proxy started, pauses included.
+
+        Raises:
+            RuntimeError: If the proxy is not running.
+        """
+        self._check_running()
+        if self._paused:
+            return self._counted.model_copy()
+        frames = await self._command(b"STATISTICS")
+        counted = self._counted.__dict__
+        values = {
+            name: counted[name] + _STATISTICS.unpack(frame)[0]
+            for name, frame in zip(ProxyStatistics.model_fields, frames, strict=True)
+        }
+        return ProxyStatistics.trusted(**values)
+
+    @tracer.Async.decorator.call_raise
+    async def terminate(self) -> None:
+        """Stop the proxy and wait for its thread; the sockets return to the event loop."""
+        await self._halt()
+        if self._done is not None and not self._done.done():
+            self._done.set_result(None)
+        await self.wait()
+
+    async def wait(self) -> None:
+        """Wait until the proxy is terminated, raising its error if it failed."""
+        if self._done is None:
+            return
+        try:
+            await self._done
+        finally:
+            if self._done.done():
+                await self._halt()
+
+    @tracer.Async.decorator.call_raise
+    async def run(self) -> None:
+        """Start the proxy and wait until it is terminated; cancelling the call terminates it."""
+        self.start()
+        try:
+            await asyncio.shield(self._done)  # type: ignore[arg-type]
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+        await self.wait()
+
+    async def __aenter__(self) -> SocketProxy:
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.terminate()
+
+
+# Patterns and transports measured by `benchmark`
+BENCHMARK_PATTERNS = ("push/pull", "pub/sub", "req/rep")
+BENCHMARK_TRANSPORTS = ("inproc", "ipc", "tcp")
+
+_TIMESTAMP = struct.Struct("<Q")
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    if not sorted_values:
+        return math.nan
+    return sorted_values[round(fraction * (len(sorted_values) - 1))] / 1000
+
+
+async def _warm_up(sender: Socket, receiver: Socket) -> None:
+    """Send probes until one goes through (connection and subscription established), then drain them."""
+    while True:
+        await sender.send_many([b""])
+        if await receiver.recv_many(1, timeout=0.01):
+            break
+    while await receiver.recv_many(timeout=0.05):
+        pass
+
+
+async def benchmark(pattern: str, transport: str, messages: int = 10_000, size: int = 64, batch: int = 256) -> dict[str, float]:
+    """
+    Measure a socket pattern over a transport with the raw batched calls, both ends in this process.
+
+    Every payload starts with its send time: latencies run from send to receive, and are round
+    trips for req/rep. pub/sub drops messages at the high-water mark, see `received`.
+
+    Args:
+        pattern (str): One of `BENCHMARK_PATTERNS`.
+        transport (str): One of `BENCHMARK_TRANSPORTS`.
+        messages (int): Number of messages sent.
+        size (int): Payload size in bytes, at least 8.
+        batch (int): Messages per `send_many`/`recv_many` call.
+
+    Returns:
+        dict[str, float]: Messages received and per second, and the p50/p90/p99 latencies in µs.
+
+    Raises:
+        ValueError: If the pattern or transport is unknown.
+    """
+    if pattern not in BENCHMARK_PATTERNS or transport not in BENCHMARK_TRANSPORTS:
+        raise ValueError(f"Unknown benchmark {pattern} over {transport}")
+    sender_type, receiver_type = {
+        "push/pull": (zmq.SocketType.PUSH, zmq.SocketType.PULL),
+        "pub/sub": (zmq.SocketType.PUB, zmq.SocketType.SUB),
+        "req/rep": (zmq.SocketType.REQ, zmq.SocketType.REP),
+    }[pattern]
+    padding = bytes(max(size - _TIMESTAMP.size, 0))
+
+    def stamped(count: int) -> Iterable[bytes]:
+        for _ in range(count):
+            yield _TIMESTAMP.pack(time.perf_counter_ns()) + padding
+
+    with tempfile.TemporaryDirectory() as directory:
+        endpoint = {
+            "inproc": f"inproc://bundle.benchmark.{entity.Identifier.next().index}",
+            "ipc": f"ipc://{directory}/benchmark.sock",
+            "tcp": "tcp://127.0.0.1:*",
+        }[transport]
+        receiver = Socket(type=receiver_type).bind(endpoint)
+        endpoint = receiver.socket.last_endpoint.decode()
+        sender = Socket(type=sender_type).connect(endpoint)
+        if pattern == "pub/sub":
+            receiver.subscribe()
+        latencies: list[int] = []
+        try:
+            start = time.perf_counter_ns()
+            if pattern == "req/rep":
+                for _ in range(messages):
+                    await sender.send_many(stamped(1))
+                    request = await receiver.recv_many(1)
+                    await receiver.send_many(request)
+                    reply = await sender.recv_many(1)
+                    latencies.append(time.perf_counter_ns() - _TIMESTAMP.unpack_from(reply[0])[0])
+            else:
+                await _warm_up(sender, receiver)
+                start = time.perf_counter_ns()
+
+                async def produce() -> None:
+                    for offset in range(0, messages, batch):
+                        await sender.send_many(stamped(min(batch, messages - offset)))
+                        await asyncio.sleep(0)
+
+                producer = asyncio.create_task(produce())
+                while len(latencies) < messages:
+                    received = await receiver.recv_many(batch, timeout=0.5)
+                    if not received:
+                        break
+                    now = time.perf_counter_ns()
+                    latencies.extend(now - _TIMESTAMP.unpack_from(message)[0] for message in received)
+                await producer
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            await sender.close()
+            await receiver.close()
+
+    latencies.sort()
+    return {
+        "received": len(latencies),
+        "messages_per_second": len(latencies) / (elapsed / 1e9),
+        "p50_us": _percentile(latencies, 0.5),
+        "p90_us": _percentile(latencies, 0.9),
+        "p99_us": _percentile(latencies, 0.99),
+    }
+
+
+# Try me: python -m bundle.core.sockets
+if __name__ == "__main__":
+
+    async def main() -> None:
+        print(f"{'pattern':<11}{'transport':<10}{'msg/s':>12}{'p50 µs':>10}{'p90 µs':>10}{'p99 µs':>10}{'received':>10}")
+        for pattern in BENCHMARK_PATTERNS:
+            for transport in BENCHMARK_TRANSPORTS:
+                results = await benchmark(pattern, transport, messages=2_000 if pattern == "req/rep" else 50_000)
+                print(
+                    f"{pattern:<11}{transport:<10}{results['messages_per_second']:>12,.0f}"
+                    f"{results['p50_us']:>10.1f}{results['p90_us']:>10.1f}{results['p99_us']:>10.1f}"
+                    f"{results['received']:>10}"
+                )
+
+    asyncio.run(main())
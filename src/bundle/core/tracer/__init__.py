@@ -18,11 +18,15 @@
 # under the License.
 import asyncio
 import sys
+import time
 from collections.abc import Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar, cast
 
-from . import logger
+from .. import logger
+from . import executor, metrics, sampling
+from .executor import ExecutionPolicy
+from .sampling import SamplingPolicy
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -76,14 +80,21 @@ class Sync:
 
         log_level = log_level or DEFAULT_LOG_LEVEL
         exc_log_level = exc_log_level or DEFAULT_LOG_EXC_LEVEL
+        start = time.perf_counter_ns() if metrics.ENABLED or sampling.ENABLED else 0
 
         try:
             if asyncio.iscoroutinefunction(func):
                 result = asyncio.run(cast(Coroutine[Any, Any, R], func(*args, **kwargs)))
             else:
                 result = cast(R, func(*args, **kwargs))
-            log.callable_success(func, args, kwargs, result, stacklevel, log_level)
+            elapsed_ns = time.perf_counter_ns() - start if start else 0
+            if start and metrics.ENABLED:
+                metrics.record(func, elapsed_ns)
+            if not sampling.ENABLED or sampling.should_log(func, elapsed_ns, stacklevel, log_level):
+                log.callable_success(func, args, kwargs, result, stacklevel, log_level)
         except Exception as exception:
+            if start and metrics.ENABLED:
+                metrics.record(func, time.perf_counter_ns() - start, error=True)
             if isinstance(exception, asyncio.CancelledError):
                 log.callable_exception(func, args, kwargs, exception, stacklevel, exc_log_level)
             else:
@@ -193,22 +204,37 @@ class Async:
         stacklevel: int = DEFAULT_ASYNC_CALL_STACKLEVEL,  # type: ignore
         log_level: logger.Level | None = None,  # type: ignore
         exc_log_level: logger.Level | None = None,  # type: ignore
+        policy: ExecutionPolicy | None = None,  # type: ignore
         **kwargs: P.kwargs,
     ) -> tuple[R | None, BaseException | None]:
         log_level = log_level if log_level else DEFAULT_LOG_LEVEL
         exc_log_level = exc_log_level if exc_log_level else DEFAULT_LOG_EXC_LEVEL
+        start = time.perf_counter_ns() if metrics.ENABLED or sampling.ENABLED else 0
 
         try:
             if asyncio.iscoroutinefunction(func):
                 result = await func(*args, **kwargs)
             else:
-                result = await asyncio.to_thread(func, *args, **kwargs)
-            log.callable_success(func, args, kwargs, result, stacklevel, log_level)
+                resolved = executor.resolve(func, policy)
+                if resolved is ExecutionPolicy.INLINE:
+                    executor.count(resolved)
+                    result = func(*args, **kwargs)
+                else:
+                    result = await executor.run(resolved, func, *args, **kwargs)
+            elapsed_ns = time.perf_counter_ns() - start if start else 0
+            if start and metrics.ENABLED:
+                metrics.record(func, elapsed_ns)
+            if not sampling.ENABLED or sampling.should_log(func, elapsed_ns, stacklevel, log_level):
+                log.callable_success(func, args, kwargs, result, stacklevel, log_level)
             return cast(R, result), None
         except asyncio.CancelledError as cancel_exception:
+            if start and metrics.ENABLED:
+                metrics.record(func, time.perf_counter_ns() - start, error=True)
             log.callable_exception(func, args, kwargs, cancel_exception, stacklevel, exc_log_level)
             return None, cancel_exception
         except Exception as exception:
+            if start and metrics.ENABLED:
+                metrics.record(func, time.perf_counter_ns() - start, error=True)
             log.callable_cancel(func, args, kwargs, exception, stacklevel, exc_log_level)
             return None, exception
 
@@ -219,6 +245,7 @@ class Async:
         stacklevel: int = DEFAULT_ASYNC_CALL_RAISE_STACKLEVEL,  # type: ignore
         log_level: logger.Level | None = None,  # type: ignore
         exc_log_level: logger.Level | None = None,  # type: ignore
+        policy: ExecutionPolicy | None = None,  # type: ignore
         **kwargs: P.kwargs,
     ) -> R:
         result, exception = await Async.call(
@@ -227,6 +254,7 @@ class Async:
             stacklevel=stacklevel,
             log_level=log_level,
             exc_log_level=exc_log_level,
+            policy=policy,
             **kwargs,
         )
         if exception is not None:
@@ -241,6 +269,7 @@ class Async:
             stacklevel: int = DEFAULT_ASYNC_DECORATOR_CALL_STACKLEVEL,  # type: ignore
             log_level: logger.Level | None = None,  # type: ignore
             exc_log_level: logger.Level | None = None,  # type: ignore
+            policy: ExecutionPolicy | None = None,  # type: ignore
         ) -> Callable[P, Awaitable[tuple[R | None, BaseException | None]]]:
             """
             Decorator that wraps an asynchronous callable to log its outcome.
@@ -258,6 +287,7 @@ class Async:
                         stacklevel=stacklevel,
                         log_level=log_level,
                         exc_log_level=exc_log_level,
+                        policy=policy,
                         **kwargs,
                     )
 
@@ -275,6 +305,7 @@ class Async:
             stacklevel: int = DEFAULT_ASYNC_DECORATOR_CALL_RAISE_STACKLEVEL,  # type: ignore
             log_level: logger.Level | None = None,  # type: ignore
             exc_log_level: logger.Level | None = None,  # type: ignore
+            policy: ExecutionPolicy | None = None,  # type: ignore
         ) -> Callable[P, Awaitable[R]]:
             """
             Decorator that wraps an asynchronous callable to log its outcome.
@@ -293,6 +324,7 @@ class Async:
                         stacklevel=stacklevel,
                         log_level=log_level,
                         exc_log_level=exc_log_level,
+                        policy=policy,
                         **kwargs,
                     )
 
@@ -0,0 +1,214 @@
+# Copyright 2026 HorusElohim
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Execution policies used by `tracer.Async` to run synchronous callables.
+
+Historically every non-coroutine callable went through `asyncio.to_thread`, paying a thread hop
+and a future even for trivial functions. The policy decides where the callable runs instead:
+
+- `INLINE`: directly on the event loop thread (no hop, for cheap callables).
+- `IO_POOL`: a dedicated thread pool sized for blocking I/O.
+- `CPU_POOL`: a dedicated thread pool sized to the number of cores.
+- `PROCESS_POOL`: a process pool for picklable, CPU-heavy callables.
+- `AUTO`: `INLINE` for callables registered as cheap, `IO_POOL` otherwise.
+
+The pools are created lazily, owned by this module and shared by the whole process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ExecutionPolicy(str, Enum):
+    AUTO = "auto"
+    INLINE = "inline"
+    IO_POOL = "io_pool"
+    CPU_POOL = "cpu_pool"
+    PROCESS_POOL = "process_pool"
+
+
+DEFAULT_POLICY = ExecutionPolicy.AUTO
+
+_CPU_COUNT = os.cpu_count() or 1
+
+_pool_sizes: dict[ExecutionPolicy, int] = {
+    ExecutionPolicy.IO_POOL: min(32, _CPU_COUNT + 4),
+    ExecutionPolicy.CPU_POOL: _CPU_COUNT,
+    ExecutionPolicy.PROCESS_POOL: _CPU_COUNT,
+}
+_pools: dict[ExecutionPolicy, Executor] = {}
+_pools_lock = threading.Lock()
+
+_counters: dict[ExecutionPolicy, int] = {
+    ExecutionPolicy.INLINE: 0,
+    ExecutionPolicy.IO_POOL: 0,
+    ExecutionPolicy.CPU_POOL: 0,
+    ExecutionPolicy.PROCESS_POOL: 0,
+}
+_counters_lock = threading.Lock()
+
+# Callables known to be cheap enough to run on the event loop thread under the AUTO policy.
+_inline_callables: set[Any] = {json.dumps, json.loads}
+
+
+def _target(func: Callable[..., Any]) -> Any:
+    """Return the underlying function of bound methods so registration applies to every instance."""
+    return getattr(func, "__func__", func)
+
+
+def mark_inline(func: F) -> F:
+    """
+    Register a callable as cheap so the AUTO policy runs it inline.
+    Usable as a decorator; bound methods register their underlying function.
+    """
+    _inline_callables.add(_target(func))
+    return func
+
+
+def is_inline(func: Callable[..., Any]) -> bool:
+    """Return True if the callable has been registered as cheap."""
+    try:
+        return _target(func) in _inline_callables
+    except TypeError:
+        # Unhashable callables cannot be registered
+        return False
+
+
+def resolve(func: Callable[..., Any], policy: ExecutionPolicy | None = None) -> ExecutionPolicy:
+    """
+    Resolve the concrete policy for a callable.
+
+    Args:
+        func: The synchronous callable about to be executed.
+        policy: The requested policy. Defaults to DEFAULT_POLICY.
+
+    Returns:
+        ExecutionPolicy: One of INLINE, IO_POOL, CPU_POOL or PROCESS_POOL.
+    """
+    policy = policy or DEFAULT_POLICY
+    if policy is ExecutionPolicy.AUTO:
+        return ExecutionPolicy.INLINE if is_inline(func) else ExecutionPolicy.IO_POOL
+    return policy
+
+
+def get_pool(policy: ExecutionPolicy) -> Executor:
+    """Return the shared executor backing a pool policy, creating it on first use."""
+    pool = _pools.get(policy)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(policy)
+        if pool is None:
+            max_workers = _pool_sizes[policy]
+            if policy is ExecutionPolicy.PROCESS_POOL:
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"bundle-{policy.value}")
+            _pools[policy] = pool
+    return pool
+
+
+def configure(
+    io_workers: int | None = None,
+    cpu_workers: int | None = None,
+    process_workers: int | None = None,
+) -> None:
+    """
+    Resize the shared pools. Pools already created are shut down without waiting and
+    recreated with the new size on next use.
+
+    Args:
+        io_workers: Number of threads of the IO pool.
+        cpu_workers: Number of threads of the CPU pool.
+        process_workers: Number of processes of the process pool.
+    """
+    sizes = {
+        ExecutionPolicy.IO_POOL: io_workers,
+        ExecutionPolicy.CPU_POOL: cpu_workers,
+        ExecutionPolicy.PROCESS_POOL: process_workers,
+    }
+    with _pools_lock:
+        for policy, size in sizes.items():
+            if size is None:
+                continue
+            if size < 1:
+                raise ValueError(f"{policy.value} size must be >= 1, got {size}")
+            _pool_sizes[policy] = size
+            pool = _pools.pop(policy, None)
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down every pool created so far."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def count(policy: ExecutionPolicy) -> None:
+    """Increment the dispatch counter of a concrete policy."""
+    with _counters_lock:
+        _counters[policy] += 1
+
+
+def stats() -> dict[str, int]:
+    """Return how many synchronous calls were dispatched to each policy."""
+    with _counters_lock:
+        return {policy.value: value for policy, value in _counters.items()}
+
+
+def reset_stats() -> None:
+    """Reset the dispatch counters."""
+    with _counters_lock:
+        for policy in _counters:
+            _counters[policy] = 0
+
+
+async def run(policy: ExecutionPolicy, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a synchronous callable in the pool of the given (already resolved) policy.
+
+    Thread pools propagate the current context like `asyncio.to_thread`;
+    the process pool requires `func` and its arguments to be picklable.
+    """
+    count(policy)
+    if policy is ExecutionPolicy.INLINE:
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    if policy is ExecutionPolicy.PROCESS_POOL:
+        call = partial(func, *args, **kwargs)
+    else:
+        call = partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_pool(policy), call)
@@ -0,0 +1,304 @@
+# Copyright 2026 HorusElohim
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+In-process call metrics for tracer-wrapped callables.
+
+When enabled, `tracer.Sync.call` and `tracer.Async.call` record for every qualified callable the
+number of calls, the number of errors and a log-bucketed latency histogram. Each thread writes
+into its own accumulators without locking; `snapshot()` merges them on demand.
+
+The histogram uses 4 sub-buckets per power of two starting at 2**10 ns (~1µs), so percentiles
+are estimated with at most 25% relative error.
+
+Recording is off by default. Enable it with `metrics.enable()` or by setting the
+`BUNDLE_TRACER_METRICS` environment variable to `1`/`true`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .. import logger
+
+log = logger.get_logger(__name__)
+
+ENABLED = os.getenv("BUNDLE_TRACER_METRICS", "false").lower() in {"1", "true"}
+
+MIN_EXPONENT = 10
+MAX_EXPONENT = 40
+SUB_BUCKETS = 4
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT) * SUB_BUCKETS + 2
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def enable(flag: bool = True) -> None:
+    """Turn metrics recording on (or off with `flag=False`)."""
+    global ENABLED
+    ENABLED = flag
+
+
+def disable() -> None:
+    """Turn metrics recording off. Already recorded values are kept."""
+    enable(False)
+
+
+def bucket_index(duration_ns: int) -> int:
+    """Return the histogram bucket of a duration. Bucket 0 holds everything below 2**MIN_EXPONENT ns."""
+    if duration_ns < 1 << MIN_EXPONENT:
+        return 0
+    exponent = duration_ns.bit_length() - 1
+    if exponent >= MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub = (duration_ns >> (exponent - 2)) & (SUB_BUCKETS - 1)
+    return (exponent - MIN_EXPONENT) * SUB_BUCKETS + sub + 1
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Return the exclusive upper bound in ns of a histogram bucket (inf for the overflow bucket)."""
+    if index == 0:
+        return float(1 << MIN_EXPONENT)
+    if index >= BUCKET_COUNT - 1:
+        return float("inf")
+    exponent, sub = divmod(index - 1, SUB_BUCKETS)
+    exponent += MIN_EXPONENT
+    return float((1 << exponent) + (sub + 1) * (1 << (exponent - 2)))
+
+
+class _Accumulator:
+    """Per-thread counters of one callable. Only the owning thread writes to it."""
+
+    __slots__ = ("buckets", "calls", "errors", "max_ns", "name", "total_ns")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKET_COUNT
+
+
+_local = threading.local()
+_thread_tables: list[dict[Any, _Accumulator]] = []
+_thread_tables_lock = threading.Lock()
+
+
+def _table() -> dict[Any, _Accumulator]:
+    table = getattr(_local, "table", None)
+    if table is None:
+        table = _local.table = {}
+        with _thread_tables_lock:
+            _thread_tables.append(table)
+    return table
+
+
+def qualified_name(func: Callable[..., Any]) -> str:
+    """Return the `module.qualname` used as metric key for a callable."""
+    module = getattr(func, "__module__", None) or "<unknown>"
+    return f"{module}.{logger.BundleLogger.get_callable_name(func)}"
+
+
+def record(func: Callable[..., Any], duration_ns: int, error: bool = False) -> None:
+    """
+    Record one call of `func` in the accumulators of the current thread.
+
+    Args:
+        func: The traced callable.
+        duration_ns: The wall time of the call in nanoseconds.
+        error: Whether the call raised.
+    """
+    key = getattr(func, "__func__", func)
+    table = _table()
+    try:
+        accumulator = table.get(key)
+    except TypeError:
+        # Unhashable callable: fall back to its name
+        key = qualified_name(func)
+        accumulator = table.get(key)
+    if accumulator is None:
+        accumulator = table[key] = _Accumulator(qualified_name(func))
+    accumulator.calls += 1
+    if error:
+        accumulator.errors += 1
+    accumulator.total_ns += duration_ns
+    if duration_ns > accumulator.max_ns:
+        accumulator.max_ns = duration_ns
+    accumulator.buckets[bucket_index(duration_ns)] += 1
+
+
+@dataclass
+class CallableMetrics:
+    """Merged metrics of one qualified callable."""
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * BUCKET_COUNT)
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the q-th percentile (0-100) in ns from the histogram.
+        Returns the upper bound of the bucket reaching the rank, capped by the observed max.
+        """
+        if not self.calls:
+            return 0.0
+        rank = max(1, round(q / 100 * self.calls))
+        seen = 0
+        for index, value in enumerate(self.buckets):
+            seen += value
+            if seen >= rank:
+                return min(bucket_upper_bound(index), float(self.max_ns))
+        return float(self.max_ns)
+
+    @property
+    def p50_ns(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p90_ns(self) -> float:
+        return self.percentile(90)
+
+    @property
+    def p99_ns(self) -> float:
+        return self.percentile(99)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ns": self.mean_ns,
+            "p50_ns": self.p50_ns,
+            "p90_ns": self.p90_ns,
+            "p99_ns": self.p99_ns,
+            "max_ns": self.max_ns,
+        }
+
+
+def snapshot() -> dict[str, CallableMetrics]:
+    """Merge the accumulators of every thread into one `CallableMetrics` per qualified callable."""
+    with _thread_tables_lock:
+        tables = list(_thread_tables)
+    merged: dict[str, CallableMetrics] = {}
+    for table in tables:
+        for accumulator in list(table.values()):
+            metrics = merged.get(accumulator.name)
+            if metrics is None:
+                metrics = merged[accumulator.name] = CallableMetrics(name=accumulator.name)
+            metrics.calls += accumulator.calls
+            metrics.errors += accumulator.errors
+            metrics.total_ns += accumulator.total_ns
+            metrics.max_ns = max(metrics.max_ns, accumulator.max_ns)
+            for index, value in enumerate(accumulator.buckets):
+                if value:
+                    metrics.buckets[index] += value
+    return merged
+
+
+def reset() -> None:
+    """Drop every recorded value."""
+    with _thread_tables_lock:
+        for table in _thread_tables:
+            table.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(prefix: str = "bundle_tracer") -> str:
+    """
+    Render the current snapshot in the Prometheus text exposition format.
+
+    Latencies are exported as a histogram in seconds, with one bucket per power of two.
+    """
+    lines = [
+        f"# HELP {prefix}_calls_total Calls of tracer-wrapped callables.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    metrics = sorted(snapshot().values(), key=lambda m: m.name)
+    for m in metrics:
+        lines.append(f'{prefix}_calls_total{{callable="{_escape_label(m.name)}"}} {m.calls}')
+    lines += [
+        f"# HELP {prefix}_errors_total Calls of tracer-wrapped callables that raised.",
+        f"# TYPE {prefix}_errors_total counter",
+    ]
+    for m in metrics:
+        lines.append(f'{prefix}_errors_total{{callable="{_escape_label(m.name)}"}} {m.errors}')
+    lines += [
+        f"# HELP {prefix}_latency_seconds Latency of tracer-wrapped callables.",
+        f"# TYPE {prefix}_latency_seconds histogram",
+    ]
+    for m in metrics:
+        label = _escape_label(m.name)
+        cumulative = m.buckets[0]
+        lines.append(f'{prefix}_latency_seconds_bucket{{callable="{label}",le="{(1 << MIN_EXPONENT) / 1e9:.9g}"}} {cumulative}')
+        for exponent in range(MIN_EXPONENT, MAX_EXPONENT):
+            first = (exponent - MIN_EXPONENT) * SUB_BUCKETS + 1
+            cumulative += sum(m.buckets[first : first + SUB_BUCKETS])
+            le = (1 << (exponent + 1)) / 1e9
+            lines.append(f'{prefix}_latency_seconds_bucket{{callable="{label}",le="{le:.9g}"}} {cumulative}')
+        lines.append(f'{prefix}_latency_seconds_bucket{{callable="{label}",le="+Inf"}} {m.calls}')
+        lines.append(f'{prefix}_latency_seconds_sum{{callable="{label}"}} {m.total_ns / 1e9:.9g}')
+        lines.append(f'{prefix}_latency_seconds_count{{callable="{label}"}} {m.calls}')
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.verbose(format, *args)
+
+
+def serve(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Enable recording and expose `/metrics` on a background HTTP server thread,
+    for processes without their own web server.
+
+    Returns:
+        ThreadingHTTPServer: The running server, stop it with `shutdown()`.
+    """
+    enable()
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="bundle-tracer-metrics", daemon=True)
+    thread.start()
+    log.info("Tracer metrics exposed on http://%s:%d/metrics", host, server.server_address[1])
+    return server
@@ -0,0 +1,275 @@
+# Copyright 2026 HorusElohim
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Sampling and rate limiting of tracer success logging.
+
+A `SamplingPolicy` decides which successful calls of a callable are logged:
+
+- `every_n`: log the first call and then one call out of N.
+- `max_per_second`: log at most K calls per second.
+- `slow_threshold_ns`: always log calls at least this slow, regardless of the other limits.
+
+Skipped calls are counted and reported by a single summary line per callable
+("suppressed 12,345 calls in the last 10s") every `summary_interval` seconds. The summary is
+written by the next call of the callable; a background thread writes it when the callable went
+quiet, and the pending summaries are flushed at exit. Exceptions are never sampled.
+
+Usage:
+    # Process-wide default
+    tracer.sampling.set_default(tracer.SamplingPolicy(max_per_second=10, slow_threshold_ns=50_000_000))
+
+    # Per callable
+    @tracer.Async.decorator.call_raise
+    @tracer.sampling.sample(every_n=1000)
+    async def on_keepalive(message): ...
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .. import logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+log = logger.get_logger("bundle.core.tracer")
+
+# True as soon as a default or a per-callable policy is set; checked on every traced call.
+ENABLED = False
+
+# Seconds between two checks for the summaries of callables that went quiet.
+SUMMARY_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    every_n: int | None = None
+    max_per_second: int | None = None
+    slow_threshold_ns: int | None = None
+    summary_interval: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.every_n is not None and self.every_n < 1:
+            raise ValueError(f"every_n must be >= 1, got {self.every_n}")
+        if self.max_per_second is not None and self.max_per_second < 0:
+            raise ValueError(f"max_per_second must be >= 0, got {self.max_per_second}")
+        if self.summary_interval <= 0:
+            raise ValueError(f"summary_interval must be > 0, got {self.summary_interval}")
+
+
+class _State:
+    """Sampling counters of one callable, updated under `lock` by the threads calling it."""
+
+    __slots__ = ("calls", "last_call", "level", "lock", "second", "second_logged", "suppressed", "window_start")
+
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.last_call = now
+        self.level = logger.Level.DEBUG
+        self.second = int(now)
+        self.second_logged = 0
+        self.suppressed = 0
+        self.window_start = now
+
+    def take_summary(self, now: float) -> tuple[int, float]:
+        """Return the suppressed count and the window length, and start a new window. Call under `lock`."""
+        suppressed, elapsed = self.suppressed, now - self.window_start
+        self.suppressed = 0
+        self.window_start = now
+        return suppressed, elapsed
+
+
+_default: SamplingPolicy | None = None
+_policies: dict[Any, SamplingPolicy] = {}
+_states: dict[Any, tuple[Callable[..., Any], _State]] = {}
+_lock = threading.Lock()
+_summarizer: threading.Thread | None = None
+
+
+def _key(func: Callable[..., Any]) -> Any:
+    key = getattr(func, "__func__", func)
+    try:
+        hash(key)
+    except TypeError:
+        return id(key)
+    return key
+
+
+def _refresh() -> None:
+    global ENABLED, _summarizer
+    ENABLED = _default is not None or bool(_policies)
+    with _lock:
+        if ENABLED and (_summarizer is None or not _summarizer.is_alive()):
+            _summarizer = threading.Thread(target=_summarize_quiet, name="bundle-tracer-sampling", daemon=True)
+            _summarizer.start()
+
+
+def _summarize_quiet() -> None:
+    """Write the summaries of the callables not called since their interval elapsed, while sampling is on."""
+    while ENABLED:
+        time.sleep(SUMMARY_CHECK_INTERVAL)
+        now = time.monotonic()
+        with _lock:
+            entries = list(_states.items())
+        for key, (func, state) in entries:
+            policy = _policies.get(key, _default)
+            if policy is None:
+                continue
+            with state.lock:
+                # A callable still called writes its own summary
+                if not state.suppressed or now - state.last_call < max(policy.summary_interval, SUMMARY_CHECK_INTERVAL):
+                    continue
+                suppressed, elapsed = state.take_summary(now)
+                level = state.level
+            log.callable_suppressed(func, suppressed, elapsed, logger.BASE_STACKLEVEL, level)
+
+
+def set_default(policy: SamplingPolicy | None) -> None:
+    """Set (or clear with None) the policy applied to every callable without its own policy."""
+    global _default
+    _default = policy
+    _refresh()
+
+
+def set_policy(func: Callable[..., Any], policy: SamplingPolicy | None) -> None:
+    """Set (or clear with None) the policy of one callable. Bound methods apply to their function."""
+    with _lock:
+        if policy is None:
+            _policies.pop(_key(func), None)
+        else:
+            _policies[_key(func)] = policy
+    _refresh()
+
+
+def sample(
+    every_n: int | None = None,
+    max_per_second: int | None = None,
+    slow_threshold_ns: int | None = None,
+    summary_interval: float = 10.0,
+) -> Callable[[F], F]:
+    """Decorator registering a `SamplingPolicy` for the decorated callable. Apply it below the tracer decorator."""
+    policy = SamplingPolicy(
+        every_n=every_n,
+        max_per_second=max_per_second,
+        slow_threshold_ns=slow_threshold_ns,
+        summary_interval=summary_interval,
+    )
+
+    def decorator(func: F) -> F:
+        set_policy(func, policy)
+        return func
+
+    return decorator
+
+
+def reset() -> None:
+    """Clear every policy and counter."""
+    global _default
+    with _lock:
+        _default = None
+        _policies.clear()
+        _states.clear()
+    _refresh()
+
+
+def should_log(func: Callable[..., Any], duration_ns: int, stacklevel: int, level: logger.Level) -> bool:
+    """
+    Decide whether the successful call of `func` is logged, and emit the pending
+    suppression summary of `func` when its interval has elapsed.
+
+    Args:
+        func: The traced callable.
+        duration_ns: The wall time of the call in nanoseconds.
+        stacklevel: The stack level used by the caller for the success record.
+        level: The level of the success record.
+
+    Returns:
+        bool: True if the success record must be logged, or captured by a flight recorder.
+    """
+    if not log.isEnabledFor(level):
+        # Not sampled: a flight recorder keeps every skipped success as context
+        return log.is_recorded(level)
+    key = _key(func)
+    policy = _policies.get(key, _default)
+    if policy is None:
+        return True
+
+    now = time.monotonic()
+    entry = _states.get(key)
+    if entry is None:
+        with _lock:
+            entry = _states.setdefault(key, (func, _State(now)))
+    state = entry[1]
+    suppressed = 0
+    with state.lock:
+        state.calls += 1
+        state.last_call = now
+        state.level = level
+
+        if policy.slow_threshold_ns is not None and duration_ns >= policy.slow_threshold_ns:
+            keep = True
+        else:
+            keep = policy.every_n is None or (state.calls - 1) % policy.every_n == 0
+            if keep and policy.max_per_second is not None:
+                second = int(now)
+                if second != state.second:
+                    state.second = second
+                    state.second_logged = 0
+                keep = state.second_logged < policy.max_per_second
+
+        if keep:
+            if policy.max_per_second is not None:
+                state.second_logged += 1
+        else:
+            state.suppressed += 1
+
+        if now - state.window_start >= policy.summary_interval:
+            suppressed, elapsed = state.take_summary(now)
+    if suppressed:
+        log.callable_suppressed(func, suppressed, elapsed, stacklevel + 1, level)
+    return keep
+
+
+def flush(level: logger.Level | None = None) -> None:
+    """
+    Emit the pending suppression summaries of every callable, e.g. before shutdown; also run at exit.
+
+    Args:
+        level: The level of the summaries, by default the level of the last success record of each callable.
+    """
+    now = time.monotonic()
+    with _lock:
+        entries = list(_states.values())
+    for func, state in entries:
+        with state.lock:
+            suppressed, elapsed = state.take_summary(now)
+            summary_level = state.level if level is None else level
+        if suppressed:
+            log.callable_suppressed(func, suppressed, elapsed, logger.BASE_STACKLEVEL, summary_level)
+
+
+# Registered after `logging`, so run before its handlers are shut down
+atexit.register(flush)
@@ -56,9 +56,18 @@ def discord():
     default="!",
     help="Command prefix (or set DISCORD_BOT_PREFIX).",
 )
+@click.option(
+    "--metrics-port",
+    envvar="BUNDLE_METRICS_PORT",
+    type=int,
+    default=None,
+    help="Expose tracer metrics for Prometheus on this port (or set BUNDLE_METRICS_PORT).",
+)
 @tracer.Sync.decorator.call_raise
-async def start(bot_name: str | None, token: str | None, prefix: str):
+async def start(bot_name: str | None, token: str | None, prefix: str, metrics_port: int | None):
     """Start the Discord bot."""
+    if metrics_port:
+        tracer.metrics.serve(metrics_port)
     bot_name = (bot_name or os.environ.get("DISCORD_BOT_NAME") or "Bundle Bot").strip() or "Bundle Bot"
     if not token:
         token = os.environ.get("DISCORD_BOT_TOKEN")
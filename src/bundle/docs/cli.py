@@ -33,6 +33,7 @@ from pathlib import Path
 import rich_click as click
 
 from bundle.core import logger, tracer
+from bundle.core.process import usage_h5_option
 
 log = logger.get_logger(__name__)
 
@@ -73,6 +74,7 @@ async def docs():
     help="Sphinx HTML theme.",
 )
 @tracer.Sync.decorator.call_raise
+@usage_h5_option("docs.build")
 async def build(source: str, output: str, package: str | None, theme: str):
     """Build HTML documentation from docstrings and READMEs."""
     from bundle.docs.builder import DocsBuilder
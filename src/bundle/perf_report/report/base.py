@@ -40,6 +40,8 @@ from bundle.core.platform import platform_info
 from bundle.latex import Document, Figure, Section, Table, escape
 from bundle.latex.elements import Column
 
+from ..storage.base import get_platform_id, get_platform_meta
+
 LOGGER = logger.setup_root_logger(name=__name__)
 
 MAX_PARALLEL_ASYNC = 20
@@ -153,24 +155,6 @@ def safe_key(v: str) -> str:
     return v.replace("+", "_").replace("/", "_").replace("\\", "_")
 
 
-def get_platform_id() -> str:
-    return f"{platform_info.system}-{platform_info.arch}-{platform_info.python_implementation}{platform_info.python_version}"
-
-
-def get_platform_meta() -> dict:
-    return {
-        "system": platform_info.system,
-        "arch": platform_info.arch,
-        "node": platform_info.node,
-        "release": platform_info.release,
-        "processor": platform_info.processor,
-        "python_version": platform_info.python_version,
-        "python_implementation": platform_info.python_implementation,
-        "python_compiler": platform_info.python_compiler,
-        "is_64bits": str(platform_info.is_64bits),
-    }
-
-
 def truncate_labels(labels: list[str], max_len: int = 50) -> list[str]:
     return [la if len(la) <= max_len else "..." + la[-(max_len - 3) :] for la in labels]
 
@@ -18,4 +18,5 @@
 # under the License.
 
 from .cprofile import CProfileStorage
+from .process import ProcessUsageRecord, ProcessUsageStorage, record_process_usage
 from .tracy import ProfileStorage
@@ -24,6 +24,7 @@ from __future__ import annotations
 import time
 from pathlib import Path
 
+from ...core.platform import platform_info
 from ...hdf5 import Store
 
 # Max byte lengths for fixed-size string columns in the structured array
@@ -41,6 +42,24 @@ def run_prefix(version: str, platform_id: str) -> str:
     return f"{safe_key(version)}/{safe_key(platform_id)}"
 
 
+def get_platform_id() -> str:
+    return f"{platform_info.system}-{platform_info.arch}-{platform_info.python_implementation}{platform_info.python_version}"
+
+
+def get_platform_meta() -> dict:
+    return {
+        "system": platform_info.system,
+        "arch": platform_info.arch,
+        "node": platform_info.node,
+        "release": platform_info.release,
+        "processor": platform_info.processor,
+        "python_version": platform_info.python_version,
+        "python_implementation": platform_info.python_implementation,
+        "python_compiler": platform_info.python_compiler,
+        "is_64bits": str(platform_info.is_64bits),
+    }
+
+
 def write_meta(
     store: Store,
     prefix: str,
@@ -77,8 +77,9 @@ class CProfileStorage:
         prefix = run_prefix(bundle_version, platform_id)
 
         with Store(self.h5_path, mode=mode) as store:
-            if store.has(prefix):
-                del store.file[prefix]
+            # Replace the profiles of this run, keep the process sessions stored next to them
+            if store.has(f"{prefix}/profiles"):
+                del store.file[f"{prefix}/profiles"]
 
             write_meta(store, prefix, machine_id, bundle_version, platform_id, platform_meta)
 
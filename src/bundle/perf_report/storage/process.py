@@ -0,0 +1,229 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""HDF5 storage for the resource usage of external commands (build steps, tools)."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ...core.logger import get_logger
+from ...core.process import ResourceCollector
+from ...hdf5 import Store
+from .base import (
+    MAX_FILE_LEN,
+    MAX_NAME_LEN,
+    get_platform_id,
+    get_platform_meta,
+    list_platforms,
+    list_versions,
+    load_meta,
+    run_prefix,
+    safe_key,
+    write_meta,
+)
+
+log = get_logger(__name__)
+
+
+@dataclass
+class ProcessUsageRecord:
+    """Resource usage of one command. Unknown values are None."""
+
+    name: str
+    command: str
+    returncode: int
+    wall_time: float | None
+    user_time: float | None
+    system_time: float | None
+    max_rss_kb: int | None
+    exit_signal: int | None
+
+
+def _process_dtype() -> np.dtype:
+    """Structured dtype for a single command record. Unknown times are NaN, unknown integers -1."""
+    return np.dtype(
+        [
+            ("name", f"S{MAX_NAME_LEN}"),
+            ("command", f"S{MAX_FILE_LEN}"),
+            ("returncode", "i4"),
+            ("wall_time", "f8"),
+            ("user_time", "f8"),
+            ("system_time", "f8"),
+            ("max_rss_kb", "i8"),
+            ("exit_signal", "i4"),
+        ]
+    )
+
+
+def _time(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _known_time(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
+
+
+def _known_int(value: int) -> int | None:
+    return None if value < 0 else int(value)
+
+
+class ProcessUsageStorage:
+    """Store and retrieve command resource usage in HDF5, keyed by version, platform and session.
+
+    A session is one collected run, e.g. ``pybind.build``. Sessions are stored next to the
+    profiles of the same version and platform.
+
+    HDF5 layout::
+
+        /<version>/<platform_id>/meta                (attrs: machine_id, platform_id, bundle_version, timestamp)
+        /<version>/<platform_id>/processes/<session> (structured dataset)
+    """
+
+    def __init__(self, h5_path: Path | str):
+        self.h5_path = Path(h5_path)
+
+    def save(
+        self,
+        session: str,
+        records: list[ProcessUsageRecord],
+        machine_id: str,
+        bundle_version: str,
+        platform_id: str,
+        platform_meta: dict | None = None,
+    ):
+        """Write the records of a session under /<version>/<platform_id>/processes/, replacing the session."""
+        mode = "a" if self.h5_path.exists() else "w"
+        prefix = run_prefix(bundle_version, platform_id)
+
+        with Store(self.h5_path, mode=mode) as store:
+            write_meta(store, prefix, machine_id, bundle_version, platform_id, platform_meta)
+            records_array = np.array(
+                [
+                    (
+                        r.name.encode("utf-8", errors="replace")[:MAX_NAME_LEN],
+                        r.command.encode("utf-8", errors="replace")[:MAX_FILE_LEN],
+                        r.returncode,
+                        _time(r.wall_time),
+                        _time(r.user_time),
+                        _time(r.system_time),
+                        -1 if r.max_rss_kb is None else r.max_rss_kb,
+                        -1 if r.exit_signal is None else r.exit_signal,
+                    )
+                    for r in records
+                ],
+                dtype=_process_dtype(),
+            )
+            store.write_dataset(f"{prefix}/processes/{safe_key(session)}", records_array)
+
+    def list_versions(self) -> list[str]:
+        return list_versions(self.h5_path)
+
+    def list_platforms(self, version: str) -> list[str]:
+        return list_platforms(self.h5_path, version)
+
+    def load_meta(self, version: str, platform_id: str) -> dict:
+        return load_meta(self.h5_path, version, platform_id)
+
+    def list_sessions(self, version: str, platform_id: str) -> list[str]:
+        group = f"{run_prefix(version, platform_id)}/processes"
+        with Store(self.h5_path, mode="r") as store:
+            if not store.has(group):
+                return []
+            return store.list_datasets(group)
+
+    def load_session(self, version: str, platform_id: str, session: str) -> list[ProcessUsageRecord]:
+        """Load the records of one session, slowest first."""
+        dataset_path = f"{run_prefix(version, platform_id)}/processes/{safe_key(session)}"
+        with Store(self.h5_path, mode="r") as store:
+            if not store.has(dataset_path):
+                return []
+            arr = store.read_dataset(dataset_path)
+        records = [
+            ProcessUsageRecord(
+                name=row["name"].decode("utf-8", errors="replace"),
+                command=row["command"].decode("utf-8", errors="replace"),
+                returncode=int(row["returncode"]),
+                wall_time=_known_time(row["wall_time"]),
+                user_time=_known_time(row["user_time"]),
+                system_time=_known_time(row["system_time"]),
+                max_rss_kb=_known_int(row["max_rss_kb"]),
+                exit_signal=_known_int(row["exit_signal"]),
+            )
+            for row in arr
+        ]
+        records.sort(key=lambda r: r.wall_time or 0.0, reverse=True)
+        return records
+
+    @classmethod
+    def from_collector(
+        cls,
+        collector: ResourceCollector,
+        h5_path: Path,
+        session: str,
+        bundle_version: str | None = None,
+    ) -> ProcessUsageStorage:
+        """Save the commands of a `ResourceCollector` for the current machine and platform."""
+        from bundle import version as current_version
+
+        records = [
+            ProcessUsageRecord(
+                name=name,
+                command=result.command,
+                returncode=result.returncode,
+                wall_time=None if result.wall_time_ns is None else result.wall_time_ns / 1e9,
+                user_time=result.user_time,
+                system_time=result.system_time,
+                max_rss_kb=result.max_rss_kb,
+                exit_signal=result.exit_signal,
+            )
+            for name, result in collector.records
+        ]
+        platform_meta = get_platform_meta()
+        storage = cls(h5_path)
+        storage.save(
+            session,
+            records,
+            platform_meta["node"],
+            bundle_version or current_version,
+            get_platform_id(),
+            platform_meta,
+        )
+        return storage
+
+
+@contextlib.contextmanager
+def record_process_usage(h5_path: str | Path, session: str) -> Iterator[ResourceCollector]:
+    """
+    Collect the commands run within the context and save them as `session` to `h5_path`, also when
+    the context fails.
+    """
+    collector = ResourceCollector(name=session)
+    try:
+        with collector:
+            yield collector
+    finally:
+        ProcessUsageStorage.from_collector(collector, Path(h5_path), session)
+        log.info("Command resource usage saved to %s", h5_path)
@@ -193,7 +193,13 @@ class PodManager(Entity):
         if pod.service:
             cmd = f"{cmd} {pod.service}"
         runner: process.Process | process.ProcessStream
-        runner = process.ProcessStream(name="Pods.compose.stream") if stream else process.Process(name="Pods.compose")
+        if stream:
+            # Image builds can run for hours: keep head and tail in memory, the full log on disk until it succeeds
+            runner = process.ProcessStream(
+                name="Pods.compose.stream", capture=process.CapturePolicy.bounded(keep_on_success=False)
+            )
+        else:
+            runner = process.Process(name="Pods.compose")
         return await runner(cmd, cwd=str(cwd))
 
     # -- High-level operations --
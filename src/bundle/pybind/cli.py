@@ -27,6 +27,7 @@ import multiprocessing
 import rich_click as click
 
 from bundle.core import logger, tracer
+from bundle.core.process import usage_h5_option
 from bundle.pybind import Pybind
 
 log = logger.get_logger(__name__)
@@ -55,6 +56,7 @@ async def pybind():
     help="Number of parallel build jobs.",
 )
 @tracer.Sync.decorator.call_raise
+@usage_h5_option("pybind.build")
 async def build(path: str, parallel: int):
     """
     Build the pybind11 extensions in-place for the given project path.
@@ -19,17 +19,16 @@
 
 from __future__ import annotations
 
-import os
 from enum import Enum
 from pathlib import Path
 
 from bundle.core import platform_info
-from bundle.core.process import ProcessStream
+from bundle.core.process import CapturePolicy, ProcessStream
 
 
-def _get_platform_specific_cmake_args_env() -> tuple[list[str], dict]:
-    """Gets platform-specific CMake arguments and environment variables."""
-    env = os.environ.copy()
+def _get_platform_specific_cmake_args_env() -> tuple[list[str], dict[str, str]]:
+    """Gets platform-specific CMake arguments and environment variable overrides."""
+    env: dict[str, str] = {}
     cmake_args: list[str] = []
     if platform_info.is_darwin:
         cmake_args.append(f"-DCMAKE_OSX_ARCHITECTURES={platform_info.arch}")
@@ -84,8 +83,8 @@ class CMakeService:
         if extra_args:
             cmd.extend(extra_args)
 
-        proc = ProcessStream(name="CMakeService.configure")
-        await proc(" ".join(cmd), cwd=str(source_dir), env=env)
+        proc = ProcessStream(name="CMakeService.configure", capture=CapturePolicy.bounded(keep_on_success=False))
+        await proc(cmd, cwd=str(source_dir), env_overlay=env)
 
     @staticmethod
     async def build(
@@ -115,5 +114,5 @@ class CMakeService:
 
         _platform_args, env = _get_platform_specific_cmake_args_env()
 
-        proc = ProcessStream(name="CMakeService.build")
-        await proc(" ".join(cmd), cwd=str(source_dir), env=env)
+        proc = ProcessStream(name="CMakeService.build", capture=CapturePolicy.bounded(keep_on_success=False))
+        await proc(cmd, cwd=str(source_dir), env_overlay=env)
@@ -25,39 +25,54 @@ import shlex
 from pathlib import Path
 
 from bundle.core import logger, tracer
-from bundle.core.process import Process
+from bundle.core.process import ProcessPool
 
 from ..resolved import PkgConfigResolved, PkgConfigResult
 from ..specs import PkgConfigSpec
 
 log = logger.get_logger(__name__)
 
+# Seconds before a pkg-config query is killed.
+PKG_CONFIG_TIMEOUT = 30.0
 
-def get_env_with_pkg_config_path(
-    extra_dirs: list[Path] | None = None,
-) -> dict[str, str]:
+
+def pkg_config_path_overlay(extra_dirs: list[Path] | None = None) -> dict[str, str]:
     """
-    Computes PKG_CONFIG_PATH and returns a modified copy of os.environ.
+    Computes the PKG_CONFIG_PATH environment override for pkg-config subprocesses.
 
     Parameters:
     - extra_dirs: Optional list of Path objects to prepend.
 
     Returns:
-    - A modified copy of os.environ with PKG_CONFIG_PATH set.
+    - A mapping with PKG_CONFIG_PATH set, or an empty mapping without extra_dirs.
     """
-    env = os.environ.copy()
     if not extra_dirs:
-        return env
+        return {}
 
     path_sep = os.pathsep  # Automatically uses ';' on Windows, ':' elsewhere
     new_paths = [str(p.resolve()) for p in extra_dirs]
-    existing_paths = env.get("PKG_CONFIG_PATH", "").split(path_sep)
+    existing_paths = os.environ.get("PKG_CONFIG_PATH", "").split(path_sep)
     existing_paths = [p for p in existing_paths if p]
     # Maintain order: extra_dirs paths first, then existing paths without duplicates
     final_paths = new_paths + [p for p in existing_paths if p not in new_paths]
-    env["PKG_CONFIG_PATH"] = path_sep.join(final_paths)
-    log.debug(f"Computed PKG_CONFIG_PATH for subprocess: {env['PKG_CONFIG_PATH']}")
-    return env
+    pkg_config_path = path_sep.join(final_paths)
+    log.debug(f"Computed PKG_CONFIG_PATH for subprocess: {pkg_config_path}")
+    return {"PKG_CONFIG_PATH": pkg_config_path}
+
+
+def get_env_with_pkg_config_path(
+    extra_dirs: list[Path] | None = None,
+) -> dict[str, str]:
+    """
+    Computes PKG_CONFIG_PATH and returns a modified copy of os.environ.
+
+    Parameters:
+    - extra_dirs: Optional list of Path objects to prepend.
+
+    Returns:
+    - A modified copy of os.environ with PKG_CONFIG_PATH set.
+    """
+    return {**os.environ, **pkg_config_path_overlay(extra_dirs)}
 
 
 def _parse_cflags_output(cflags_str: str) -> tuple[list[str], list[str]]:
@@ -79,9 +94,22 @@ def _parse_libs_output(libs_str: str) -> tuple[list[str], list[str], list[str]]:
     return library_dirs, libraries, other_flags
 
 
+async def _gather_all(*aws):
+    """
+    Like `asyncio.gather`, but wait for every query before raising the first error:
+    no query is left running in the pool when a sibling fails.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 class PkgConfigService:
-    def __init__(self, executable: str = "pkg-config"):
+    def __init__(self, executable: str = "pkg-config", pool: ProcessPool | None = None):
         self.executable = executable
+        self.pool = pool or ProcessPool(name="PkgConfigService", timeout=PKG_CONFIG_TIMEOUT)
 
     @tracer.Async.decorator.call_raise
     async def query(
@@ -98,17 +126,14 @@ class PkgConfigService:
             log.warning(f"Empty package_name provided to pkg-config query for option {option}.")
             return []
 
-        cmd_parts = [self.executable, option, package_name]
-        cmd_str = " ".join(shlex.quote(part) for part in cmd_parts)
+        argv = [self.executable, option, package_name]
 
-        proc = Process(name=f"PkgConfigService.query{option}")
         path_extra_dirs = [Path(d) for d in extra_dirs] if extra_dirs else None
-        env = get_env_with_pkg_config_path(path_extra_dirs)
-        result = await proc(cmd_str, env=env)
+        result = await self.pool(argv, group="pkg-config", env_overlay=pkg_config_path_overlay(path_extra_dirs))
 
         if result.returncode != 0:
             log.warning(
-                f"pkg-config query for '{cmd_str}' failed or package not found: {result.stderr.strip()}. Returning empty list."
+                f"pkg-config query for '{shlex.join(argv)}' failed or package not found: {result.stderr.strip()}. Returning empty list."
             )
             return []
 
@@ -119,7 +144,7 @@ class PkgConfigService:
     async def resolve_pkgconfig(self, pkg_name: str, extra_dirs: list[str] | None = None) -> PkgConfigResult:
         log.debug(f"Resolving pkg-config for package: {pkg_name}")
 
-        cflags_list, libs_list = await asyncio.gather(
+        cflags_list, libs_list = await _gather_all(
             self.query(pkg_name, "--cflags", extra_dirs),
             self.query(pkg_name, "--libs", extra_dirs),
         )
@@ -148,6 +173,6 @@ class PkgConfigService:
             return PkgConfigResolved(spec=spec, resolved=[])
 
         tasks = [self.resolve_pkgconfig(pkg_name, spec.extra_dirs) for pkg_name in spec.packages]
-        resolved_results = await asyncio.gather(*tasks)
+        resolved_results = await _gather_all(*tasks)
 
         return PkgConfigResolved(spec=spec, resolved=list(resolved_results))
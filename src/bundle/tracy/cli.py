@@ -34,6 +34,7 @@ from pathlib import Path
 import rich_click as click
 
 from bundle.core import logger, tracer
+from bundle.core.process import usage_h5_option
 from bundle.pybind.services.cmake import CMakeService
 
 log = logger.get_logger(__name__)
@@ -144,6 +145,7 @@ _VALID_TARGETS = ("extension", "profiler", "capture", "csvexport")
     help="Parallel build jobs.",
 )
 @tracer.Sync.decorator.call_raise
+@usage_h5_option("tracy.build")
 async def build(targets: tuple[str, ...], jobs: int) -> None:
     """
     Build Tracy components.
@@ -142,7 +142,7 @@ async def keepalive_loop(websocket: WebSocket) -> None:
         server_rx_packets += 1
         server_rx_bytes += request_frame_bytes
 
-        ack_model = AckMessage(
+        ack_model = AckMessage.trusted(
             sent_at=message.sent_at,
             received_at=now_ns(),
             server_rx_packets=server_rx_packets,
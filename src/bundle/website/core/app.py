@@ -27,6 +27,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from bundle.core import tracer
 from bundle.core.logger import setup_root_logger
 
 from .manifest import SiteManifest
@@ -121,6 +122,16 @@ def create_app(manifest: SiteManifest | None = None) -> FastAPI:
             WEB_LOGGER.warning("CSP report: %s", report)
         return Response(status_code=204)
 
+    if tracer.metrics.ENABLED:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """Expose tracer call metrics in the Prometheus text format."""
+            return Response(
+                content=tracer.metrics.prometheus_text(),
+                media_type=tracer.metrics.PROMETHEUS_CONTENT_TYPE,
+            )
+
     if resolved_manifest.initialize_pages:
         resolved_manifest.initialize_pages(app)
 
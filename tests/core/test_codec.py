@@ -0,0 +1,118 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import pytest
+
+import bundle
+from bundle.core import codec, data
+
+references = bundle.testing.references
+
+
+class Sample(data.Data):
+    count: int = 0
+    ratio: float = 0.0
+    name: str = ""
+    blob: bytes = b""
+    values: list[int] = data.Field(default_factory=list)
+
+
+class SampleV2(Sample):
+    __codec_version__ = 2
+    extra: str = "default"
+
+
+def complex_model() -> references.TestComplexData:
+    nested = references.data.NestedModel
+    recursive = references.data.RecursiveModel
+    return references.TestComplexData(
+        string_field="ünïcode",
+        int_field=2**70,
+        float_field=-1.5e-300,
+        optional_field="set",
+        list_field=[-1, 0, 1, 300],
+        set_field={"a", "b"},
+        dict_field={"x": -7},
+        union_field="text",
+        nested_model=nested(id=3, info="nested"),
+        nested_model_list=[nested(id=index) for index in range(3)],
+        recursive_model=recursive(name="root", children=[recursive(name="leaf")]),
+        file_path="some/path",
+    )
+
+
+def test_codec_roundtrip():
+    model = complex_model()
+    payload = codec.encode(model)
+    assert codec.decode(references.TestComplexData, payload) == model
+    assert references.TestComplexData.decode(model.encode()) == model
+    assert len(payload) < len(model.model_dump_json())
+
+
+def test_codec_schema_evolution():
+    old = Sample(count=-3, ratio=0.25, name="n", blob=b"\x00\xff", values=[1, 2])
+    assert codec.decode_header(old.encode()) == 1
+    upgraded = SampleV2.decode(old.encode())
+    assert upgraded.extra == "default" and upgraded.values == [1, 2]
+
+    new = SampleV2(count=1, extra="new")
+    assert codec.decode_header(new.encode()) == 2
+    with pytest.raises(codec.CodecError, match="Unknown schema version 2"):
+        Sample.decode(new.encode())
+    with pytest.raises(codec.CodecError, match="Unknown schema version 0"):
+        Sample.decode(b"\xbd\x00\x00")
+
+
+class Base(data.Data):
+    x: int = 1
+
+
+class Derived(Base):
+    y: int = 2
+
+
+class Holder(data.Data):
+    base: Base = data.Field(default_factory=Base)
+    bases: list[Base] = data.Field(default_factory=list)
+    either: Base | Sample | None = None
+
+
+def test_codec_subclass_fields():
+    # Subclass instances are written with the fields of the annotated class, as in JSON
+    holder = Holder(base=Derived(x=3), bases=[Derived()], either=Holder(base=Derived()).base)
+    decoded = Holder.decode(holder.encode())
+    assert decoded == Holder.model_validate_json(holder.model_dump_json())
+    assert type(decoded.base) is Base and decoded.base.x == 3
+    nested = Holder(either=Base(), base=Base(x=5))
+    assert Holder.decode(Holder(either=Sample(count=2)).encode()).either == Sample(count=2)
+    assert Holder.decode(nested.encode()) == nested
+
+
+@pytest.mark.parametrize("payload", [b"", b"{}", b"\xbd\x01\x05\x03", b"\xbd\x01\x00\x00"])
+def test_codec_rejects_malformed(payload):
+    with pytest.raises(codec.CodecError):
+        Sample.decode(payload)
+
+
+def test_codec_benchmark():
+    results = codec.benchmark(complex_model(), rounds=10)
+    assert results["codec_bytes"] < results["json_bytes"]
+    assert {"json_encode_ns", "codec_encode_ns", "json_decode_ns", "codec_decode_ns"} <= results.keys()
@@ -17,6 +17,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+
 import pytest
 
 import bundle
@@ -38,3 +40,212 @@ DATA_CLASSES_TO_TEST = [
 @pytest.mark.bundle_cprofile(expected_duration=500_000, performance_threshold=3_000_000)  # 0.5ms + ~3ms
 async def test_dataclass(dataclass):
     return dataclass()
+
+
+async def test_data_sync_roundtrip():
+    model = bundle.testing.references.TestComplexData(int_field=42, list_field=[1, 2])
+    assert await model.as_dict() == model.as_dict_sync()
+    assert bundle.testing.references.TestComplexData.from_dict_sync(model.as_dict_sync()) == model
+    assert bundle.testing.references.TestComplexData.from_json_sync(model.as_json_sync()) == model
+    assert await model.as_json() == model.as_json_sync()
+
+
+async def test_data_bulk_roundtrip():
+    cls = bundle.testing.references.TestComplexData
+    models = [cls(int_field=index + 1, string_field=str(index)) for index in range(100)]
+    dicts = cls.dump_many(models)
+    assert dicts == [model.as_dict_sync() for model in models]
+    assert cls.from_dicts(dicts) == models
+    assert cls.from_json_array(cls.dump_json_array(models)) == models
+    with pytest.raises(ValueError):
+        cls.from_dicts([{"int_field": 0}])
+
+
+class BulkBase(bundle.core.data.Data):
+    x: int = 1
+
+
+class BulkChild(BulkBase):
+    y: int = 2
+
+
+async def test_data_bulk_subclasses():
+    models = [BulkBase(), BulkChild(x=3)]
+    expected = [model.as_dict_sync() for model in models]
+    assert expected == [{"x": 1}, {"x": 3, "y": 2}]
+    assert bundle.core.data.Data.dump_many(models) == expected
+    assert BulkBase.dump_many(models) == expected
+    assert BulkBase.dump_many([BulkChild()]) == [{"x": 1, "y": 2}]
+    assert bundle.core.data.Data.dump_json_array(models) == b'[{"x":1},{"x":3,"y":2}]'
+
+
+@pytest.mark.parametrize("suffix, use_mmap", [(".jsonl", False), (".jsonl", True), (".jsonl.gz", False)])
+async def test_data_jsonl_sync(tmp_path, suffix, use_mmap):
+    cls = bundle.testing.references.TestComplexData
+    models = [cls(int_field=index + 1, string_field=f"line\n{index}") for index in range(25)]
+    path = tmp_path / f"models{suffix}"
+    assert cls.write_jsonl_sync(path, iter(models), batch_size=7) == 25
+    assert list(cls.iter_jsonl_sync(path, batch_size=4, use_mmap=use_mmap)) == models
+    assert cls.write_jsonl_sync(path, models[:3], append=True) == 3
+    assert len(list(cls.iter_jsonl_sync(path, use_mmap=use_mmap))) == 28
+
+
+async def test_data_jsonl_async(tmp_path):
+    cls = bundle.testing.references.TestComplexData
+    models = [cls(int_field=index + 1) for index in range(25)]
+
+    async def produce():
+        for model in models:
+            yield model
+
+    path = tmp_path / "models.jsonl.gz"
+    assert await cls.write_jsonl(path, produce(), batch_size=10) == 25
+    assert [model async for model in cls.iter_jsonl(path, batch_size=6)] == models
+
+
+async def test_data_jsonl_async_cancelled(tmp_path):
+    cls = bundle.testing.references.TestComplexData
+    path = tmp_path / "models.jsonl"
+    cls.write_jsonl_sync(path, (cls(int_field=index + 1) for index in range(20_000)))
+
+    async def consume():
+        async for _ in cls.iter_jsonl(path, batch_size=20_000):
+            pass
+
+    # Cancel while the first batch is still read in the IO pool
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+
+class PatchItem(bundle.core.data.Data):
+    __diff_key__ = "key"
+
+    key: str
+    value: int = 0
+    tags: dict[str, int] = bundle.core.data.Field(default_factory=dict)
+
+
+class PatchState(bundle.core.data.Data):
+    title: str = ""
+    items: list[PatchItem] = bundle.core.data.Field(default_factory=list)
+    plain: list[int] = bundle.core.data.Field(default_factory=list)
+
+
+async def test_data_diff_apply():
+    before = PatchState(
+        title="scan",
+        items=[PatchItem(key="a", value=1), PatchItem(key="b", value=2), PatchItem(key="c", tags={"x": 1})],
+        plain=[1, 2],
+    )
+    after = PatchState(
+        title="scan",
+        items=[PatchItem(key="c", tags={"y": 2}), PatchItem(key="a", value=1), PatchItem(key="d", value=4)],
+        plain=[1, 2, 3],
+    )
+    assert not before.diff(before.model_copy(deep=True))
+
+    patch = before.diff(after)
+    ops = {(op.op, str(op.path)) for op in patch.ops}
+    assert ("del", "['items', {'key': 'b'}]") in ops
+    assert ("set", "['items', {'key': 'd'}]") in ops
+    assert ("del", "['items', {'key': 'c'}, 'tags', 'x']") in ops
+    assert ("order", "['items']") in ops
+    assert not any(op.path[:2] == ["items", {"key": "a"}] for op in patch.ops)
+    assert before.apply(patch) == after
+
+    wire = bundle.core.data.Patch.from_json_sync(patch.as_json_sync())
+    assert before.apply(wire) == after
+
+
+class ScanDevice(bundle.core.data.Data):
+    __diff_key__ = "address"
+    __diff_exclude__ = ("identifier",)
+
+    identifier: int = 0
+    address: str = ""
+    name: str = ""
+    signal: int | None = None
+    services: list[str] = bundle.core.data.Field(default_factory=list)
+    extra: dict[str, int] = bundle.core.data.Field(default_factory=dict)
+
+
+class Scan(bundle.core.data.Data):
+    timeout: float = 5.0
+    devices: list[ScanDevice] = bundle.core.data.Field(default_factory=list)
+
+
+def _scan(identifier: int, changed: int | None = None) -> Scan:
+    return Scan(
+        devices=[
+            ScanDevice(
+                identifier=identifier * 10_000 + i,
+                address=f"aa:{i:04x}",
+                name=f"device {i}",
+                signal=-50 - i % 40 + (i == changed),
+                services=[f"service {j}" for j in range(8)],
+                extra={f"key {j}": j for j in range(8)},
+            )
+            for i in range(500)
+        ]
+    )
+
+
+@pytest.fixture
+def scans() -> tuple[Scan, Scan, Scan]:
+    first = _scan(1)
+    return first, _scan(2, changed=7), first.model_copy(deep=True)
+
+
+# The diff compares subtrees with `==` (pydantic-core, stopping at the first difference) rather than
+# hashing fields: digesting the codec encoding of the 500 devices of one side alone costs about four
+# times the whole diff, which is ~3ms for a fresh scan with a single change.
+@pytest.mark.bundle_cprofile(expected_duration=20_000_000, performance_threshold=100_000_000)
+async def test_data_diff_scan_benchmark(scans):
+    first, rescanned, copied = scans
+    patch = first.diff(rescanned)
+    assert [(op.op, op.path) for op in patch.ops] == [("set", ["devices", {"address": "aa:0007"}, "signal"])]
+    assert not first.diff(copied)
+
+
+TRUSTED_FIELDS = {
+    bundle.core.process.ProcessResult: {"command": "ls", "returncode": 0, "stdout": "out", "stderr": ""},
+    bundle.core.Entity: {"name": "trusted", "born_time": 1},
+    bundle.testing.references.TestComplexData: {"int_field": 3, "list_field": [1, 2]},
+}
+
+
+@pytest.mark.parametrize("model_class", list(TRUSTED_FIELDS))
+async def test_data_trusted_matches_validated(model_class):
+    fields = TRUSTED_FIELDS[model_class]
+    trusted = model_class.trusted(**dict(fields))
+    validated = model_class(**fields)
+    excluded = {"identifier", "dynamic_default_field"}
+    assert trusted.model_dump(exclude=excluded) == validated.model_dump(exclude=excluded)
+    assert trusted.__pydantic_private__ == validated.__pydantic_private__
+    with pytest.raises(TypeError):
+        model_class.trusted(not_a_field=1)
+
+
+async def test_data_trusted_sample_validation(monkeypatch):
+    monkeypatch.setattr(bundle.core.data, "TRUSTED_VALIDATE_EVERY", 1)
+    with pytest.raises(ValueError):
+        bundle.testing.references.TestComplexData.trusted(int_field=-1)
+
+
+@pytest.mark.parametrize("model_class", list(TRUSTED_FIELDS))
+@pytest.mark.bundle_cprofile(expected_duration=20_000_000, performance_threshold=100_000_000)
+async def test_data_construct_validated(model_class):
+    fields = TRUSTED_FIELDS[model_class]
+    for _ in range(1_000):
+        model_class(**fields)
+
+
+@pytest.mark.parametrize("model_class", list(TRUSTED_FIELDS))
+@pytest.mark.bundle_cprofile(expected_duration=20_000_000, performance_threshold=100_000_000)
+async def test_data_construct_trusted(model_class):
+    fields = TRUSTED_FIELDS[model_class]
+    for _ in range(1_000):
+        model_class.trusted(**fields)
@@ -0,0 +1,78 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+from uuid import uuid5
+
+import pytest
+
+import bundle
+
+# Mark all tests in this module as asynchronous
+pytestmark = pytest.mark.asyncio
+
+entity = bundle.core.entity
+
+
+def _child_indices(_) -> list[int]:
+    return [entity.Identifier.next().index for _ in range(100)]
+
+
+async def test_identifier_uuid_is_lazy():
+    identifier = entity.Identifier.next()
+    assert identifier._uuid is None
+    assert identifier.uuid == str(uuid5(entity.NAMESPACE, str(identifier.index)))
+    assert identifier.index >> entity.INDEX_BITS == os.getpid() % (1 << entity.PID_BITS)
+    assert identifier.index < 2**53
+    assert entity.Identifier.model_validate(identifier.model_dump()) == identifier
+
+
+async def test_identifier_concurrent_allocation():
+    def allocate() -> list[int]:
+        return [bundle.core.Entity().identifier.index for _ in range(500)]
+
+    batches = await asyncio.gather(*(asyncio.to_thread(allocate) for _ in range(8)))
+    indices = [index for batch in batches for index in batch]
+    assert len(set(indices)) == len(indices)
+
+
+async def test_identifier_index_fits_javascript_numbers():
+    allocator = entity._IndexAllocator()
+    allocator.prefix = ((1 << entity.PID_BITS) - 1) << entity.INDEX_BITS
+    allocator._counter = itertools.count((1 << entity.INDEX_BITS) - 1)
+    assert allocator.next() == 2**53 - 1
+    with pytest.raises(OverflowError):
+        allocator.next()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork start method not available")
+async def test_identifier_unique_across_processes():
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        batches = pool.map(_child_indices, range(2))
+    indices = _child_indices(None) + [index for batch in batches for index in batch]
+    assert len(set(indices)) == len(indices)
+
+
+@pytest.mark.bundle_cprofile(expected_duration=50_000_000, performance_threshold=200_000_000)
+async def test_entity_creation_rate():
+    for _ in range(10_000):
+        bundle.core.Entity()
@@ -0,0 +1,280 @@
+# Copyright 2026 HorusElohim
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from bundle.core import data, logger
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def test_logger():
+    log = logger.get_logger("bundle.tests.logger")
+    handler = ListHandler()
+    log.addHandler(handler)
+    log.setLevel(logger.Level.VERBOSE)
+    log.propagate = False
+    yield log, handler
+    log.removeHandler(handler)
+
+
+class Payload(data.Data):
+    raw: bytes = b"\x00" * 10_000
+    items: list[int] = data.Field(default_factory=lambda: list(range(1_000)))
+
+
+def sample_func(*args, **kwargs):
+    return None
+
+
+class CountingRepr:
+    renders = 0
+
+    def __repr__(self) -> str:
+        CountingRepr.renders += 1
+        return "CountingRepr()"
+
+
+def test_bounded_repr_summarizes_bulky_values():
+    budget = logger.RenderBudget(max_items=4, max_bytes=8, max_string=16)
+    text = logger.bounded_repr({"payload": Payload(), "blob": bytearray(4096), "text": "x" * 1_000}, budget)
+    assert "<bytes len=10000" in text
+    assert "<bytearray len=4096" in text
+    assert "... +996 more" in text
+    assert "x" * 17 not in text
+
+
+def test_bounded_repr_max_chars():
+    text = logger.bounded_repr(list(range(10)), logger.RenderBudget(max_chars=10))
+    assert text.startswith("[0, 1, 2,")
+    assert text.endswith("chars)")
+
+
+def test_callable_success_is_lazy(test_logger):
+    log, handler = test_logger
+    CountingRepr.renders = 0
+    log.callable_success(sample_func, (CountingRepr(),), {}, None, level=logger.Level.TESTING)
+    assert CountingRepr.renders == 0
+    assert not handler.records
+
+    payload = logger.LazyRepr((CountingRepr(),))
+    assert CountingRepr.renders == 0
+    assert str(payload) == str(payload) == "(CountingRepr(),)"
+    assert CountingRepr.renders == 1
+
+
+def test_callable_exception_expected_skips_traceback(test_logger):
+    log, handler = test_logger
+    log.setLevel(logger.Level.EXPECTED_EXCEPTION)
+    try:
+        raise ValueError("boom")
+    except ValueError as exc:
+        log.callable_exception(sample_func, (), {}, exc, level=logger.Level.ERROR)
+        log.callable_exception(sample_func, (), {}, exc, level=logger.Level.EXPECTED_EXCEPTION)
+    assert handler.records[0].exc_info
+    assert not handler.records[1].exc_info
+    assert "boom" in handler.records[1].getMessage()
+
+
+class BlockingHandler(ListHandler):
+    """Handler holding the listener thread until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblock = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.unblock.wait(timeout=5)
+        super().emit(record)
+
+
+def queued_logger(name: str, handler: logging.Handler, **kwargs) -> tuple[logger.BundleLogger, logger.BundleQueueHandler]:
+    log = logger.get_logger(name)
+    log.setLevel(logger.Level.DEBUG)
+    log.propagate = False
+    queue_handler = logger.BundleQueueHandler([handler], **kwargs)
+    log.addHandler(queue_handler)
+    return log, queue_handler
+
+
+def test_setup_root_logger_queued(tmp_path):
+    log = logger.setup_root_logger(name="bundle.tests.queued", log_path=tmp_path, colored_output=False, queued=True)
+    queue_handlers = [h for h in log.handlers if isinstance(h, logger.BundleQueueHandler)]
+    assert len(queue_handlers) == 1
+    assert len(queue_handlers[0].handlers) == 2
+    log.info("queued message")
+    queue_handlers[0].close()
+    log.removeHandler(queue_handlers[0])
+    assert "queued message" in next(tmp_path.iterdir()).read_text()
+
+
+def test_queue_handler_writes_on_listener_thread():
+    handler = ListHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    written_on = []
+
+    def emit(record: logging.LogRecord) -> None:
+        written_on.append(threading.current_thread())
+        handler.records.append(handler.format(record))
+
+    log, queue_handler = queued_logger("bundle.tests.queue.thread", handler)
+    handler.emit = emit
+    log.callable_success(sample_func, (CountingRepr(),), {}, None, level=logger.Level.DEBUG)
+    queue_handler.close()
+    log.removeHandler(queue_handler)
+    assert len(handler.records) == 1
+    assert "CountingRepr()" in handler.records[0]
+    assert written_on and threading.current_thread() not in written_on
+
+
+def test_queue_handler_snapshots_arguments():
+    handler = BlockingHandler()
+    log, queue_handler = queued_logger("bundle.tests.queue.snapshot", handler)
+    state = {"step": 1}
+    log.info("state %s", state)
+    log.info("lazy %s", logger.LazyRepr(state))
+    # The listener is still blocked: the caller mutates the arguments it logged
+    state["step"] = 2
+    state.update({str(index): index for index in range(100)})
+    handler.unblock.set()
+    queue_handler.close()
+    log.removeHandler(queue_handler)
+    assert [record.getMessage() for record in handler.records] == ["state {'step': 1}", "lazy {'step': 1}"]
+
+
+@pytest.mark.parametrize(
+    "overflow, expected_kept",
+    [
+        (logger.OverflowPolicy.DROP_OLDEST, ["first", "8", "9"]),
+        (logger.OverflowPolicy.DROP_BELOW_LEVEL, ["first", "0", "1", "warning"]),
+    ],
+)
+def test_queue_handler_overflow(overflow, expected_kept):
+    handler = BlockingHandler()
+    log, queue_handler = queued_logger(
+        f"bundle.tests.queue.{overflow.value}", handler, queue_size=2, overflow=overflow, overflow_level=logger.Level.WARNING
+    )
+    log.info("first")
+    # Wait until the listener holds "first" so the queue is empty
+    while queue_handler.queue.qsize():
+        time.sleep(0.001)
+    for index in range(10):
+        log.info(str(index))
+    if overflow is logger.OverflowPolicy.DROP_BELOW_LEVEL:
+        threading.Timer(0.05, handler.unblock.set).start()
+        log.warning("warning")
+    handler.unblock.set()
+    queue_handler.close()
+    log.removeHandler(queue_handler)
+    assert [record.getMessage() for record in handler.records] == expected_kept
+    assert queue_handler.stats()["dropped"] == 8
+
+
+def segmented_logger(name: str, handler: logging.Handler) -> logger.BundleLogger:
+    log = logger.get_logger(name)
+    log.setLevel(logger.Level.DEBUG)
+    log.propagate = False
+    log.addHandler(handler)
+    return log
+
+
+def test_segmented_json_handler_batches_writes(tmp_path):
+    handler = logger.SegmentedJsonHandler(tmp_path, flush_bytes=1 << 20, flush_interval=60)
+    log = segmented_logger("bundle.tests.segments.batch", handler)
+    log.info("buffered")
+    (segment,) = tmp_path.glob("bundle-*.ndjson")
+    assert segment.read_bytes() == b""
+    handler.flush()
+    assert json.loads(segment.read_text())["message"] == "buffered"
+    log.removeHandler(handler)
+    handler.close()
+
+
+def test_segmented_json_handler_rotates_and_indexes(tmp_path):
+    handler = logger.SegmentedJsonHandler(tmp_path, max_bytes=1024, flush_bytes=0)
+    log = segmented_logger("bundle.tests.segments.rotate", handler)
+    for index in range(40):
+        log.info("record %d %s", index, "x" * 64)
+    log.removeHandler(handler)
+    handler.close()
+
+    assert not list(tmp_path.glob("bundle-*.ndjson"))
+    entries = [json.loads(line) for line in handler.index_path.read_text().splitlines()]
+    assert len(entries) > 1
+    assert all(entry["segment"].endswith(".ndjson.gz") for entry in entries)
+    assert sum(entry["records"] for entry in entries) == 40
+
+    records = list(logger.read_log_window(tmp_path))
+    assert [record["message"].split()[1] for record in records] == [str(index) for index in range(40)]
+    window = list(logger.read_log_window(tmp_path, start=entries[-1]["start"], end=entries[-1]["end"]))
+    assert window and len(window) < 40
+
+
+def test_setup_file_handler_json_file(tmp_path):
+    segmented = logger.setup_file_handler(tmp_path / "segments", to_json=True)
+    assert isinstance(segmented, logger.SegmentedJsonHandler)
+    segmented.close()
+    handler = logger.setup_file_handler(tmp_path, to_json=True, json_segments=False)
+    log = segmented_logger("bundle.tests.segments.single", handler)
+    log.info("single file")
+    log.removeHandler(handler)
+    handler.close()
+    (log_file,) = tmp_path.glob("bundle-*.json")
+    assert json.loads(log_file.read_text())["message"] == "single file"
+
+
+def test_flight_recorder_dumps_on_error(test_logger):
+    log, handler = test_logger
+    log.setLevel(logger.Level.INFO)
+    recorder = logger.install_flight_recorder(log, capacity=3)
+    child = logger.get_logger("bundle.tests.logger.child")
+    try:
+        CountingRepr.renders = 0
+        for index in range(5):
+            log.debug("debug %d", index)
+        child.verbose("child %s", CountingRepr())
+        log.callable_success(sample_func, (), {}, None, level=logger.Level.DEBUG)
+        assert not handler.records
+        assert CountingRepr.renders == 0
+        assert len(recorder) == 4
+
+        log.error("failure")
+        messages = [record.getMessage() for record in handler.records]
+        assert messages[:3] == ["debug 3", "debug 4", "child CountingRepr()"]
+        assert "sample_func" in messages[3]
+        assert messages[4] == "failure"
+        assert all(getattr(record, "flight_recorder", False) for record in handler.records[:4])
+        assert len(recorder) == 0
+    finally:
+        logger.uninstall_flight_recorder(log)
@@ -0,0 +1,150 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+import zmq
+
+from bundle.core import Pipeline, PipelineError, data
+
+# Mark all tests in this module as asynchronous
+pytestmark = pytest.mark.asyncio
+
+
+class SquareTask(data.Data):
+    value: int
+    delay: float = 0.0
+    crash_marker: str = ""
+    always_crash: bool = False
+
+
+class SquareResult(data.Data):
+    value: int
+    pid: int
+
+
+# Worker functions are imported by the worker processes: keep them at module level
+def square(task: SquareTask) -> SquareResult:
+    if task.always_crash or (task.crash_marker and not Path(task.crash_marker).exists()):
+        Path(task.crash_marker or os.devnull).touch()
+        os._exit(1)
+    if task.value < 0:
+        raise ValueError("negative value")
+    time.sleep(task.delay)
+    return SquareResult(value=task.value * task.value, pid=os.getpid())
+
+
+async def async_square(task: SquareTask) -> SquareResult:
+    await asyncio.sleep(task.delay)
+    return SquareResult(value=task.value * task.value, pid=os.getpid())
+
+
+async def test_pipeline_ordered_and_unordered():
+    async with Pipeline(function=square, workers=2) as pipeline:
+        # Later tasks are faster: they complete first but are yielded in order
+        tasks = [SquareTask(value=i, delay=0.01 * (10 - i)) for i in range(10)]
+        results = [result async for result in pipeline.map(tasks)]
+        assert [result.value for result in results] == [i * i for i in range(10)]
+        assert len({result.pid for result in results}) == 2
+
+        pipeline.ordered = False
+        results = [result.value async for result in pipeline.map(SquareTask(value=i) for i in range(20))]
+        assert sorted(results) == [i * i for i in range(20)]
+
+
+async def test_pipeline_flow_control():
+    consumed = 0
+
+    def source():
+        nonlocal consumed
+        for i in range(30):
+            consumed += 1
+            yield SquareTask(value=i)
+
+    async with Pipeline(function=async_square, workers=2, prefetch=2) as pipeline:
+        yielded = 0
+        async for _ in pipeline.map(source()):
+            yielded += 1
+            # A slow consumer does not let the pipeline read ahead of the window
+            await asyncio.sleep(0.01)
+            assert consumed - yielded <= pipeline.window
+        assert yielded == 30
+
+
+async def test_pipeline_worker_crash(tmp_path):
+    marker = tmp_path / "crashed"
+    async with Pipeline(function=square, workers=2, max_retries=1) as pipeline:
+        tasks = [SquareTask(value=i, crash_marker=str(marker) if i == 3 else "") for i in range(8)]
+        results = [result.value async for result in pipeline.map(tasks)]
+        assert results == [i * i for i in range(8)]
+        assert marker.exists() and pipeline.restarts == 1
+
+        # A task that kills every worker fails after its retries, the pipeline keeps working
+        with pytest.raises(PipelineError, match="killed its worker 2 times") as error:
+            async for _ in pipeline.map([SquareTask(value=1, always_crash=True)]):
+                pass
+        assert error.value.index == 0
+        with pytest.raises(PipelineError, match="ValueError: negative value"):
+            async for _ in pipeline.map([SquareTask(value=-1)]):
+                pass
+        assert [result.value async for result in pipeline.map([SquareTask(value=4)])] == [16]
+
+
+async def test_pipeline_dispatch_retries_busy_worker():
+    async with Pipeline(function=square, workers=1) as pipeline:
+        assert [result.value async for result in pipeline.map([SquareTask(value=1)])] == [1]
+
+        # A live worker whose pipe refuses a task once still gets it on the next round
+        socket = pipeline._slots[0].socket.socket
+        send_multipart = socket.send_multipart
+        refused = []
+
+        def refuse_once(frames, *args, **kwargs):
+            if not refused:
+                refused.append(frames)
+                raise zmq.Again()
+            return send_multipart(frames, *args, **kwargs)
+
+        socket.send_multipart = refuse_once
+        results = await asyncio.wait_for(_collect(pipeline.map(SquareTask(value=i) for i in range(4))), 5.0)
+        assert results == [0, 1, 4, 9] and refused and pipeline.restarts == 0
+
+
+async def test_pipeline_drops_malformed_results():
+    pipeline = Pipeline(function=square, workers=1)
+    tasks, done = {0: object()}, {}
+    for frames in ([b"", bytes((0,)), b""], [bytes(8), b"", b""], [bytes(8), bytes(2), b""], [bytes(8)]):
+        pipeline._on_message(frames, tasks, done)
+    assert 0 in tasks and not done
+
+
+async def _collect(results):
+    return [result.value async for result in results]
+
+
+async def test_pipeline_requires_models():
+    def untyped(task):
+        return task
+
+    with pytest.raises(TypeError):
+        Pipeline(function=untyped)
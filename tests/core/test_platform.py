@@ -0,0 +1,72 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pytest
+
+from bundle.core import Platform, platform
+
+# Mark all tests in this module as asynchronous
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def probes(tmp_path, monkeypatch) -> list[str]:
+    """Point the platform cache to a temporary directory and count the processor probes."""
+    calls = []
+
+    def processor() -> str:
+        calls.append("processor")
+        return "probed-cpu"
+
+    monkeypatch.setattr(platform, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(platform.platform, "processor", processor)
+    return calls
+
+
+async def test_platform_facts_probed_lazily_and_cached(probes):
+    info = Platform(name="Lazy")
+    assert probes == []
+    assert not info.cache_path.exists()
+
+    # Probing from a running event loop is supported
+    assert info.processor == "probed-cpu"
+    assert info.processor == "probed-cpu"
+    assert probes == ["processor"]
+    assert info.cache_path.exists()
+
+    assert Platform(name="Cached").processor == "probed-cpu"
+    assert probes == ["processor"]
+
+
+async def test_platform_cache_keyed_by_release(probes):
+    info = Platform(name="Current")
+    other = Platform(name="Upgraded", release=f"{info.release}-next")
+    assert info.cache_path != other.cache_path
+    assert info.processor == other.processor
+    assert probes == ["processor", "processor"]
+
+
+async def test_platform_refresh(probes):
+    info = Platform(name="Refresh")
+    assert info.processor == "probed-cpu"
+    assert info.model_dump()["darwin"] == info.darwin.model_dump()
+    info.refresh()
+    assert probes == ["processor", "processor"]
+    assert Platform(name="Reloaded").processor == "probed-cpu"
+    assert probes == ["processor", "processor"]
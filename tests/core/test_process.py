@@ -17,11 +17,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+import sys
+import time
+from pathlib import Path
 from typing import Type
 
 import pytest
 
-from bundle.core import Process, ProcessError, ProcessStream
+from bundle.core import Process, ProcessError, ProcessPool, ProcessStream, ProcessTimeoutError, data, process
 
 SUCCESS_COMMANDS = [
     "echo validcommand",
@@ -61,3 +65,214 @@ async def test_process_failure(process_class, command, request):
     process_error_result = exc_info.value
     process_error_result.result.__test_name = request.node.name.strip()
     return process_error_result.result
+
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell commands")
+
+
+@posix_only
+@pytest.mark.parametrize("process_class", PROCESS_CLASSES)
+async def test_process_timeout_kills_tree(process_class, tmp_path):
+    marker = tmp_path / "marker"
+    process = process_class(name="Timeout")
+    # The grandchild would create the marker if it survived the kill
+    command = f"(sleep 1 && touch {marker}) & sleep 30"
+    start = time.perf_counter()
+    with pytest.raises(ProcessTimeoutError) as exc_info:
+        await process(command, timeout=0.2)
+    assert time.perf_counter() - start < 5
+    assert exc_info.value.result.returncode != 0
+    await asyncio.sleep(1.5)
+    assert not marker.exists()
+
+
+@posix_only
+async def test_process_pool_bounds_concurrency():
+    pool = ProcessPool(name="Bounded", max_concurrency=4, group_limits={"slow": 1})
+    running = 0
+    peak = 0
+    original_run = pool._run
+
+    async def counting_run(*args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return await original_run(*args)
+        finally:
+            running -= 1
+
+    pool._run = counting_run
+    outcomes = await pool.run([f"sleep 0.05; echo {index}" for index in range(8)])
+    assert [outcome.result.stdout.strip() for outcome in outcomes] == [str(index) for index in range(8)]
+    assert peak == 4
+    assert all(outcome.ok and outcome.wall_time_ns > 0 for outcome in outcomes)
+
+    peak = 0
+    outcomes = [outcome async for outcome in pool.map(["sleep 0.05"] * 3, group="slow")]
+    assert peak == 1 and len(outcomes) == 3
+
+
+@posix_only
+async def test_process_pool_reports_failures_as_completed():
+    async with ProcessPool(name="Failures", max_concurrency=3, timeout=5) as pool:
+        pool.submit("sleep 1; echo slow")
+        pool.submit("exit 3")
+        pool.submit("sleep 30", timeout=0.1)
+        outcomes = [outcome async for outcome in pool.as_completed()]
+
+    assert [outcome.command for outcome in outcomes] == ["exit 3", "sleep 30", "sleep 1; echo slow"]
+    failed, timed_out, ok = outcomes
+    assert failed.error == "exit code 3" and not failed.timed_out
+    with pytest.raises(ProcessError):
+        failed.raise_for_error()
+    assert timed_out.timed_out
+    assert ok.ok and ok.raise_for_error().stdout == "slow\n"
+
+
+@posix_only
+@pytest.mark.parametrize("process_class", PROCESS_CLASSES)
+async def test_process_exec_mode(process_class, monkeypatch):
+    monkeypatch.setenv("BUNDLE_TEST_BASE", "base")
+    proc = process_class(name="Exec")
+    result = await proc(["printf", "%s|%s|%s", "two words", "$HOME", "*"])
+    assert result.stdout == "two words|$HOME|*"
+    assert result.command == "printf '%s|%s|%s' 'two words' '$HOME' '*'"
+
+    result = await proc(
+        ["sh", "-c", 'echo "$BUNDLE_TEST_BASE $BUNDLE_TEST_OVERLAY"'], env_overlay={"BUNDLE_TEST_OVERLAY": "overlay"}
+    )
+    assert result.stdout.strip() == "base overlay"
+    with pytest.raises(FileNotFoundError):
+        await proc(["bundle-missing-executable"])
+
+
+async def test_overlay_environ_tracks_environ(monkeypatch):
+    overlay = {"BUNDLE_TEST_OVERLAY": "1"}
+    env = process.overlay_environ(overlay)
+    assert env["BUNDLE_TEST_OVERLAY"] == "1" and "BUNDLE_TEST_OVERLAY" not in process.os.environ
+    monkeypatch.setenv("BUNDLE_TEST_BASE", "changed")
+    assert process.overlay_environ(overlay)["BUNDLE_TEST_BASE"] == "changed"
+    # An overlay already in effect is inherited without a copy
+    monkeypatch.setenv("BUNDLE_TEST_OVERLAY", "1")
+    assert process.overlay_environ(overlay) is None and process.overlay_environ({}) is None
+
+
+@posix_only
+async def test_resolve_executable_does_not_cache_misses(tmp_path):
+    path = str(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        process.resolve_executable("bundle-late-tool", path)
+    # Installed after the failed lookup, e.g. by an earlier build step
+    tool = tmp_path / "bundle-late-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    assert process.resolve_executable("bundle-late-tool", path) == str(tool)
+
+
+SPAWN_ROUNDS = 50
+
+
+@posix_only
+@pytest.mark.bundle_cprofile(expected_duration=500_000_000, performance_threshold=1_000_000_000)
+async def test_process_spawn_latency_shell():
+    proc = Process(name="SpawnShell")
+    for _ in range(SPAWN_ROUNDS):
+        await proc("true")
+
+
+@posix_only
+@pytest.mark.bundle_cprofile(expected_duration=500_000_000, performance_threshold=1_000_000_000)
+async def test_process_spawn_latency_exec():
+    proc = Process(name="SpawnExec")
+    for _ in range(SPAWN_ROUNDS):
+        await proc(["true"])
+
+
+class RecordingStream(ProcessStream):
+    _batches: list[list[str]] = data.PrivateAttr(default_factory=list)
+
+    async def callback_stdout_lines(self, lines: list[str]):
+        self._batches.append(lines)
+
+
+@posix_only
+async def test_process_stream_bounded_capture(tmp_path):
+    policy = process.CapturePolicy(head_bytes=16, tail_bytes=32, spill=True, spill_dir=tmp_path)
+    proc = RecordingStream(name="Bounded", capture=policy)
+    script = "import sys\nfor i in range(5000): sys.stdout.write(f'line {i:04d} \u00e9\\n')"
+    result = await proc([sys.executable, "-c", script])
+
+    full = "".join(f"line {i:04d} \u00e9\n" for i in range(5000))
+    assert "".join(line for batch in proc._batches for line in batch) == full
+    assert len(proc._batches) < 5000
+    assert result.stdout.startswith(full.encode()[:16].decode())
+    assert result.stdout.endswith(full[-20:])
+    assert "bytes omitted" in result.stdout
+    assert Path(result.stdout_path).read_text(encoding="utf-8") == full
+    assert result.stderr == "" and result.stderr_path is None
+    assert list(tmp_path.iterdir()) == [Path(result.stdout_path)]
+
+
+@posix_only
+async def test_process_stream_spill_kept_on_failure(tmp_path):
+    policy = process.CapturePolicy.bounded(head_bytes=16, tail_bytes=32, spill_dir=tmp_path, keep_on_success=False)
+    proc = ProcessStream(name="Spilled", capture=policy)
+    script = "import sys\nsys.stdout.write('x' * 4096)\nsys.exit(int(sys.argv[1]))"
+    result = await proc([sys.executable, "-c", script, "0"])
+    assert "bytes omitted" in result.stdout and result.stdout_path is None
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(ProcessError) as failure:
+        await proc([sys.executable, "-c", script, "1"])
+    assert Path(failure.value.result.stdout_path).read_text() == "x" * 4096
+
+
+@posix_only
+async def test_resource_collector_accounts_commands():
+    assert (await Process(name="Untracked")("true")).wall_time_ns is None
+
+    busy = [sys.executable, "-c", "sum(range(3_000_000)); b'x' * (128 << 20)"]
+    with process.ResourceCollector(name="Build") as collector:
+        result = await Process(name="Busy")(busy)
+        async with ProcessPool(name="Pool", max_concurrency=2) as pool:
+            await pool.run(["true", "exit 2"])
+        with pytest.raises(ProcessError) as failure:
+            await ProcessStream(name="Killed")(["sh", "-c", "kill -9 $$"])
+
+    assert result.wall_time_ns > 0 and result.user_time > 0
+    # Only set when this command raised the children RSS high-water mark
+    assert result.max_rss_kb is None or result.max_rss_kb >= 128 << 10
+    assert result.exit_signal is None
+    assert failure.value.result.exit_signal == 9
+    assert [name for name, _ in collector.records] == ["Busy", "Pool.default", "Pool.default", "Killed"]
+
+    summary = collector.summary()
+    assert next(iter(summary)) == "Busy"
+    assert summary["Pool.default"]["commands"] == 2 and summary["Pool.default"]["failures"] == 1
+    assert (await Process(name="Untracked")("true")).wall_time_ns is None
+
+
+@posix_only
+async def test_resource_collector_skips_untracked_commands():
+    busy = [sys.executable, "-c", "sum(range(5_000_000))"]
+    with process.ResourceCollector(name="First"):
+        await Process(name="Busy")(busy)
+    # CPU used between two collectors is not charged to the next accounted command
+    for _ in range(2):
+        await Process(name="Untracked")(busy)
+    with process.ResourceCollector(name="Second"):
+        result = await Process(name="Idle")("true")
+    assert result.user_time < 0.05
+
+
+@posix_only
+async def test_resource_collector_overlapping_commands():
+    with process.ResourceCollector(name="Build"):
+        first, second = await asyncio.gather(Process(name="First")("sleep 0.2"), Process(name="Second")("sleep 0.1"))
+        alone = await Process(name="Alone")("true")
+    # CPU time and RSS of children reaped together cannot be attributed to either command
+    for result in (first, second):
+        assert result.wall_time_ns > 0 and result.user_time is None and result.system_time is None
+        assert result.max_rss_kb is None
+    assert alone.user_time is not None and alone.system_time is not None
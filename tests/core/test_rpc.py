@@ -0,0 +1,180 @@
+# Copyright 2026 HorusElohim
+
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership. The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import time
+
+import pytest
+
+import bundle
+from bundle.core import RpcClient, RpcError, RpcServer, codec, data
+from bundle.core.rpc import STATUS_OK
+
+# Mark all tests in this module as asynchronous
+pytestmark = pytest.mark.asyncio
+
+
+class AddRequest(data.Data):
+    a: int
+    b: int
+    delay: float = 0.0
+
+
+class AddResponse(data.Data):
+    total: int
+
+
+def _server(concurrency: int = 8) -> RpcServer:
+    server = RpcServer(concurrency=concurrency)
+
+    @server.handler
+    async def add(request: AddRequest) -> AddResponse:
+        await asyncio.sleep(request.delay)
+        return AddResponse(total=request.a + request.b)
+
+    @server.handler(name="blocking_add")
+    def blocking(request: AddRequest) -> AddResponse:
+        time.sleep(request.delay)
+        return AddResponse(total=request.a + request.b)
+
+    @server.handler
+    async def fail(request: AddRequest) -> AddResponse:
+        raise ValueError("no sum today")
+
+    return server
+
+
+async def test_rpc_pipelined_calls():
+    endpoint = "tcp://127.0.0.1:5580"
+    async with _server(concurrency=4).bind(endpoint) as server, RpcClient().connect(endpoint) as client:
+        # Replies complete out of order and are matched by correlation id
+        requests = [AddRequest(a=i, b=1, delay=0.01 * (i % 4)) for i in range(40)]
+        responses = await asyncio.gather(*(client.call("add", request, AddResponse, timeout=5.0) for request in requests))
+        assert [response.total for response in responses] == [i + 1 for i in range(40)]
+        assert client.in_flight == 0
+
+        metrics = server.metrics
+        assert metrics.completed == 40 and metrics.active == 0 and metrics.queued == 0
+        assert metrics.max_queued > 4  # more requests than workers were in flight
+
+        assert (await client.call("blocking_add", AddRequest(a=2, b=3), AddResponse)).total == 5
+
+
+async def test_rpc_errors_and_deadlines():
+    endpoint = "tcp://127.0.0.1:5581"
+    async with _server().bind(endpoint) as server, RpcClient().connect(endpoint) as client:
+        with pytest.raises(RpcError, match="Unknown method"):
+            await client.call("missing", AddRequest(a=1, b=1), AddResponse)
+        with pytest.raises(RpcError, match="ValueError: no sum today"):
+            await client.call("fail", AddRequest(a=1, b=1), AddResponse)
+        with pytest.raises(asyncio.TimeoutError):
+            await client.call("add", AddRequest(a=1, b=1, delay=1.0), AddResponse, timeout=0.1)
+
+        # The server abandons the request at the same deadline
+        await asyncio.sleep(0.1)
+        assert server.metrics.expired == 1 and server.metrics.failed == 2
+        assert (await client.call("add", AddRequest(a=1, b=1), AddResponse, timeout=1.0)).total == 2
+
+
+async def test_rpc_slow_handler_does_not_block():
+    endpoint = "tcp://127.0.0.1:5582"
+    async with _server(concurrency=2).bind(endpoint), RpcClient().connect(endpoint) as client:
+        slow = asyncio.create_task(client.call("add", AddRequest(a=0, b=0, delay=0.5), AddResponse))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        for i in range(10):
+            assert (await client.call("add", AddRequest(a=i, b=i), AddResponse)).total == 2 * i
+        assert time.perf_counter() - start < 0.5 and not slow.done()
+        assert (await slow).total == 0
+
+
+async def test_rpc_blocking_handler_holds_its_worker():
+    endpoint = "tcp://127.0.0.1:5586"
+    async with _server(concurrency=1).bind(endpoint) as server, RpcClient().connect(endpoint) as client:
+        # The thread outlives the deadline; the next request waits for it rather than running beside it
+        slow = asyncio.create_task(client.call("blocking_add", AddRequest(a=0, b=0, delay=0.5), AddResponse, timeout=2.0))
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        assert server.metrics.active == 1
+        assert (await client.call("blocking_add", AddRequest(a=1, b=1), AddResponse, timeout=2.0)).total == 2
+        assert time.perf_counter() - start > 0.3
+        assert (await slow).total == 0
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.call("blocking_add", AddRequest(a=1, b=1, delay=0.3), AddResponse, timeout=0.1)
+        await asyncio.sleep(0.05)
+        assert server.metrics.active == 1 and server.metrics.expired == 0
+        await asyncio.sleep(0.3)
+        assert server.metrics.active == 0 and server.metrics.expired == 1
+
+
+async def test_rpc_client_survives_malformed_replies():
+    endpoint = "tcp://127.0.0.1:5587"
+    async with bundle.core.Socket.router().bind(endpoint) as router, RpcClient().connect(endpoint) as client:
+        call = asyncio.create_task(client.call("add", AddRequest(a=1, b=1), AddResponse))
+        envelope, request_id, *_ = await router.socket.recv_multipart()
+        # An empty status frame is dropped, the call still gets its reply
+        await router.socket.send_multipart([envelope, request_id, b"", b""])
+        await router.socket.send_multipart([envelope, request_id, bytes((STATUS_OK,)), codec.encode(AddResponse(total=2))])
+        assert (await asyncio.wait_for(call, 2.0)).total == 2
+
+        # A reader that stops fails the calls waiting without a timeout
+        call = asyncio.create_task(client.call("add", AddRequest(a=1, b=1), AddResponse))
+        await router.socket.recv_multipart()
+        client._reader.cancel()
+        with pytest.raises(RpcError, match="Reply reader stopped"):
+            await asyncio.wait_for(call, 2.0)
+
+
+async def test_rpc_servers_behind_proxy():
+    frontend_endpoint = "tcp://127.0.0.1:5583"
+    backend_endpoint = "tcp://127.0.0.1:5584"
+    async with (
+        bundle.core.Socket.router().bind(frontend_endpoint) as frontend,
+        bundle.core.Socket.dealer().bind(backend_endpoint) as backend,
+        bundle.core.SocketProxy(frontend=frontend, backend=backend),
+        _server(concurrency=1).connect(backend_endpoint) as first,
+        _server(concurrency=1).connect(backend_endpoint) as second,
+        RpcClient().connect(frontend_endpoint) as client,
+    ):
+        await asyncio.sleep(0.1)
+        responses = await asyncio.gather(
+            *(client.call("add", AddRequest(a=i, b=i, delay=0.02), AddResponse, timeout=5.0) for i in range(20))
+        )
+        assert [response.total for response in responses] == [2 * i for i in range(20)]
+        assert first.metrics.completed > 0 and second.metrics.completed > 0
+
+
+async def test_rpc_handler_requires_models():
+    server = RpcServer()
+    with pytest.raises(TypeError):
+
+        @server.handler
+        async def untyped(request):
+            return request
+
+    await server.close()
+
+
+@pytest.mark.bundle_cprofile(expected_duration=500_000_000, performance_threshold=500_000_000)
+async def test_rpc_call_rate():
+    endpoint = "tcp://127.0.0.1:5585"
+    async with _server(concurrency=32).bind(endpoint), RpcClient().connect(endpoint) as client:
+        for _ in range(5):
+            await asyncio.gather(*(client.call("add", AddRequest(a=i, b=i), AddResponse) for i in range(200)))
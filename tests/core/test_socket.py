@@ -18,6 +18,7 @@
 # under the License.
 
 import asyncio
+import sys
 from pathlib import Path
 
 import pytest
@@ -245,6 +246,80 @@ async def test_proxy(protocol, tmp_path):
     return f"Socket-Proxy-{protocol.upper()}"
 
 
+@parametrize_socket_protocol
+async def test_native_proxy(protocol, tmp_path):
+    if bundle.core.platform_info.is_windows and protocol == "ipc":
+        pytest.skip("Skipping IPC tests on Windows.")
+
+    frontend_endpoint = resolve_endpoint(protocol, tmp_path / "frontend", 5561)
+    backend_endpoint = resolve_endpoint(protocol, tmp_path / "backend", 5562)
+    capture_endpoint = resolve_endpoint(protocol, tmp_path / "capture", 5563)
+
+    async with (
+        bundle.core.Socket.xsub().bind(frontend_endpoint) as frontend,
+        bundle.core.Socket.xpub().bind(backend_endpoint) as backend,
+        bundle.core.Socket.pair().bind(capture_endpoint) as capture,
+        bundle.core.Socket.pair().connect(capture_endpoint) as monitor,
+        bundle.core.Socket.pub().connect(frontend_endpoint) as publisher,
+        bundle.core.Socket.sub().connect(backend_endpoint).subscribe(b"") as subscriber,
+    ):
+        proxy_task = asyncio.create_task(bundle.core.Socket.proxy(frontend, backend, capture=capture, native=True))
+        await asyncio.sleep(DEFAULT_SAFE_SLEEP)
+
+        message = b"Native Proxy Test Message"
+        await publisher.send(message)
+        try:
+            assert await asyncio.wait_for(subscriber.recv(), timeout=1.0) == message
+            # The subscription (backend to frontend) and the message are both captured
+            assert await asyncio.wait_for(monitor.recv(), timeout=1.0) == b"\x01"
+            assert await asyncio.wait_for(monitor.recv(), timeout=1.0) == message
+        finally:
+            proxy_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await proxy_task
+
+        # The sockets are back to the event loop
+        await publisher.send(b"direct")
+        assert await asyncio.wait_for(frontend.recv(), timeout=1.0) == b"direct"
+
+
+async def test_native_proxy_steering(tmp_path):
+    frontend_endpoint = resolve_endpoint("tcp", tmp_path, 5564)
+    backend_endpoint = resolve_endpoint("tcp", tmp_path, 5565)
+
+    async with (
+        bundle.core.Socket.router().bind(frontend_endpoint) as frontend,
+        bundle.core.Socket.dealer().bind(backend_endpoint) as backend,
+        bundle.core.Socket.req().connect(frontend_endpoint) as client,
+        bundle.core.Socket.rep().connect(backend_endpoint) as worker,
+    ):
+        async with bundle.core.SocketProxy(frontend=frontend, backend=backend) as proxy:
+            assert proxy.running
+            await client.send(b"ping")
+            assert await asyncio.wait_for(worker.recv(), timeout=1.0) == b"ping"
+            await worker.send(b"pong")
+            assert await asyncio.wait_for(client.recv(), timeout=1.0) == b"pong"
+
+            statistics = await proxy.statistics()
+            # Frames are counted: the identity added by ROUTER, the empty delimiter of REQ, the body
+            assert statistics.frontend_messages_in == statistics.backend_messages_out == 3
+            assert statistics.backend_messages_in == statistics.frontend_messages_out == 3
+            assert statistics.frontend_bytes_in >= len(b"ping")
+
+            await proxy.pause()
+            paused = await proxy.statistics()
+            await client.send(b"held")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(worker.recv(), timeout=DEFAULT_SAFE_SLEEP)
+            await proxy.resume()
+            assert await asyncio.wait_for(worker.recv(), timeout=1.0) == b"held"
+            assert (await proxy.statistics()).frontend_messages_in == paused.frontend_messages_in + 3
+        assert not proxy.running
+
+        with pytest.raises(RuntimeError):
+            await proxy.statistics()
+
+
 @bundle_cprofile
 @parametrize_socket_protocol
 async def test_pair(protocol, tmp_path):
@@ -540,3 +615,294 @@ async def test_channel(protocol, tmp_path):
         assert reply == b"Hello, CHANNEL Client!"
 
     return f"Socket-Channel-{protocol.upper()}"
+
+
+@parametrize_socket_protocol
+async def test_send_recv_many(protocol, tmp_path):
+    if bundle.core.platform_info.is_windows and protocol == "ipc":
+        pytest.skip("Skipping IPC tests on Windows.")
+    endpoint = resolve_endpoint(protocol, tmp_path, 5566)
+    messages = [i.to_bytes(4, "little") for i in range(5000)]
+
+    async with bundle.core.Socket.pull().bind(endpoint) as receiver:
+        # A low high-water mark makes the batch wait for the receiver
+        sender = bundle.core.Socket.push()
+        sender.socket.sndhwm = 10
+        async with sender.connect(endpoint):
+            producer = asyncio.create_task(sender.send_many(iter(messages)))
+            received = []
+            while len(received) < len(messages):
+                batch = await receiver.recv_many(max_n=100, timeout=1.0)
+                assert 0 < len(batch) <= 100
+                received.extend(batch)
+            assert await producer == len(messages)
+            assert received == messages
+
+            assert await receiver.recv_many(timeout=DEFAULT_SAFE_SLEEP) == []
+            assert await sender.send_many([b"traced"], traced=True) == 1
+            assert await receiver.recv_many(traced=True) == [b"traced"]
+
+
+@pytest.mark.parametrize("pattern", ["push/pull", "pub/sub", "req/rep"])
+async def test_socket_benchmark(pattern):
+    results = await bundle.core.sockets.benchmark(pattern, "inproc", messages=200, batch=50)
+    if pattern != "pub/sub":
+        assert results["received"] == 200
+    assert results["messages_per_second"] > 0
+    assert 0 < results["p50_us"] <= results["p90_us"] <= results["p99_us"]
+
+
+async def test_send_policies():
+    endpoint = "tcp://127.0.0.1:5590"
+    # An immediate PUSH socket without peers has nowhere to queue messages
+    sender = bundle.core.Socket.push()
+    sender.socket.immediate = 1
+    async with sender.connect(endpoint):
+        sender.backpressure(bundle.core.SendPolicy.DROP, timeout=0.05)
+        await sender.send(b"dropped")
+        assert await sender.send_many([b"a", b"b"]) == 0
+        statistics = sender.statistics
+        assert statistics.dropped == 3 and statistics.sent == 0
+        assert statistics.blocked == 3 and statistics.blocked_ns >= 3 * 50_000_000
+
+        sender.backpressure(bundle.core.SendPolicy.RAISE, timeout=0.01)
+        with pytest.raises(bundle.core.SocketFullError):
+            await sender.send_multipart([b"full", b"socket"])
+
+        # Blocking sends wait for the peer
+        sender.backpressure(bundle.core.SendPolicy.BLOCK)
+        blocked = asyncio.create_task(sender.send(b"waited"))
+        await asyncio.sleep(DEFAULT_SAFE_SLEEP)
+        assert not blocked.done()
+        async with bundle.core.Socket.pull().bind(endpoint) as receiver:
+            await asyncio.wait_for(blocked, timeout=1.0)
+            assert await receiver.recv() == b"waited"
+            assert sender.statistics.sent == 1 and receiver.statistics.received == 1
+
+
+async def test_publisher_high_water_mark():
+    endpoint = "tcp://127.0.0.1:5591"
+    publisher = bundle.core.Socket.pub().high_water_marks(send=5)
+    subscriber = bundle.core.Socket.sub().high_water_marks(receive=5)
+    async with publisher.bind(endpoint), subscriber.connect(endpoint).subscribe():
+        await asyncio.sleep(DEFAULT_SAFE_SLEEP)
+        assert publisher.socket.sndhwm == 5 and subscriber.socket.rcvhwm == 5
+
+        # The subscriber does not read: the publisher drops what does not fit and counts it
+        publisher.backpressure(bundle.core.SendPolicy.DROP)
+        total = 500
+        assert await publisher.send_many([bytes(100_000)] * total) < total
+        statistics = publisher.statistics
+        assert statistics.sent + statistics.dropped == total
+        assert statistics.dropped > 0
+
+
+async def test_socket_monitor():
+    endpoint = "tcp://127.0.0.1:5592"
+    async with bundle.core.Socket.pull().bind(endpoint) as receiver:
+        events = []
+
+        async def collect():
+            async for event in receiver.monitor():
+                events.append(event)
+                if event.event == "DISCONNECTED":
+                    return
+
+        collector = asyncio.create_task(collect())
+        await asyncio.sleep(0.05)
+        async with bundle.core.Socket.push().connect(endpoint) as sender:
+            await sender.send(b"monitored")
+            assert await receiver.recv() == b"monitored"
+        await asyncio.wait_for(collector, timeout=2.0)
+
+        names = [event.event for event in events]
+        assert "ACCEPTED" in names and names[-1] == "DISCONNECTED"
+        assert all(event.endpoint == endpoint for event in events if event.event == "ACCEPTED")
+
+
+ARRAY_LAYOUTS = {
+    "c-order": lambda np: np.arange(12.0).reshape(3, 4),
+    "f-order": lambda np: np.asfortranarray(np.arange(24, dtype=np.int16).reshape(2, 3, 4)),
+    "strided": lambda np: np.arange(20)[::2],
+    "structured": lambda np: np.zeros(3, dtype=[("t", "<u8"), ("xyz", "<f4", (3,))]),
+    "scalar": lambda np: np.array(5.0),
+    "tracked": lambda np: np.ones(bundle.core.sockets.TRACK_THRESHOLD // 8 + 1),
+}
+
+
+@parametrize_socket_protocol
+@pytest.mark.parametrize("layout", list(ARRAY_LAYOUTS))
+async def test_array_roundtrip(protocol, layout, tmp_path):
+    np = pytest.importorskip("numpy")
+    if bundle.core.platform_info.is_windows and protocol == "ipc":
+        pytest.skip("Skipping IPC tests on Windows.")
+
+    endpoint = resolve_endpoint(protocol, tmp_path, 5569)
+    array = ARRAY_LAYOUTS[layout](np)
+
+    async with (
+        bundle.core.Socket.pair().bind(endpoint) as sender,
+        bundle.core.Socket.pair().connect(endpoint) as receiver,
+    ):
+        tracker = await sender.send_array(array)
+        received = await receiver.recv_array()
+        assert received.dtype == array.dtype and received.shape == array.shape
+        assert np.array_equal(received, array)
+        assert not received.flags.owndata
+        if array.nbytes >= bundle.core.sockets.TRACK_THRESHOLD and protocol == "inproc":
+            # The inproc buffer stays shared with the receiver until its array is released
+            assert tracker is not None and not tracker.done
+        else:
+            assert tracker is None
+
+
+async def test_array_rejects_objects(tmp_path):
+    np = pytest.importorskip("numpy")
+    async with bundle.core.Socket.pair().bind(resolve_endpoint("inproc", tmp_path, 0)) as sender:
+        with pytest.raises(ValueError):
+            await sender.send_array(np.array([object()]))
+
+
+@pytest.mark.bundle_cprofile(expected_duration=150_000_000, performance_threshold=300_000_000)
+async def test_array_transport_rate(tmp_path):
+    np = pytest.importorskip("numpy")
+    endpoint = resolve_endpoint("tcp", tmp_path, 5570)
+    array = np.random.default_rng(0).random(1 << 19)  # 4 MiB
+
+    async with (
+        bundle.core.Socket.pair().bind(endpoint) as sender,
+        bundle.core.Socket.pair().connect(endpoint) as receiver,
+    ):
+        for _ in range(20):
+            await sender.send_array(array)
+            assert (await receiver.recv_array()).shape == array.shape
+
+
+async def test_shared_memory_transport(tmp_path):
+    np = pytest.importorskip("numpy")
+    endpoint = resolve_endpoint("tcp", tmp_path, 5571)
+    payload = bytes(range(256)) * 64
+    array = np.asfortranarray(np.arange(6000, dtype=np.float32).reshape(60, 100))
+
+    async with (
+        bundle.core.Socket.pair().bind(endpoint).shared_memory(threshold=1024, size=1 << 20, local=True) as sender,
+        bundle.core.Socket.pair().connect(endpoint).shared_memory(threshold=1024, local=True) as receiver,
+    ):
+        await sender.send(payload)
+        assert await receiver.recv() == payload
+        await sender.send_array(array)
+        received = await receiver.recv_array()
+        assert np.array_equal(received, array) and received.flags.f_contiguous
+        assert sender._arena is not None and sender._arena.in_use == 0
+
+        # Small payloads and payloads larger than the arena use the regular transport
+        await sender.send(b"small")
+        assert await receiver.recv() == b"small"
+        await sender.send(payload * 100)
+        assert await receiver.recv() == payload * 100
+
+
+async def test_shared_memory_remote_fallback(tmp_path):
+    endpoint = resolve_endpoint("tcp", tmp_path, 5572)
+    async with (
+        bundle.core.Socket.pair().bind(endpoint).shared_memory(threshold=0, local=False) as sender,
+        bundle.core.Socket.pair().connect(endpoint).shared_memory(threshold=0) as receiver,
+    ):
+        await sender.send(b"remote")
+        assert await receiver.recv() == b"remote"
+        assert sender._arena is None
+
+
+async def test_shared_memory_receive_paths_and_close(tmp_path):
+    endpoint = resolve_endpoint("tcp", tmp_path, 5573)
+    payload = bytes(range(256)) * 16
+    async with bundle.core.Socket.pull().bind(endpoint).shared_memory(local=True) as receiver:
+        sender = bundle.core.Socket.push().connect(endpoint).shared_memory(threshold=1024, size=1 << 20, local=True, linger=2.0)
+        await asyncio.sleep(DEFAULT_SAFE_SLEEP)
+        for _ in range(3):
+            await sender.send(payload)
+        # Closing right after sending waits for the receiver to read the pending blocks
+        closing = asyncio.create_task(sender.close())
+        assert await receiver.recv() == payload
+        assert await receiver.recv_multipart() == [payload]
+        assert await receiver.recv_many(timeout=1.0) == [payload]
+        await asyncio.wait_for(closing, timeout=2.0)
+        assert sender._arena is None
+
+
+async def test_shared_memory_plain_receiver_gets_raw_frames(tmp_path):
+    endpoint = resolve_endpoint("tcp", tmp_path, 5574)
+    payload = bytes(range(256)) * 16
+    async with (
+        bundle.core.Socket.pull().bind(endpoint) as receiver,
+        bundle.core.Socket.push().connect(endpoint).shared_memory(threshold=1024, local=True, linger=0.1) as sender,
+    ):
+        await sender.send(payload)
+        # A receiver that did not opt in never touches shared memory
+        marker, handle = await receiver.recv_multipart()
+        assert marker == bundle.core.sockets.SHM_MAGIC and handle.endswith(sender._arena.name.encode())
+        assert sender._arena.in_use > 0
+
+
+async def test_arena_rejects_invalid_handles():
+    from multiprocessing.shared_memory import SharedMemory
+
+    from bundle.core.arena import ArenaReader, SharedMemoryArena
+
+    foreign = SharedMemory(create=True, size=4096)
+    foreign.buf[64:80] = b"SECRET-PAYLOAD!!"
+    foreign.buf[0:4] = (1).to_bytes(4, "little")
+    arena = SharedMemoryArena(4096)
+    reader = ArenaReader()
+    try:
+        handle = arena.put(b"x" * 100)
+        offset_length = handle[:16]
+        invalid = [
+            b"\x00" * 16 + foreign.name.encode(),
+            b"\x00" * 16 + b"bundle_shm_0000000000000000",
+            (4096).to_bytes(8, "little") + (1).to_bytes(8, "little") + arena.name.encode(),
+            (0).to_bytes(8, "little") + (4096).to_bytes(8, "little") + arena.name.encode(),
+            b"short",
+        ]
+        for bad in invalid:
+            with pytest.raises(ValueError):
+                reader.take(bad)
+        # The foreign segment is neither read nor written
+        assert bytes(foreign.buf[0:4]) == (1).to_bytes(4, "little")
+        assert reader.take(offset_length + arena.name.encode()) == b"x" * 100 and arena.in_use == 0
+    finally:
+        reader.close()
+        arena.close()
+        foreign.close()
+        foreign.unlink()
+
+
+SHM_CHILD = """
+import asyncio, sys
+import numpy as np
+from bundle.core import Socket
+
+async def main():
+    async with Socket.pull().connect(sys.argv[1]).shared_memory(threshold=1024) as pull:
+        for _ in range(3):
+            array = await pull.recv_array()
+            print(float(array.sum()), flush=True)
+
+asyncio.run(main())
+"""
+
+
+@pytest.mark.skipif(bundle.core.platform_info.is_windows, reason="uses an IPC endpoint")
+async def test_shared_memory_between_processes(tmp_path):
+    np = pytest.importorskip("numpy")
+    endpoint = resolve_endpoint("ipc", tmp_path, 0)
+    array = np.arange(1 << 16, dtype=np.float64)
+
+    async with bundle.core.Socket.push().bind(endpoint).shared_memory(threshold=1024, size=1 << 20) as push:
+        child = await asyncio.create_subprocess_exec(sys.executable, "-c", SHM_CHILD, endpoint, stdout=asyncio.subprocess.PIPE)
+        for _ in range(3):
+            await push.send_array(array)
+        stdout, _ = await asyncio.wait_for(child.communicate(), 60)
+        assert child.returncode == 0
+        assert [float(line) for line in stdout.split()] == [float(array.sum())] * 3
+        assert push._arena is not None and push._arena.in_use == 0
@@ -19,13 +19,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import operator
 import os
+import threading
+import time
 from typing import Any, Generator
 
 import pytest
 
-from bundle.core import tracer
+from bundle.core import Entity, logger, tracer
 
 # --- Helper functions for testing ---
 
@@ -313,3 +318,236 @@ async def test_async_decorator_stacklevel(list_handler: ListHandler, file_name:
     record = list_handler.records[-1]
     # Expect the external caller to be this test function.
     assert_log_correct(record, file_name, "test_async_decorator_stacklevel")
+
+
+# --- Execution Policy Tests ---
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, inline",
+    [
+        (tracer.ExecutionPolicy.INLINE, True),
+        (tracer.ExecutionPolicy.IO_POOL, False),
+        (tracer.ExecutionPolicy.CPU_POOL, False),
+    ],
+)
+async def test_async_call_policy_thread(policy: tracer.ExecutionPolicy, inline: bool):
+    before = tracer.executor.stats()[policy.value]
+    thread_name = await tracer.Async.call_raise(current_thread_name, policy=policy)
+    assert (thread_name == threading.current_thread().name) is inline
+    if not inline:
+        assert thread_name.startswith(f"bundle-{policy.value}")
+    assert tracer.executor.stats()[policy.value] == before + 1
+
+
+@pytest.mark.asyncio
+async def test_async_call_process_pool():
+    result = await tracer.Async.call_raise(operator.add, 2, 3, policy=tracer.ExecutionPolicy.PROCESS_POOL)
+    assert result == 5
+
+
+@pytest.mark.asyncio
+async def test_async_call_auto_policy():
+    assert tracer.executor.resolve(json.dumps) is tracer.ExecutionPolicy.INLINE
+    assert tracer.executor.resolve(current_thread_name) is tracer.ExecutionPolicy.IO_POOL
+
+    class Cheap:
+        def value(self) -> str:
+            return current_thread_name()
+
+    tracer.executor.mark_inline(Cheap.value)
+    assert tracer.executor.resolve(Cheap().value) is tracer.ExecutionPolicy.INLINE
+    assert await tracer.Async.call_raise(Cheap().value) == threading.current_thread().name
+
+
+@tracer.Async.decorator.call_raise(policy=tracer.ExecutionPolicy.INLINE)
+def decorated_inline_sync() -> str:
+    return current_thread_name()
+
+
+@pytest.mark.asyncio
+async def test_async_decorator_policy():
+    assert await decorated_inline_sync() == threading.current_thread().name
+
+
+def test_executor_configure_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        tracer.executor.configure(io_workers=0)
+
+
+# --- Metrics Tests ---
+
+
+@pytest.fixture
+def tracer_metrics() -> Generator[Any, Any, None]:
+    tracer.metrics.reset()
+    tracer.metrics.enable()
+    yield tracer.metrics
+    tracer.metrics.disable()
+    tracer.metrics.reset()
+
+
+def test_metrics_bucket_bounds():
+    for duration_ns in (0, 1_023, 1_024, 1_500, 65_536, 3_000_000, 2**45):
+        index = tracer.metrics.bucket_index(duration_ns)
+        assert duration_ns < tracer.metrics.bucket_upper_bound(index)
+        if index > 0:
+            assert duration_ns >= tracer.metrics.bucket_upper_bound(index - 1)
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_calls_and_errors(tracer_metrics):
+    for _ in range(10):
+        tracer.Sync.call(sync_success, 1, 2)
+    tracer.Sync.call(sync_fail, 1, 2)
+    await tracer.Async.call(async_success, 1, 2)
+    await tracer.Async.call(async_fail, 1, 2)
+    await asyncio.gather(*(asyncio.to_thread(tracer.Sync.call, sync_success, 1, 2) for _ in range(5)))
+
+    snapshot = tracer_metrics.snapshot()
+    sync_metrics = snapshot[tracer_metrics.qualified_name(sync_success)]
+    assert sync_metrics.calls == 15
+    assert sync_metrics.errors == 0
+    assert 0 < sync_metrics.p50_ns <= sync_metrics.p99_ns <= sync_metrics.max_ns
+    assert snapshot[tracer_metrics.qualified_name(sync_fail)].errors == 1
+    assert snapshot[tracer_metrics.qualified_name(async_success)].calls == 1
+    assert snapshot[tracer_metrics.qualified_name(async_fail)].errors == 1
+
+
+def test_metrics_disabled_records_nothing():
+    tracer.metrics.reset()
+    tracer.Sync.call(sync_success, 1, 2)
+    assert tracer.metrics.snapshot() == {}
+
+
+def test_metrics_prometheus_text(tracer_metrics):
+    tracer.Sync.call(sync_success, 1, 2)
+    text = tracer_metrics.prometheus_text()
+    name = tracer_metrics.qualified_name(sync_success)
+    assert f'bundle_tracer_calls_total{{callable="{name}"}} 1' in text
+    assert f'bundle_tracer_latency_seconds_bucket{{callable="{name}",le="+Inf"}} 1' in text
+    assert "# TYPE bundle_tracer_latency_seconds histogram" in text
+
+
+# --- Sampling Tests ---
+
+
+@pytest.fixture
+def tracer_sampling() -> Generator[Any, Any, None]:
+    tracer.sampling.reset()
+    yield tracer.sampling
+    tracer.sampling.reset()
+
+
+def success_records(handler: ListHandler) -> list[logging.LogRecord]:
+    return [record for record in handler.records if "suppressed" not in record.getMessage()]
+
+
+def test_sampling_every_n(list_handler: ListHandler, tracer_sampling):
+    tracer_sampling.set_policy(sync_success, tracer.SamplingPolicy(every_n=10))
+    for _ in range(25):
+        tracer.Sync.call(sync_success, 1, 2)
+    assert len(success_records(list_handler)) == 3
+
+
+def test_sampling_max_per_second(list_handler: ListHandler, tracer_sampling):
+    tracer_sampling.set_default(tracer.SamplingPolicy(max_per_second=5))
+    for _ in range(50):
+        tracer.Sync.call(sync_success, 1, 2)
+    assert 5 <= len(success_records(list_handler)) <= 10
+
+
+def test_sampling_slow_calls_always_logged(list_handler: ListHandler, tracer_sampling):
+    tracer_sampling.set_default(tracer.SamplingPolicy(max_per_second=0, slow_threshold_ns=0))
+    for _ in range(5):
+        tracer.Sync.call(sync_success, 1, 2)
+    assert len(success_records(list_handler)) == 5
+
+
+def test_sampling_exceptions_not_sampled(tracer_sampling):
+    tracer_sampling.set_default(tracer.SamplingPolicy(max_per_second=0))
+    result, exc = tracer.Sync.call(sync_fail, 1, 2)
+    assert result is None
+    assert isinstance(exc, ValueError)
+
+
+def test_sampling_summary(list_handler: ListHandler, tracer_sampling, file_name: str):
+    tracer_sampling.set_default(tracer.SamplingPolicy(max_per_second=0, summary_interval=0.05))
+    for _ in range(20):
+        tracer.Sync.call(sync_success, 1, 2)
+    time.sleep(0.06)
+    tracer.Sync.call(sync_success, 1, 2)
+    summaries = [record for record in list_handler.records if "suppressed" in record.getMessage()]
+    assert len(summaries) == 1
+    assert "suppressed 21 calls" in summaries[0].getMessage()
+    assert_log_correct(summaries[0], file_name, "test_sampling_summary")
+
+
+def test_sampling_threads_count_every_call(list_handler: ListHandler, tracer_sampling):
+    tracer_sampling.set_policy(sync_success, tracer.SamplingPolicy(every_n=10, summary_interval=3600))
+
+    def calls() -> None:
+        for _ in range(1000):
+            tracer.Sync.call(sync_success, 1, 2)
+
+    threads = [threading.Thread(target=calls) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(success_records(list_handler)) == 800
+    tracer_sampling.flush()
+    (summary,) = [record.getMessage() for record in list_handler.records if "suppressed" in record.getMessage()]
+    assert "suppressed 7,200 calls" in summary
+
+
+def test_sampling_quiet_callable_summary(list_handler: ListHandler, tracer_sampling, monkeypatch):
+    monkeypatch.setattr(tracer_sampling, "SUMMARY_CHECK_INTERVAL", 0.05)
+    tracer_sampling.set_default(tracer.SamplingPolicy(max_per_second=0, summary_interval=0.05))
+    for _ in range(5):
+        tracer.Sync.call(sync_success, 1, 2)
+    # No later call of the callable: the background check writes its summary
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline and not any("suppressed" in record.getMessage() for record in list_handler.records):
+        time.sleep(0.05)
+    summaries = [record.getMessage() for record in list_handler.records if "suppressed" in record.getMessage()]
+    assert len(summaries) == 1 and "suppressed 5 calls" in summaries[0]
+
+
+def test_sampling_decorator(list_handler: ListHandler, tracer_sampling):
+    @tracer.Sync.decorator.call_raise
+    @tracer.sampling.sample(every_n=100)
+    def sampled() -> int:
+        return 1
+
+    for _ in range(150):
+        sampled()
+    assert len(success_records(list_handler)) == 2
+
+
+def test_flight_recorder_captures_skipped_successes(tracer_sampling):
+    # Production setup: INFO level, DEBUG context kept by the recorder only
+    entity_log = logger.get_logger("bundle.core.entity")
+    levels = tracer.log.level, entity_log.level
+    tracer.log.setLevel(logging.INFO)
+    entity_log.setLevel(logging.INFO)
+    recorder = logger.install_flight_recorder("bundle.core", capacity=100)
+    try:
+        tracer_sampling.set_default(tracer.SamplingPolicy(every_n=100))
+        for _ in range(3):
+            tracer.Sync.call(sync_success, 1, 2)
+        entity = Entity(name="recorded")
+        del entity
+        messages = [(record.name, record.getMessage()) for record in recorder.drain()]
+    finally:
+        logger.uninstall_flight_recorder("bundle.core")
+        tracer.log.setLevel(levels[0])
+        entity_log.setLevel(levels[1])
+    assert sum(name == tracer.log.name and "sync_success" in message for name, message in messages) == 3
+    lifecycle = [message for name, message in messages if name == entity_log.name and "[recorded]" in message]
+    assert len(lifecycle) == 2 and "age=" in lifecycle[1]
@@ -21,7 +21,11 @@ from pathlib import Path
 
 import pytest
 
+import bundle
+from bundle.core import Process, ProcessError, ResourceCollector
+from bundle.core.process import usage_h5_option
 from bundle.perf_report import ProfileExtractor, ProfileStorage
+from bundle.perf_report.storage import ProcessUsageRecord, ProcessUsageStorage
 
 VERSION = "0.1.dev1"
 PLATFORM = "linux-x86_64-CPython3.12.8"
@@ -140,3 +144,49 @@ class TestProfileStorage:
             assert row.counts == rec.counts
             assert row.total_ns == rec.total_ns
             assert row.mean_ns == rec.mean_ns
+
+
+class TestProcessUsageStorage:
+    RECORDS = [
+        ProcessUsageRecord("cmake.build", "cmake --build build", 0, 12.5, 40.0, 3.5, 512_000, None),
+        ProcessUsageRecord("pkg-config", "pkg-config --cflags zlib", 1, 0.01, None, None, None, 9),
+    ]
+
+    def test_save_and_load_session(self, h5_path):
+        storage = ProcessUsageStorage(h5_path)
+        storage.save("pybind.build", self.RECORDS, machine_id="m1", bundle_version=VERSION, platform_id=PLATFORM)
+
+        assert storage.list_sessions(VERSION, PLATFORM) == ["pybind.build"]
+        assert storage.load_session(VERSION, PLATFORM, "pybind.build") == self.RECORDS
+        assert storage.load_meta(VERSION, PLATFORM)["machine_id"] == "m1"
+
+    def test_sessions_survive_profile_save(self, csv_dir, h5_path):
+        ProcessUsageStorage(h5_path).save("docs.build", self.RECORDS, "m1", VERSION, PLATFORM)
+        ProfileStorage(h5_path).save(ProfileExtractor.extract_all(csv_dir), "m1", VERSION, PLATFORM)
+        assert ProcessUsageStorage(h5_path).list_sessions(VERSION, PLATFORM) == ["docs.build"]
+
+    @pytest.mark.asyncio
+    async def test_from_collector(self, h5_path):
+        with ResourceCollector(name="tracy.build") as collector:
+            await Process(name="Step")("echo step")
+        storage = ProcessUsageStorage.from_collector(collector, h5_path, "tracy.build", bundle_version=VERSION)
+        platform_id = storage.list_platforms(VERSION)[0]
+        (record,) = storage.load_session(VERSION, platform_id, "tracy.build")
+        assert record.name == "Step" and record.command == "echo step" and record.wall_time > 0
+
+    @pytest.mark.asyncio
+    async def test_usage_h5_option(self, h5_path):
+        @usage_h5_option("docs.build")
+        async def build(fail: bool) -> None:
+            await Process(name="Step")("exit 1" if fail else "true")
+
+        assert [param.name for param in build.__click_params__] == ["usage_h5"]
+        await build(False)
+        assert not h5_path.exists()
+
+        # The session is saved even when the command fails
+        with pytest.raises(ProcessError):
+            await build(True, usage_h5=str(h5_path))
+        storage = ProcessUsageStorage(h5_path)
+        (record,) = storage.load_session(bundle.version, storage.list_platforms(bundle.version)[0], "docs.build")
+        assert record.returncode == 1